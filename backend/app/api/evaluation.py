@@ -1,35 +1,222 @@
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 from app.models.schemas import (
     EvaluationRequest,
-    EvaluationResponse
+    EvaluationResponse,
+    EvaluationBatchRequest,
+    EvaluationBatchResponse,
+    FileEvaluationResponse,
+    EvaluationSessionRequest,
+    EvaluationSessionEditRequest,
+    EvaluationSessionResponse
 )
-from app.services.evaluation_service import EvaluationService
+from app.services.evaluation_service import MIN_SECTION_SIZE, SECTION_SIZE, EvaluationService
+from app.services.readability_session_service import (
+    ReadabilitySessionService,
+    SessionNotFoundError,
+    SessionVersionConflictError
+)
+from app.services.registry import registry
+from app.utils.executors import get_lane, run_cpu_bound
 
 router = APIRouter()
 
-# Initialize service
-evaluation_service = EvaluationService()
+# Register service (dibuat saat warm-up atau request pertama)
+evaluation_service = registry.register("evaluation", EvaluationService)
+session_service = registry.register(
+    "readability_sessions",
+    lambda: ReadabilitySessionService(evaluation_service.instance())
+)
+evaluate_lane = get_lane("evaluate")
+evaluate_batch_lane = get_lane("evaluate_batch", max_concurrency=2, max_queue=8)
+evaluate_file_lane = get_lane("evaluate_file", max_concurrency=2, max_queue=8)
+evaluate_session_lane = get_lane("evaluate_sessions")
+
+# Ukuran potongan saat membaca file upload
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
 @router.post("/readability", response_model=EvaluationResponse)
-async def evaluate_readability(request: EvaluationRequest):
+async def evaluate_readability(request: EvaluationRequest, _slot=Depends(evaluate_lane.slot)):
     """
-    Mengevaluasi tingkat keterbacaan teks menggunakan berbagai metrik
+    Mengevaluasi tingkat keterbacaan teks menggunakan berbagai metrik.
+    Dengan `include_sentences`, `window_size`, atau `windows`, respons juga berisi
+    skor kesulitan setiap kalimat dan jendela kalimat.
+    Teks hasil simplify bisa dievaluasi lewat `handle` tanpa mengirim ulang teksnya.
     """
+    service = await evaluation_service.get()
+    
+    text = request.text
+    if text is None:
+        if not request.handle:
+            raise HTTPException(status_code=400, detail="Either text or handle is required")
+        text = service.resolve_handle(request.handle)
+        if text is None:
+            # Teks panjang hanya disimpan statistiknya: skor dokumen tetap bisa dihitung
+            sentence_level = request.include_sentences or request.window_size or request.windows
+            result = None if sentence_level else service.evaluate_handle(request.handle, request.metrics)
+            if result is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Readability handle '{request.handle}' not found or expired; send the text instead"
+                )
+            return EvaluationResponse(text=None, **result)
+    
     try:
-        result = await evaluation_service.evaluate_text(
-            text=request.text,
+        if request.include_sentences or request.window_size or request.windows:
+            # Heatmap per kalimat dan skor jendela kalimat
+            result = await service.evaluate_sentences(
+                text=text,
+                metrics=request.metrics,
+                difficulty_metric=request.difficulty_metric,
+                window_size=request.window_size,
+                windows=request.windows
+            )
+        else:
+            result = await service.evaluate_text(
+                text=text,
+                metrics=request.metrics
+            )
+        
+        return EvaluationResponse(text=text, **result)
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error evaluating text: {str(e)}")
+
+@router.post("/readability/batch", response_model=EvaluationBatchResponse)
+async def evaluate_readability_batch(request: EvaluationBatchRequest, _slot=Depends(evaluate_batch_lane.slot)):
+    """
+    Mengevaluasi banyak teks sekaligus (misalnya seluruh arsip dokumen).
+    Metrik dihitung secara vektor untuk semua dokumen dan dilengkapi ringkasan korpus.
+    """
+    service = await evaluation_service.get()
+    
+    try:
+        result = await service.evaluate_batch(
+            texts=request.texts,
             metrics=request.metrics
         )
+        return EvaluationBatchResponse(**result)
         
-        return EvaluationResponse(
-            text=request.text,
-            metrics=result["metrics"],
-            recommendations=result["recommendations"],
-            grade_level=result["grade_level"]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error evaluating texts: {str(e)}")
+
+@router.post("/readability/file", response_model=FileEvaluationResponse)
+async def evaluate_readability_file(
+    file: UploadFile = File(...),
+    metrics: Optional[str] = Form(None),
+    section_size: int = Form(SECTION_SIZE, ge=0),
+    _slot=Depends(evaluate_file_lane.slot)
+):
+    """
+    Mengevaluasi file teks (UTF-8) yang di-upload.
+    File dibaca per potongan sehingga dokumen besar tidak perlu dimuat utuh;
+    `metrics` dipisah koma, `section_size` dalam karakter (0 = tanpa bagian,
+    selain itu minimal MIN_SECTION_SIZE).
+    """
+    if 0 < section_size < MIN_SECTION_SIZE:
+        raise HTTPException(
+            status_code=422,
+            detail=f"section_size must be 0 or at least {MIN_SECTION_SIZE}"
+        )
+    service = await evaluation_service.get()
+    
+    async def read_chunks():
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    
+    try:
+        result = await service.evaluate_stream(
+            read_chunks(),
+            metrics=[m.strip() for m in metrics.split(",") if m.strip()] if metrics else None,
+            section_size=section_size
         )
+        return FileEvaluationResponse(filename=file.filename, **result)
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error evaluating text: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error evaluating file: {str(e)}")
+    finally:
+        await file.close()
+
+@router.post("/sessions", response_model=EvaluationSessionResponse)
+async def create_evaluation_session(request: EvaluationSessionRequest, _slot=Depends(evaluate_lane.slot)):
+    """
+    Membuat sesi evaluasi untuk editor.
+    Setelah itu klien cukup mengirim delta edit ke /sessions/{session_id}/edits.
+    """
+    service = await session_service.get()
+    
+    try:
+        result = await service.create_session(request.text, request.metrics)
+        return EvaluationSessionResponse(**result)
+    except ValueError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating session: {str(e)}")
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """Statistik cache readability bersama (dipakai juga oleh text simplification)"""
+    service = await evaluation_service.get()
+    return service.readability_cache.get_stats()
+
+@router.get("/sessions/stats")
+async def get_session_stats():
+    """Jumlah sesi aktif, pemakaian memori, dan sesi yang kedaluwarsa/dikeluarkan"""
+    service = await session_service.get()
+    return service.get_stats()
+
+@router.post("/sessions/{session_id}/edits", response_model=EvaluationSessionResponse)
+async def edit_evaluation_session(
+    session_id: str,
+    request: EvaluationSessionEditRequest,
+    _slot=Depends(evaluate_session_lane.slot)
+):
+    """
+    Menerapkan delta edit (offset, delete_count, insert_text) secara berurutan.
+    Hanya kalimat yang tersentuh yang dihitung ulang; edit tetap dijalankan di CPU pool
+    karena kalimat tanpa tanda akhir bisa sepanjang dokumen.
+    """
+    service = await session_service.get()
+    
+    try:
+        result = await run_cpu_bound(
+            service.apply_edits,
+            session_id,
+            [edit.model_dump() for edit in request.edits],
+            base_version=request.base_version
+        )
+        return EvaluationSessionResponse(**result)
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except SessionVersionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/sessions/{session_id}", response_model=EvaluationSessionResponse)
+async def get_evaluation_session(session_id: str, include_text: bool = False):
+    service = await session_service.get()
+    
+    try:
+        # Menunggu lock sesi (edit yang sedang berjalan) di CPU pool, bukan di event loop
+        return EvaluationSessionResponse(**await run_cpu_bound(service.get_session, session_id, include_text))
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@router.delete("/sessions/{session_id}")
+async def close_evaluation_session(session_id: str):
+    service = await session_service.get()
+    
+    try:
+        service.close_session(session_id)
+        return {"status": "closed", "session_id": session_id}
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
 @router.get("/health")
 async def health_check():
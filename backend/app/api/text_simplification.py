@@ -1,30 +1,54 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from app.models.schemas import (
     TextSimplificationRequest, 
     TextSimplificationResponse,
+    TextSimplificationBatchRequest,
+    TextSimplificationBatchItem,
+    SimplifiedSentenceEvent,
+    TextSimplificationStreamSummary,
     StepByStepRequest,
     StepByStepResponse
 )
 from app.services.text_simplification_service import TextSimplificationService
+from app.services.batch_simplification_service import BatchSimplificationService
 from app.services.step_by_step_service import StepByStepService
+from app.services.registry import registry
+from app.utils.executors import get_lane
+import json
 import time
 
 router = APIRouter()
 
-# Initialize services
-simplification_service = TextSimplificationService()
-step_by_step_service = StepByStepService()
+# Register services (dibuat saat warm-up atau request pertama)
+simplification_service = registry.register("text_simplification", TextSimplificationService)
+batch_simplification_service = registry.register(
+    "batch_simplification",
+    lambda: BatchSimplificationService(simplification_service.instance())
+)
+step_by_step_service = registry.register("step_by_step", StepByStepService)
+
+# Batas concurrency dan antrian per endpoint
+simplify_lane = get_lane("simplify")
+simplify_batch_lane = get_lane("simplify_batch", max_concurrency=2, max_queue=8)
+steps_lane = get_lane("steps")
+
+@router.on_event("shutdown")
+def shutdown_batch_workers():
+    if batch_simplification_service.is_ready:
+        batch_simplification_service.instance().shutdown()
 
 @router.post("/text", response_model=TextSimplificationResponse)
-async def simplify_text(request: TextSimplificationRequest):
+async def simplify_text(request: TextSimplificationRequest, _slot=Depends(simplify_lane.slot)):
     """
     Menyederhanakan teks kompleks menjadi bahasa yang lebih mudah dipahami
     """
+    start_time = time.time()
+    service = await simplification_service.get()
+    
     try:
-        start_time = time.time()
-        
         # Process text simplification
-        result = await simplification_service.simplify_text(
+        result = await service.simplify_text(
             text=request.text,
             target_level=request.target_level,
             language=request.language,
@@ -40,19 +64,98 @@ async def simplify_text(request: TextSimplificationRequest):
             readability_score=result["readability_score"],
             simplification_level=request.target_level,
             word_count_reduction=result["word_count_reduction"],
-            processing_time=processing_time
+            processing_time=processing_time,
+            sentences_reused=result.get("sentences_reused", 0),
+            sentences_recomputed=result.get("sentences_recomputed", 0),
+            readability_handle=result.get("readability_handle")
         )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error simplifying text: {str(e)}")
 
+@router.post("/text/stream")
+async def simplify_text_stream(request: TextSimplificationRequest, _slot=Depends(simplify_lane.slot)):
+    """
+    Menyederhanakan teks per kalimat dan mengirim hasilnya sebagai Server-Sent Events.
+    Event `sentence` dikirim untuk setiap kalimat, event `done` berisi ringkasan.
+    """
+    service = await simplification_service.get()
+    
+    async def stream_events():
+        try:
+            async for event in service.simplify_text_stream(
+                text=request.text,
+                target_level=request.target_level,
+                language=request.language,
+                max_length=request.max_length
+            ):
+                if event["event"] == "sentence":
+                    payload = SimplifiedSentenceEvent(**event)
+                else:
+                    payload = TextSimplificationStreamSummary(
+                        simplification_level=request.target_level,
+                        **event
+                    )
+                yield f"event: {event['event']}\ndata: {payload.model_dump_json()}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'detail': f'Error simplifying text: {str(e)}'})}\n\n"
+
+    return StreamingResponse(
+        stream_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/text/batch")
+async def simplify_text_batch(
+    request: TextSimplificationBatchRequest,
+    _slot=Depends(simplify_batch_lane.slot)
+):
+    """
+    Menyederhanakan banyak dokumen sekaligus.
+    Hasil dikirim sebagai NDJSON sesuai urutan selesai, ditandai dengan index input.
+    """
+    service = await batch_simplification_service.get()
+    
+    async def stream_results():
+        async for item in service.simplify_batch(request.documents):
+            if item["status"] == "ok":
+                document = item["request"]
+                result = item["result"]
+                line = TextSimplificationBatchItem(
+                    index=item["index"],
+                    status="ok",
+                    result=TextSimplificationResponse(
+                        original_text=document.text,
+                        simplified_text=result["simplified_text"],
+                        readability_score=result["readability_score"],
+                        simplification_level=document.target_level,
+                        word_count_reduction=result["word_count_reduction"],
+                        processing_time=result["processing_time"],
+                        sentences_reused=result.get("sentences_reused", 0),
+                        sentences_recomputed=result.get("sentences_recomputed", 0),
+                        readability_handle=result.get("readability_handle")
+                    )
+                )
+            else:
+                line = TextSimplificationBatchItem(
+                    index=item["index"],
+                    status="error",
+                    error=item["error"]
+                )
+            yield line.model_dump_json() + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
 @router.post("/steps", response_model=StepByStepResponse)
-async def create_step_by_step_guide(request: StepByStepRequest):
+async def create_step_by_step_guide(request: StepByStepRequest, _slot=Depends(steps_lane.slot)):
     """
     Membuat panduan step-by-step dari instruksi kompleks
     """
+    service = await step_by_step_service.get()
+    
     try:
-        result = await step_by_step_service.create_guide(
+        result = await service.create_guide(
             instruction=request.instruction,
             context=request.context,
             user_level=request.user_level
@@ -68,6 +171,22 @@ async def create_step_by_step_guide(request: StepByStepRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating step-by-step guide: {str(e)}")
 
+@router.get("/inference/stats")
+async def inference_stats():
+    """
+    Statistik backend inference: ukuran batch, latency per batch, dan throughput
+    """
+    service = await simplification_service.get()
+    return service.get_inference_stats()
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """
+    Statistik cache hasil penyederhanaan: hit, miss, dan eviction
+    """
+    service = await simplification_service.get()
+    return service.get_cache_stats()
+
 @router.get("/health")
 async def health_check():
     return {"status": "text-simplification service healthy"}
@@ -1,23 +1,36 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 from app.models.schemas import (
+    KnowledgeIngestionResponse,
     TutorQuestionRequest,
-    TutorQuestionResponse
+    TutorQuestionResponse,
+    TutorSearchRequest,
+    TutorSearchResponse
 )
 from app.services.tutor_service import TutorService
+from app.services.registry import registry
+from app.utils.executors import get_lane, run_cpu_bound
+from app.utils.knowledge_ingest import IngestionBusyError
+import os
+import tempfile
 import time
 
 router = APIRouter()
 
-# Initialize service
-tutor_service = TutorService()
+# Register service (dibuat saat warm-up atau request pertama)
+tutor_service = registry.register("tutor", TutorService)
+tutor_lane = get_lane("tutor")
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 @router.post("/ask", response_model=TutorQuestionResponse)
-async def ask_tutor(request: TutorQuestionRequest):
+async def ask_tutor(request: TutorQuestionRequest, _slot=Depends(tutor_lane.slot)):
     """
     Bertanya kepada AI tutor untuk mendapatkan penjelasan sederhana
     """
+    service = await tutor_service.get()
+    
     try:
-        result = await tutor_service.answer_question(
+        result = await service.answer_question(
             question=request.question,
             context=request.context,
             user_level=request.user_level
@@ -35,6 +48,79 @@ async def ask_tutor(request: TutorQuestionRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error answering question: {str(e)}")
 
+@router.post("/search", response_model=TutorSearchResponse)
+async def search_concepts(request: TutorSearchRequest, _slot=Depends(tutor_lane.slot)):
+    """
+    Mencari konsep yang paling relevan dengan pertanyaan (BM25 atas nama, definisi,
+    penjelasan, dan konsep terkait) beserta skornya
+    """
+    service = await tutor_service.get()
+    
+    try:
+        results = await run_cpu_bound(service.search_concepts, request.question, max(1, min(request.top_k, 50)))
+        return TutorSearchResponse(question=request.question, results=results)
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching concepts: {str(e)}")
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """
+    Statistik cache tutor: pertanyaan kanonik -> konsep, dan jawaban per (konsep, user_level)
+    """
+    service = await tutor_service.get()
+    return service.get_cache_stats()
+
+@router.get("/knowledge/stats")
+async def knowledge_stats():
+    """
+    Snapshot knowledge base yang sedang dipakai worker ini dan jumlah konsep terindeks
+    """
+    service = await tutor_service.get()
+    return service.get_knowledge_stats()
+
+@router.post("/knowledge/ingest", response_model=KnowledgeIngestionResponse, status_code=202)
+async def ingest_knowledge(file: UploadFile = File(...), merge: bool = Form(False)):
+    """
+    Upload glosarium JSONL (satu konsep per baris) untuk menggantikan knowledge base.
+    File disimpan ke disk per potongan lalu diproses di latar belakang; knowledge base
+    baru dipakai setelah semua indeks selesai dibangun. `merge=true` mempertahankan
+    konsep yang sudah ada. Pantau progress di /knowledge/ingest/{job_id}.
+    """
+    service = await tutor_service.get()
+    
+    fd, path = tempfile.mkstemp(prefix="knowledge-", suffix=".jsonl")
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as spool:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                spool.write(chunk)
+                size += len(chunk)
+        job = service.start_ingestion(path, size, merge=merge, name=file.filename, remove_source=True)
+        return KnowledgeIngestionResponse(**job.to_dict())
+        
+    except IngestionBusyError as e:
+        os.remove(path)
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        if os.path.exists(path):
+            os.remove(path)
+        raise HTTPException(status_code=500, detail=f"Error starting ingestion: {str(e)}")
+    finally:
+        await file.close()
+
+@router.get("/knowledge/ingest/{job_id}", response_model=KnowledgeIngestionResponse)
+async def get_ingestion_job(job_id: str):
+    """Progress dan throughput ingestion"""
+    service = await tutor_service.get()
+    job = service.get_ingestion_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Ingestion job {job_id} not found")
+    return KnowledgeIngestionResponse(**job.to_dict())
+
 @router.get("/health")
 async def health_check():
     return {"status": "tutor service healthy"}
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, field_validator
+from typing import List, Optional, Dict, Any, Tuple
 
 class TextSimplificationRequest(BaseModel):
     text: str
@@ -15,6 +15,36 @@ class TextSimplificationResponse(BaseModel):
     simplification_level: str
     word_count_reduction: int
     processing_time: float
+    sentences_reused: int = 0  # Sentences served from the sentence cache
+    sentences_recomputed: int = 0
+    readability_handle: Optional[str] = None  # Pass as `handle` to /api/evaluate/readability
+
+class TextSimplificationBatchRequest(BaseModel):
+    documents: List[Dict[str, Any]]  # Each document follows TextSimplificationRequest
+
+class TextSimplificationBatchItem(BaseModel):
+    index: int
+    status: str  # ok, error
+    result: Optional[TextSimplificationResponse] = None
+    error: Optional[str] = None
+
+class SimplifiedSentenceEvent(BaseModel):
+    index: int
+    original_sentence: str
+    simplified_sentence: str
+    word_count_reduction: int  # Running total up to this sentence
+    readability_score: Dict[str, float]  # Readability of the output so far
+    elapsed_time: float
+    time_to_first_sentence: float
+
+class TextSimplificationStreamSummary(BaseModel):
+    simplified_text: str
+    readability_score: Dict[str, float]
+    simplification_level: str
+    word_count_reduction: int
+    sentence_count: int
+    time_to_first_sentence: float
+    processing_time: float
 
 class StepByStepRequest(BaseModel):
     instruction: str
@@ -40,12 +70,151 @@ class TutorQuestionResponse(BaseModel):
     related_concepts: List[str]
     confidence_score: float
 
+class TutorSearchRequest(BaseModel):
+    question: str
+    top_k: int = 5
+
+class TutorSearchResult(BaseModel):
+    concept: str
+    score: float  # BM25 score
+    confidence: float  # Score relative to the best possible score for the question
+    definition: str
+
+class TutorSearchResponse(BaseModel):
+    question: str
+    results: List[TutorSearchResult]
+
+class KnowledgeIngestionResponse(BaseModel):
+    job_id: str
+    source: str
+    merge: bool  # Existing concepts are kept (file entries overwrite them)
+    phase: str  # queued, loading, indexing, swapping, done, failed
+    lines_read: int
+    accepted: int
+    rejected: int
+    concepts: int  # Concepts in the new knowledge base
+    bytes_read: int
+    size_bytes: int
+    progress: Optional[float] = None  # Fraction of the file read
+    elapsed_seconds: float
+    lines_per_second: float
+    mb_per_second: float
+    errors: List[str]  # First validation errors, "line N: message"
+    error: Optional[str] = None
+
 class EvaluationRequest(BaseModel):
-    text: str
+    text: Optional[str] = None
+    handle: Optional[str] = None  # readability_handle from a previous simplify/evaluate response
     metrics: Optional[List[str]] = ["flesch_kincaid", "dale_chall", "smog"]
+    include_sentences: bool = False  # Per-sentence difficulty heatmap
+    difficulty_metric: str = "dale_chall"
+    window_size: Optional[int] = None  # Sliding windows of N consecutive sentences
+    windows: Optional[List[Tuple[int, int]]] = None  # Sentence index ranges [first, last)
+
+    @field_validator("windows")
+    @classmethod
+    def check_windows(cls, windows):
+        for first, last in windows or []:
+            if first < 0 or first >= last:
+                raise ValueError(f"Sentence window [{first}, {last}) must satisfy 0 <= first < last")
+        return windows
+
+class SentenceDifficulty(BaseModel):
+    index: int
+    start: int  # Character offsets in the text
+    end: int
+    word_count: int
+    difficulty: float
+
+class SentenceWindowDifficulty(BaseModel):
+    first: int  # Sentence index range [first, last)
+    last: int
+    start: int
+    end: int
+    word_count: int
+    difficulty: float
 
 class EvaluationResponse(BaseModel):
-    text: str
+    text: Optional[str] = None  # None when evaluated by handle and the text was too long to be cached
+    metrics: Dict[str, float]
+    recommendations: List[str]
+    grade_level: str
+    handle: Optional[str] = None  # Reference to the cached text and statistics
+    difficulty_metric: Optional[str] = None
+    sentences: Optional[List[SentenceDifficulty]] = None
+    windows: Optional[List[SentenceWindowDifficulty]] = None
+
+class EvaluationBatchRequest(BaseModel):
+    texts: List[str]
+    metrics: Optional[List[str]] = ["flesch_kincaid", "dale_chall", "smog"]
+
+class EvaluationBatchItem(BaseModel):
+    index: int
+    metrics: Dict[str, float]
+    grade_level: str
+
+class MetricSummary(BaseModel):
+    mean: float
+    std: float
+    min: float
+    p25: float
+    median: float
+    p75: float
+    p95: float
+    max: float
+
+class EvaluationBatchSummary(BaseModel):
+    document_count: int
+    total_words: int
+    total_sentences: int
+    metrics: Dict[str, MetricSummary]
+    grade_levels: Dict[str, int]  # Number of documents per grade level
+
+class EvaluationBatchResponse(BaseModel):
+    documents: List[EvaluationBatchItem]
+    summary: EvaluationBatchSummary
+
+class EvaluationSection(BaseModel):
+    index: int
+    start: int  # Character offset in the decoded file
+    end: int
+    word_count: int
+    sentence_count: int
+    metrics: Dict[str, float]
+    grade_level: str
+
+class FileEvaluationResponse(BaseModel):
+    filename: Optional[str] = None
+    size_bytes: int
+    character_count: int
+    word_count: int
+    sentence_count: int
+    metrics: Dict[str, float]
+    recommendations: List[str]
+    grade_level: str
+    sections: List[EvaluationSection]
+
+class EvaluationSessionRequest(BaseModel):
+    text: str = ""
+    metrics: Optional[List[str]] = ["flesch_kincaid", "dale_chall", "smog"]
+
+class TextEdit(BaseModel):
+    offset: int  # Character offset in the current document
+    delete_count: int = 0
+    insert_text: str = ""
+
+class EvaluationSessionEditRequest(BaseModel):
+    edits: List[TextEdit]
+    base_version: Optional[int] = None  # Reject edits if the session has moved on
+
+class EvaluationSessionResponse(BaseModel):
+    session_id: str
+    version: int
+    length: int
+    word_count: int
+    sentence_count: int
     metrics: Dict[str, float]
     recommendations: List[str]
     grade_level: str
+    elapsed_ms: float
+    text: Optional[str] = None
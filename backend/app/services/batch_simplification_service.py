@@ -0,0 +1,141 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, AsyncIterator, List, Optional
+import asyncio
+import itertools
+import os
+import time
+
+from pydantic import ValidationError
+
+from app.models.schemas import TextSimplificationRequest
+from app.services.text_simplification_service import TextSimplificationService
+from app.utils.text_stats import COUNT_FIELDS, TextStats
+
+# Service milik setiap proses worker, dibuat sekali oleh initializer
+_worker_service: Optional[TextSimplificationService] = None
+
+
+def _init_worker():
+    global _worker_service
+    _worker_service = TextSimplificationService()
+
+
+def _simplify_in_worker(params: Dict[str, Any]) -> Dict[str, Any]:
+    start_time = time.time()
+    result = asyncio.run(_worker_service.simplify_text(**params))
+    result["processing_time"] = time.time() - start_time
+    # Cache readability worker tidak terlihat oleh proses server: statistik handle
+    # dikirim balik agar server bisa mendaftarkannya
+    handle = result.get("readability_handle")
+    stats = _worker_service.readability_cache.get_text_stats(handle) if handle else None
+    result["readability_counts"] = [getattr(stats, name) for name in COUNT_FIELDS] if stats else None
+    return result
+
+
+class BatchSimplificationService:
+    def __init__(
+        self,
+        simplification_service: TextSimplificationService,
+        max_workers: Optional[int] = None
+    ):
+        self.simplification_service = simplification_service
+        if max_workers is None:
+            max_workers = int(os.getenv("BATCH_MAX_WORKERS", os.cpu_count() or 1))
+        # 0 = jalankan di event loop tanpa process pool
+        self.max_workers = max(0, max_workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker
+            )
+        return self._executor
+
+    def _replace_broken_executor(self, executor: ProcessPoolExecutor):
+        """Matikan pool yang rusak; dokumen berikutnya memakai pool baru"""
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _register_readability(self, result: Dict[str, Any]):
+        """Daftarkan statistik handle dari worker di cache readability proses ini"""
+        counts = result.pop("readability_counts", None)
+        handle = result.get("readability_handle")
+        if not handle:
+            return
+        if counts is None:
+            # Handle tanpa statistik tidak akan bisa di-resolve di server
+            result["readability_handle"] = None
+            return
+        self.simplification_service.readability_cache.set_stats(
+            handle, result["simplified_text"], TextStats.from_counts(counts)
+        )
+
+    def shutdown(self):
+        """Hentikan process pool"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def simplify_batch(self, documents: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Menyederhanakan banyak dokumen secara paralel.
+        Hasil dikirim sesuai urutan selesai, masing-masing ditandai dengan index input.
+        """
+        pending = set()
+        queue = iter(enumerate(documents))
+        # Batasi jumlah dokumen yang sedang diproses agar memori tetap terkendali
+        in_flight = max(1, self.max_workers) * 2
+
+        for index, document in itertools.islice(queue, in_flight):
+            pending.add(asyncio.ensure_future(self._process_document(index, document)))
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+                    next_document = next(queue, None)
+                    if next_document is not None:
+                        pending.add(asyncio.ensure_future(self._process_document(*next_document)))
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _process_document(self, index: int, document: Dict[str, Any]) -> Dict[str, Any]:
+        """Proses satu dokumen; error hanya menggagalkan dokumen ini"""
+        try:
+            request = TextSimplificationRequest(**document)
+        except (TypeError, ValidationError) as e:
+            return {"index": index, "status": "error", "request": None, "error": f"Invalid document: {e}"}
+
+        params = {
+            "text": request.text,
+            "target_level": request.target_level,
+            "language": request.language,
+            "include_examples": request.include_examples,
+            "max_length": request.max_length
+        }
+
+        executor = None
+        try:
+            if self.max_workers > 0:
+                loop = asyncio.get_running_loop()
+                executor = self._get_executor()
+                result = await loop.run_in_executor(executor, _simplify_in_worker, params)
+                self._register_readability(result)
+            else:
+                start_time = time.time()
+                result = await self.simplification_service.simplify_text(**params)
+                result["processing_time"] = time.time() - start_time
+        except BrokenProcessPool as e:
+            # Worker mati; buat pool baru untuk dokumen berikutnya
+            self._replace_broken_executor(executor)
+            return {"index": index, "status": "error", "request": request, "error": str(e)}
+        except Exception as e:
+            return {"index": index, "status": "error", "request": request, "error": str(e)}
+
+        return {"index": index, "status": "ok", "request": request, "result": result}
@@ -1,126 +1,452 @@
-from typing import Dict, Any, List, Optional
-# import textstat
+from typing import Dict, Any, AsyncIterable, Callable, List, Optional, Tuple, Union
+from bisect import bisect_left
+import asyncio
+import codecs
+import os
 import re
+# import textstat
+
+import numpy as np
+
+from app.utils.executors import run_cpu_bound
+from app.utils.familiar_words import get_familiar_words
+from app.utils.readability_cache import ReadabilityCache, get_readability_cache
+from app.utils.syllables import count_syllables
+from app.utils.text_stats import (
+    AnalyzedDocument,
+    SentencePrefixSums,
+    TextStats,
+    TextStatsAccumulator,
+    TextStatsBatch,
+    compute_sentence_stats,
+    compute_text_stats
+)
+
+# Rumus metrik: fungsi dari TextStats (atau TextStatsBatch) ke skor.
+# Tulis dengan operasi NumPy (np.maximum, bukan max) agar bisa dihitung per korpus.
+MetricFormula = Callable[[Union[TextStats, TextStatsBatch]], Union[float, np.ndarray]]
+
+DEFAULT_METRICS = ["flesch_kincaid", "dale_chall", "smog"]
+
+# Batas atas skor Flesch-Kincaid untuk setiap jenjang
+GRADE_THRESHOLDS = [6, 9, 12]
+GRADE_LEVELS = [
+    "SD (Sekolah Dasar)",
+    "SMP (Sekolah Menengah Pertama)",
+    "SMA (Sekolah Menengah Atas)",
+    "Perguruan Tinggi"
+]
+
+# Proporsi kata tidak familiar di atas batas ini memicu rekomendasi kosakata
+UNFAMILIAR_WORD_THRESHOLD = float(os.getenv("UNFAMILIAR_WORD_THRESHOLD", 0.2))
+# Daftar kata familiar yang lebih kecil dari ini menganggap terlalu banyak kata biasa
+# sebagai kata sulit; rekomendasi kosakata tidak diberikan
+FAMILIAR_WORDS_MIN_SIZE = int(os.getenv("FAMILIAR_WORDS_MIN_SIZE", 2000))
+
+# Jumlah dokumen per tugas saat menghitung statistik batch di CPU pool
+BATCH_CHUNK_SIZE = int(os.getenv("EVALUATE_BATCH_CHUNK_SIZE", 500))
+
+# Metrik default untuk skor kesulitan per kalimat (heatmap)
+DIFFICULTY_METRIC = "dale_chall"
+
+NON_SPACE_PATTERN = re.compile(r"\S")
+
+# Ukuran minimal (karakter) satu bagian saat mengevaluasi file besar
+SECTION_SIZE = int(os.getenv("EVALUATE_SECTION_SIZE", 100_000))
+# Batas bawah section_size dari klien: jumlah bagian (dan memorinya) tetap sebanding
+# dengan ukuran file / MIN_SECTION_SIZE
+MIN_SECTION_SIZE = int(os.getenv("EVALUATE_MIN_SECTION_SIZE", 10_000))
 
 class EvaluationService:
     def __init__(self):
         # Simple metrics functions without external dependencies
-        self.metrics_functions = {
+        self.metrics_functions: Dict[str, MetricFormula] = {
             "flesch_kincaid": self._simple_flesch_kincaid,
             "flesch_reading_ease": self._simple_flesch_reading_ease,
-            "dale_chall": self._simple_dale_chall,
+            "dale_chall": self._dale_chall,
             "smog": self._simple_smog,
             "ari": self._simple_ari,
             "coleman_liau": self._simple_coleman_liau
         }
+        # Muat daftar kata familiar (mmap) saat service dibuat, bukan saat request pertama
+        self.familiar_words = get_familiar_words()
+        # Cache bersama dengan TextSimplificationService (kunci: hash teks + set metrik)
+        self.readability_cache = get_readability_cache()
+        # Naik setiap register_metric agar skor lama di cache tidak dipakai untuk rumus baru
+        self._metrics_version = 0
+    
+    def register_metric(self, name: str, formula: MetricFormula):
+        """
+        Daftarkan metrik baru sebagai rumus atas TextStats.
+        Metrik tambahan tidak menambah pemrosesan teks.
+        Rumus yang memakai operasi NumPy juga dipakai apa adanya di evaluate_batch.
+        """
+        self.metrics_functions[name] = formula
+        self._metrics_version += 1
     
-    def _simple_flesch_kincaid(self, text: str) -> float:
+    def _simple_flesch_kincaid(self, stats: TextStats) -> float:
         """Simple Flesch-Kincaid calculation"""
-        words = len(text.split())
-        sentences = len(re.split(r'[.!?]+', text))
-        avg_words_per_sentence = words / sentences if sentences > 0 else 0
-        return max(0, 0.39 * avg_words_per_sentence + 11.8)
+        return np.maximum(0, 0.39 * stats.avg_words_per_segment + 11.8)
     
-    def _simple_flesch_reading_ease(self, text: str) -> float:
+    def _simple_flesch_reading_ease(self, stats: TextStats) -> float:
         """Simple Flesch Reading Ease calculation"""
-        words = len(text.split())
-        sentences = len(re.split(r'[.!?]+', text))
-        avg_words_per_sentence = words / sentences if sentences > 0 else 0
-        return max(0, 206.835 - 1.015 * avg_words_per_sentence)
-    
-    def _simple_dale_chall(self, text: str) -> float:
-        """Simple Dale-Chall calculation"""
-        words = len(text.split())
-        sentences = len(re.split(r'[.!?]+', text))
-        avg_words_per_sentence = words / sentences if sentences > 0 else 0
-        return max(0, 0.1579 * avg_words_per_sentence + 0.0496)
-    
-    def _simple_smog(self, text: str) -> float:
+        return np.maximum(0, 206.835 - 1.015 * stats.avg_words_per_segment)
+    
+    def _dale_chall(self, stats: TextStats) -> float:
+        """Dale-Chall: persentase kata tidak familiar dan rata-rata panjang kalimat"""
+        difficult_percent = 100 * stats.unfamiliar_word_ratio
+        score = 0.1579 * difficult_percent + 0.0496 * stats.avg_words_per_sentence
+        # Penyesuaian Dale-Chall jika kata sulit lebih dari 5%
+        return np.where(difficult_percent > 5, score + 3.6365, score)
+    
+    def _simple_smog(self, stats: TextStats) -> float:
         """Simple SMOG calculation"""
-        sentences = len(re.split(r'[.!?]+', text))
-        return max(0, 1.043 * (sentences ** 0.5) + 3.1291)
+        return np.maximum(0, 1.043 * (stats.segment_count ** 0.5) + 3.1291)
     
-    def _simple_ari(self, text: str) -> float:
+    def _simple_ari(self, stats: TextStats) -> float:
         """Simple ARI calculation"""
-        words = len(text.split())
-        sentences = len(re.split(r'[.!?]+', text))
-        avg_words_per_sentence = words / sentences if sentences > 0 else 0
-        return max(0, 0.5 * avg_words_per_sentence + 4.71)
+        return np.maximum(0, 0.5 * stats.avg_words_per_segment + 4.71)
     
-    def _simple_coleman_liau(self, text: str) -> float:
+    def _simple_coleman_liau(self, stats: TextStats) -> float:
         """Simple Coleman-Liau calculation"""
-        words = len(text.split())
-        sentences = len(re.split(r'[.!?]+', text))
-        avg_words_per_sentence = words / sentences if sentences > 0 else 0
-        return max(0, 0.0588 * avg_words_per_sentence - 0.296)
+        return np.maximum(0, 0.0588 * stats.avg_words_per_segment - 0.296)
     
     async def evaluate_text(
         self, 
         text: str, 
-        metrics: Optional[List[str]] = None
+        metrics: Optional[List[str]] = None,
+        document: Optional[AnalyzedDocument] = None
     ) -> Dict[str, Any]:
         """
-        Evaluate text readability menggunakan berbagai metrik
+        Evaluate text readability menggunakan berbagai metrik.
+        `document` bisa diberikan jika teks sudah dianalisis sebelumnya (analyze_text).
+        Tanpa `document`, hasil diambil dari cache readability bersama dan
+        dikembalikan bersama `handle` teks. Teks sangat besar dihitung paralel
+        per bagian di process pool (lihat text_stats_parallel) dengan hasil yang sama.
         """
         try:
             if metrics is None:
-                metrics = ["flesch_kincaid", "dale_chall", "smog"]
-            
-            # Calculate metrics
-            calculated_metrics = {}
-            for metric in metrics:
-                if metric in self.metrics_functions:
-                    try:
-                        calculated_metrics[metric] = self.metrics_functions[metric](text)
-                    except:
-                        calculated_metrics[metric] = 0.0
-            
-            # Determine grade level
-            grade_level = self._determine_grade_level(calculated_metrics)
+                metrics = DEFAULT_METRICS
             
-            # Generate recommendations
-            recommendations = self._generate_recommendations(calculated_metrics, text)
+            if document is not None:
+                return self.evaluate_stats(document, metrics)
             
-            return {
-                "metrics": calculated_metrics,
-                "grade_level": grade_level,
-                "recommendations": recommendations
-            }
+            # Statistik teks dihitung sekali di CPU pool dan dipakai oleh semua metrik
+            handle, result = await self.readability_cache.score(
+                text,
+                ReadabilityCache.metric_set_key("evaluate", metrics, self._metrics_version),
+                lambda text_stats: self.evaluate_stats(text_stats, metrics)
+            )
+            result["handle"] = handle
+            return result
             
         except Exception as e:
             return await self._fallback_evaluation(text)
     
+    def resolve_handle(self, handle: str) -> Optional[str]:
+        """Teks untuk handle readability; None jika sudah keluar dari cache atau terlalu panjang untuk disimpan"""
+        return self.readability_cache.get_text(handle)
+    
+    def evaluate_handle(self, handle: str, metrics: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Evaluasi langsung dari statistik yang di-cache untuk handle, tanpa teksnya.
+        None jika statistik handle sudah keluar dari cache.
+        """
+        if metrics is None:
+            metrics = DEFAULT_METRICS
+        result = self.readability_cache.score_handle(
+            handle,
+            ReadabilityCache.metric_set_key("evaluate", metrics, self._metrics_version),
+            lambda text_stats: self.evaluate_stats(text_stats, metrics)
+        )
+        if result is not None:
+            result["handle"] = handle
+        return result
+    
+    def evaluate_stats(self, stats: TextStats, metrics: List[str]) -> Dict[str, Any]:
+        """Metrik, jenjang, dan rekomendasi dari statistik teks"""
+        
+        # Calculate metrics
+        calculated_metrics = {}
+        for metric in metrics:
+            if metric in self.metrics_functions:
+                try:
+                    calculated_metrics[metric] = float(self.metrics_functions[metric](stats))
+                except:
+                    calculated_metrics[metric] = 0.0
+        
+        # Determine grade level
+        grade_level = self._determine_grade_level(calculated_metrics)
+        
+        # Generate recommendations
+        recommendations = self._generate_recommendations(calculated_metrics, stats)
+        
+        return {
+            "metrics": calculated_metrics,
+            "grade_level": grade_level,
+            "recommendations": recommendations
+        }
+    
+    async def evaluate_sentences(
+        self,
+        text: str,
+        metrics: Optional[List[str]] = None,
+        difficulty_metric: str = DIFFICULTY_METRIC,
+        window_size: Optional[int] = None,
+        windows: Optional[List[Tuple[int, int]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluasi teks beserta skor kesulitan setiap kalimat (heatmap).
+        Statistik per kalimat disimpan sebagai prefix sum dari satu kali jalan, jadi
+        jendela kalimat (`window_size` berurutan atau `windows` [first, last)) dihitung
+        dari selisih prefix tanpa memproses ulang teks.
+        """
+        if metrics is None:
+            metrics = DEFAULT_METRICS
+        if difficulty_metric not in self.metrics_functions:
+            raise ValueError(f"Unknown difficulty metric: {difficulty_metric}")
+        if window_size is not None and window_size < 1:
+            raise ValueError("window_size must be at least 1")
+        if windows and any(len(window) != 2 for window in windows):
+            raise ValueError("Sentence windows must be [first, last) pairs")
+        
+        stats, sentences = await run_cpu_bound(compute_sentence_stats, text, pure=True)
+        result = self.evaluate_stats(stats, metrics)
+        result.update(await run_cpu_bound(
+            self._score_sentences, text, sentences, difficulty_metric, window_size, windows
+        ))
+        return result
+    
+    def _score_sentences(
+        self,
+        text: str,
+        sentences: SentencePrefixSums,
+        difficulty_metric: str,
+        window_size: Optional[int],
+        windows: Optional[List[Tuple[int, int]]]
+    ) -> Dict[str, Any]:
+        formula = self.metrics_functions[difficulty_metric]
+        count = len(sentences)
+        
+        # Offset kalimat tanpa spasi di depan (dan di belakang kalimat terakhir)
+        starts = [NON_SPACE_PATTERN.search(text, start).start() for start in sentences.starts.tolist()]
+        ends = sentences.ends.tolist()
+        if ends:
+            ends[-1] = starts[-1] + len(text[starts[-1]:ends[-1]].rstrip())
+        
+        sentence_stats = sentences.sentence_stats()
+        scores = self._score_metric(formula, sentence_stats).tolist()
+        word_counts = sentence_stats.word_count.tolist()
+        items = [
+            {
+                "index": index,
+                "start": starts[index],
+                "end": ends[index],
+                "word_count": word_counts[index],
+                "difficulty": scores[index]
+            }
+            for index in range(count)
+        ]
+        
+        firsts, lasts = [], []
+        if window_size:
+            first, last = sentences.sliding_windows(window_size)
+            firsts.append(first)
+            lasts.append(last)
+        if windows:
+            pairs = np.asarray(windows, dtype=np.int64).reshape(len(windows), 2)
+            first, last = pairs[:, 0], pairs[:, 1]
+            if ((first < 0) | (first >= last) | (last > count)).any():
+                raise ValueError(f"Sentence windows must satisfy 0 <= first < last <= {count}")
+            firsts.append(first)
+            lasts.append(last)
+        
+        window_items = []
+        if firsts:
+            first = np.concatenate(firsts)
+            last = np.concatenate(lasts)
+            window_stats = sentences.window_stats(first, last)
+            window_scores = self._score_metric(formula, window_stats).tolist()
+            window_words = window_stats.word_count.tolist()
+            window_items = [
+                {
+                    "first": f,
+                    "last": l,
+                    "start": starts[f],
+                    "end": ends[l - 1],
+                    "word_count": window_words[index],
+                    "difficulty": window_scores[index]
+                }
+                for index, (f, l) in enumerate(zip(first.tolist(), last.tolist()))
+            ]
+        
+        return {
+            "difficulty_metric": difficulty_metric,
+            "sentences": items,
+            "windows": window_items
+        }
+    
+    async def evaluate_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        metrics: Optional[List[str]] = None,
+        section_size: int = SECTION_SIZE,
+        encoding: str = "utf-8"
+    ) -> Dict[str, Any]:
+        """
+        Evaluasi teks yang dibaca per potongan (misalnya file upload).
+        Statistik dibangun bertahap sehingga memori tidak bergantung pada ukuran file;
+        hasil berisi metrik keseluruhan dan metrik per bagian.
+        """
+        if metrics is None:
+            metrics = DEFAULT_METRICS
+        
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        accumulator = TextStatsAccumulator(section_size=section_size)
+        size_bytes = 0
+        
+        async for chunk in chunks:
+            size_bytes += len(chunk)
+            text = decoder.decode(chunk)
+            if text:
+                await run_cpu_bound(accumulator.feed, text)
+        accumulator.feed(decoder.decode(b"", final=True))
+        stats = await run_cpu_bound(accumulator.finish)
+        
+        result = self.evaluate_stats(stats, metrics)
+        
+        # Metrik per bagian dihitung secara vektor seperti evaluate_batch
+        sections = []
+        if accumulator.sections:
+            section_stats = TextStatsBatch.from_stats([stats for _, _, stats in accumulator.sections])
+            scored = self._score_batch(section_stats, metrics)["documents"]
+            for (start, end, section), document in zip(accumulator.sections, scored):
+                sections.append({
+                    "index": document["index"],
+                    "start": start,
+                    "end": end,
+                    "word_count": section.word_count,
+                    "sentence_count": section.sentence_count,
+                    "metrics": document["metrics"],
+                    "grade_level": document["grade_level"]
+                })
+        
+        result.update({
+            "size_bytes": size_bytes,
+            "character_count": accumulator.characters_fed,
+            "word_count": stats.word_count,
+            "sentence_count": stats.sentence_count,
+            "sections": sections
+        })
+        return result
+    
+    async def evaluate_batch(
+        self,
+        texts: List[str],
+        metrics: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluasi banyak teks sekaligus.
+        Statistik setiap dokumen dikumpulkan ke array, lalu setiap metrik dihitung
+        sebagai ekspresi NumPy untuk seluruh korpus.
+        """
+        if metrics is None:
+            metrics = DEFAULT_METRICS
+        
+        chunks = [texts[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(texts), BATCH_CHUNK_SIZE)]
+        batches = await asyncio.gather(*(
+            run_cpu_bound(TextStatsBatch.from_texts, chunk, pure=True) for chunk in chunks
+        ))
+        stats = TextStatsBatch.concatenate(batches) if batches else TextStatsBatch.from_stats([])
+        
+        return await run_cpu_bound(self._score_batch, stats, metrics)
+    
+    def _score_batch(self, stats: TextStatsBatch, metrics: List[str]) -> Dict[str, Any]:
+        """Hitung metrik, jenjang, dan ringkasan korpus dari statistik batch"""
+        
+        scores: Dict[str, np.ndarray] = {}
+        for metric in metrics:
+            if metric in self.metrics_functions:
+                scores[metric] = self._score_metric(self.metrics_functions[metric], stats)
+        
+        # Jenjang dari Flesch-Kincaid, sama dengan _determine_grade_level
+        fk_scores = scores.get("flesch_kincaid", np.zeros(len(stats)))
+        grade_indices = np.searchsorted(GRADE_THRESHOLDS, fk_scores, side="left")
+        grade_counts = np.bincount(grade_indices, minlength=len(GRADE_LEVELS))
+        
+        columns = {metric: values.tolist() for metric, values in scores.items()}
+        documents = [
+            {
+                "index": index,
+                "metrics": {metric: values[index] for metric, values in columns.items()},
+                "grade_level": GRADE_LEVELS[grade]
+            }
+            for index, grade in enumerate(grade_indices.tolist())
+        ]
+        
+        summary_metrics = {}
+        if len(stats):
+            for metric, values in scores.items():
+                p25, median, p75, p95 = np.percentile(values, [25, 50, 75, 95])
+                summary_metrics[metric] = {
+                    "mean": float(values.mean()),
+                    "std": float(values.std()),
+                    "min": float(values.min()),
+                    "p25": float(p25),
+                    "median": float(median),
+                    "p75": float(p75),
+                    "p95": float(p95),
+                    "max": float(values.max())
+                }
+        
+        return {
+            "documents": documents,
+            "summary": {
+                "document_count": len(stats),
+                "total_words": int(stats.word_count.sum()),
+                "total_sentences": int(stats.sentence_count.sum()),
+                "metrics": summary_metrics,
+                "grade_levels": dict(zip(GRADE_LEVELS, grade_counts.tolist()))
+            }
+        }
+    
+    def _score_metric(self, formula: MetricFormula, stats: TextStatsBatch) -> np.ndarray:
+        """Hitung satu metrik untuk semua dokumen; rumus non-NumPy dihitung per dokumen"""
+        try:
+            values = np.asarray(formula(stats), dtype=np.float64)
+            if values.shape == (len(stats),):
+                return values
+        except Exception:
+            pass
+        
+        values = np.zeros(len(stats), dtype=np.float64)
+        for index in range(len(stats)):
+            try:
+                values[index] = formula(stats.document(index))
+            except:
+                values[index] = 0.0
+        return values
+    
     def _determine_grade_level(self, metrics: Dict[str, float]) -> str:
         """Determine grade level berdasarkan metrics"""
         
         # Use Flesch-Kincaid as primary metric
         fk_score = metrics.get("flesch_kincaid", 0)
-        
-        if fk_score <= 6:
-            return "SD (Sekolah Dasar)"
-        elif fk_score <= 9:
-            return "SMP (Sekolah Menengah Pertama)"
-        elif fk_score <= 12:
-            return "SMA (Sekolah Menengah Atas)"
-        else:
-            return "Perguruan Tinggi"
+        return GRADE_LEVELS[bisect_left(GRADE_THRESHOLDS, fk_score)]
     
-    def _generate_recommendations(self, metrics: Dict[str, float], text: str) -> List[str]:
+    def _generate_recommendations(self, metrics: Dict[str, float], stats: TextStats) -> List[str]:
         """Generate recommendations untuk meningkatkan readability"""
         
         recommendations = []
         
         # Check sentence length
-        sentences = re.split(r'[.!?]+', text)
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences) if sentences else 0
+        avg_sentence_length = stats.avg_words_per_segment
         
         if avg_sentence_length > 20:
             recommendations.append("Gunakan kalimat yang lebih pendek (maksimal 15 kata)")
         
         # Check word complexity
-        words = text.split()
-        complex_words = [word for word in words if len(word) > 8]
-        complex_ratio = len(complex_words) / len(words) if words else 0
+        complex_ratio = stats.long_word_ratio
         
         if complex_ratio > 0.3:
             recommendations.append("Gunakan kata-kata yang lebih sederhana")
@@ -132,9 +458,12 @@ class EvaluationService:
         elif fk_score < 6:
             recommendations.append("Teks sudah cukup sederhana")
         
-        # Check Dale-Chall score
-        dc_score = metrics.get("dale_chall", 0)
-        if dc_score > 9:
+        # Check proportion of unfamiliar words
+        if (
+            self.familiar_words is not None
+            and len(self.familiar_words) >= FAMILIAR_WORDS_MIN_SIZE
+            and stats.unfamiliar_word_ratio > UNFAMILIAR_WORD_THRESHOLD
+        ):
             recommendations.append("Gunakan lebih banyak kata-kata yang familiar")
         
         # General recommendations
@@ -157,51 +486,29 @@ class EvaluationService:
             "recommendations": ["Teks tidak dapat dievaluasi karena masalah teknis"]
         }
     
-    def calculate_word_complexity(self, text: str) -> Dict[str, Any]:
+    def calculate_word_complexity(
+        self,
+        text: str,
+        document: Optional[AnalyzedDocument] = None
+    ) -> Dict[str, Any]:
         """Calculate word complexity metrics"""
         
-        words = text.split()
-        total_words = len(words)
-        
-        # Count words by length
-        short_words = len([w for w in words if len(w) <= 4])
-        medium_words = len([w for w in words if 5 <= len(w) <= 8])
-        long_words = len([w for w in words if len(w) > 8])
-        
-        # Count syllables (approximation)
-        total_syllables = sum(self._count_syllables(word) for word in words)
+        stats = document or compute_text_stats(text)
+        total_words = stats.word_count
         
         return {
             "total_words": total_words,
-            "short_words": short_words,
-            "medium_words": medium_words,
-            "long_words": long_words,
-            "total_syllables": total_syllables,
-            "avg_syllables_per_word": total_syllables / total_words if total_words > 0 else 0,
-            "complexity_ratio": long_words / total_words if total_words > 0 else 0
+            "short_words": stats.short_word_count,
+            "medium_words": stats.medium_word_count,
+            "long_words": stats.long_word_count,
+            "total_syllables": stats.syllable_count,
+            "avg_syllables_per_word": stats.avg_syllables_per_word,
+            "complexity_ratio": stats.long_word_ratio
         }
     
     def _count_syllables(self, word: str) -> int:
-        """Count syllables in a word (approximation)"""
-        
-        word = word.lower()
-        vowels = "aeiou"
-        syllable_count = 0
-        prev_was_vowel = False
-        
-        for char in word:
-            if char in vowels:
-                if not prev_was_vowel:
-                    syllable_count += 1
-                prev_was_vowel = True
-            else:
-                prev_was_vowel = False
-        
-        # Handle silent 'e'
-        if word.endswith('e') and syllable_count > 1:
-            syllable_count -= 1
-        
-        return max(1, syllable_count)
+        """Count syllables in a word (aturan suku kata bahasa Indonesia)"""
+        return count_syllables(word)
     
     def get_readability_interpretation(self, score: float, metric: str) -> str:
         """Get interpretation of readability score"""
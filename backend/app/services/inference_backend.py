@@ -0,0 +1,202 @@
+from typing import Dict, Any, Callable, List, Optional, Tuple
+import asyncio
+import time
+from collections import deque
+
+from app.utils.executors import run_cpu_bound
+
+
+class InferenceBackend:
+    """Interface untuk backend inference penyederhanaan teks"""
+
+    name = "base"
+    # Backend yang mendapat manfaat dari batching dijalankan lewat MicroBatcher
+    batched = False
+
+    def load(self):
+        """Load model; dipanggil sekali sebelum dipakai"""
+        pass
+
+    def generate_batch(self, prompts: List[str], texts: List[str]) -> List[str]:
+        """Generate teks sederhana untuk setiap prompt (teks asli disertakan untuk fallback)"""
+        raise NotImplementedError
+
+
+class RuleBasedBackend(InferenceBackend):
+    """Backend tanpa model: memakai aturan penyederhanaan"""
+
+    name = "rules"
+
+    def __init__(self, simplify: Callable[[str], str]):
+        self.simplify = simplify
+
+    def generate_batch(self, prompts: List[str], texts: List[str]) -> List[str]:
+        return [self.simplify(text) for text in texts]
+
+
+class TransformersBackend(InferenceBackend):
+    """
+    Backend causal LM dari transformers, berjalan di CPU atau GPU.
+    Model dan tokenizer bisa diberikan langsung (misalnya model kecil untuk pengujian).
+    """
+
+    name = "transformers"
+    batched = True
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: Optional[str] = None,
+        max_new_tokens: int = 256,
+        temperature: float = 0.7,
+        model: Any = None,
+        tokenizer: Any = None
+    ):
+        self.model_name = model_name
+        self.cache_dir = cache_dir
+        self.max_new_tokens = max_new_tokens
+        self.temperature = temperature
+        self.model = model
+        self.tokenizer = tokenizer
+
+    def load(self):
+        if self.model is None or self.tokenizer is None:
+            from transformers import AutoModelForCausalLM, AutoTokenizer
+
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, cache_dir=self.cache_dir)
+            self.model = AutoModelForCausalLM.from_pretrained(self.model_name, cache_dir=self.cache_dir)
+
+        self.model.eval()
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        # Causal LM harus di-pad di kiri agar token baru langsung menyambung prompt
+        self.tokenizer.padding_side = "left"
+
+    def generate_batch(self, prompts: List[str], texts: List[str]) -> List[str]:
+        import torch
+
+        inputs = self.tokenizer(prompts, return_tensors="pt", padding=True, truncation=True)
+        inputs = {key: value.to(self.model.device) for key, value in inputs.items()}
+
+        generate_kwargs = {
+            "max_new_tokens": self.max_new_tokens,
+            "pad_token_id": self.tokenizer.pad_token_id
+        }
+        if self.temperature > 0:
+            generate_kwargs.update(do_sample=True, temperature=self.temperature)
+        else:
+            generate_kwargs.update(do_sample=False)
+
+        with torch.no_grad():
+            outputs = self.model.generate(**inputs, **generate_kwargs)
+
+        new_tokens = outputs[:, inputs["input_ids"].shape[1]:]
+        return [output.strip() for output in self.tokenizer.batch_decode(new_tokens, skip_special_tokens=True)]
+
+
+class MicroBatcher:
+    """
+    Menggabungkan prompt yang datang bersamaan menjadi satu batch.
+    Batch dikirim saat mencapai max_batch_size atau setelah max_wait_ms sejak prompt pertama.
+    """
+
+    def __init__(
+        self,
+        backend: InferenceBackend,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+        history_size: int = 1000
+    ):
+        self.backend = backend
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.total_batches = 0
+        self.total_items = 0
+        self.total_busy_time = 0.0
+        # (ukuran batch, latency) untuk batch terakhir
+        self._history: deque = deque(maxlen=history_size)
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        # Event loop bisa berganti (misalnya asyncio.run di worker process)
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, prompt: str, text: str) -> str:
+        """Masukkan prompt ke antrian dan tunggu hasilnya"""
+        self._ensure_started()
+        future = self._loop.create_future()
+        await self._queue.put((prompt, text, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._process_batch(batch)
+
+    async def _process_batch(self, batch: List[Tuple[str, str, asyncio.Future]]):
+        prompts = [prompt for prompt, _, _ in batch]
+        texts = [text for _, text, _ in batch]
+        start_time = time.perf_counter()
+
+        try:
+            # Jalankan model di pool CPU bersama agar event loop tidak terblokir
+            # dan concurrency-nya ikut dibatasi CPU_EXECUTOR_WORKERS
+            outputs = await run_cpu_bound(self.backend.generate_batch, prompts, texts)
+            if len(outputs) != len(batch):
+                raise RuntimeError(f"Backend returned {len(outputs)} outputs for {len(batch)} prompts")
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            latency = time.perf_counter() - start_time
+            self.total_batches += 1
+            self.total_items += len(batch)
+            self.total_busy_time += latency
+            self._history.append((len(batch), latency))
+
+        for (_, _, future), output in zip(batch, outputs):
+            if not future.done():
+                future.set_result(output)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistik batch: ukuran, latency, dan throughput"""
+        latencies = sorted(latency for _, latency in self._history)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+        return {
+            "backend": self.backend.name,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "total_batches": self.total_batches,
+            "total_items": self.total_items,
+            "avg_batch_size": self.total_items / self.total_batches if self.total_batches else 0.0,
+            "last_batch_size": self._history[-1][0] if self._history else 0,
+            "batch_latency_p50": percentile(0.50),
+            "batch_latency_p95": percentile(0.95),
+            "throughput_items_per_sec": self.total_items / self.total_busy_time if self.total_busy_time else 0.0,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0
+        }
@@ -0,0 +1,319 @@
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+import os
+import threading
+import time
+import uuid
+
+import numpy as np
+
+from app.services.evaluation_service import DEFAULT_METRICS, EvaluationService
+from app.utils.executors import run_cpu_bound
+from app.utils.text_stats import COUNT_FIELDS, SEGMENT_INDEX, TextStats, TextStatsAccumulator
+
+# Perkiraan memori per kalimat di luar teksnya (string, tuple counter, offset)
+SEGMENT_OVERHEAD_BYTES = 200
+
+# Counter satu kalimat dengan urutan COUNT_FIELDS; segment_count disimpan
+# sebagai jumlah kelompok tanda akhir agar bisa dijumlahkan antar kalimat
+Counts = Tuple[int, ...]
+ZERO_COUNTS: Counts = (0,) * len(COUNT_FIELDS)
+
+
+class SessionNotFoundError(Exception):
+    """Sesi tidak ada, sudah kedaluwarsa, atau sudah dikeluarkan dari memori"""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        super().__init__(f"Session '{session_id}' not found or expired")
+
+
+class SessionVersionConflictError(Exception):
+    """Edit dikirim untuk versi dokumen yang sudah berubah"""
+
+    def __init__(self, session_id: str, expected: int, actual: int):
+        self.session_id = session_id
+        super().__init__(f"Session '{session_id}' is at version {actual}, edit was based on {expected}")
+
+
+def segment_text(text: str) -> List[Tuple[str, Counts]]:
+    """
+    Pecah teks menjadi kalimat beserta counter-nya dalam satu kali jalan.
+    Setiap kalimat berakhir tepat setelah token bertanda akhir; spasi sesudahnya
+    ikut kalimat berikutnya, jadi gabungan semua potongan sama dengan teks asli.
+    """
+    accumulator = TextStatsAccumulator(section_size=1)
+    accumulator.feed(text)
+    accumulator.finish()
+
+    sections = accumulator.sections
+    segments = [
+        (text[start:end], _counts_from_stats(stats))
+        for start, end, stats in sections
+    ]
+    if not segments:
+        return [(text, ZERO_COUNTS)] if text else []
+
+    # Spasi di akhir teks ikut kalimat terakhir
+    covered = sections[-1][1]
+    if covered < len(text):
+        last_text, last_counts = segments[-1]
+        segments[-1] = (last_text + text[covered:], last_counts)
+    return segments
+
+
+def _counts_from_stats(stats: TextStats) -> Counts:
+    counts = [getattr(stats, name) for name in COUNT_FIELDS]
+    counts[SEGMENT_INDEX] -= 1
+    return tuple(counts)
+
+
+class ReadabilitySession:
+    """
+    Dokumen yang sedang diedit, disimpan sebagai daftar kalimat dengan counter per kalimat.
+    Edit hanya menganalisis ulang kalimat yang tersentuh (plus satu tetangga di tiap sisi),
+    lalu total diperbarui dengan mengurangi counter lama dan menambah counter baru.
+    """
+
+    def __init__(self, session_id: str, metrics: List[str], segments: List[Tuple[str, Counts]]):
+        self.session_id = session_id
+        self.metrics = metrics
+        self.version = 0
+        self.created_at = time.time()
+        self.last_access = self.created_at
+        # Edit dan pembacaan sesi ini; lock service hanya dipegang untuk pencarian dan
+        # pembukuan memori, sehingga edit besar tidak menahan sesi lain
+        self.lock = threading.Lock()
+
+        if not segments:
+            segments = [("", ZERO_COUNTS)]
+        self.texts: List[str] = [segment for segment, _ in segments]
+        self.counts: List[Counts] = [counts for _, counts in segments]
+        lengths = np.fromiter((len(segment) for segment in self.texts), dtype=np.int64, count=len(self.texts))
+        # Offset awal setiap kalimat; dicari dengan binary search dan digeser secara vektor
+        self.starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        self.length = int(lengths.sum())
+        self.totals = [sum(column) for column in zip(*self.counts)]
+        # memory_bytes yang sudah dihitung di total memori service
+        self.accounted_bytes = self.memory_bytes
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.length + SEGMENT_OVERHEAD_BYTES * len(self.texts)
+
+    @property
+    def text(self) -> str:
+        return "".join(self.texts)
+
+    def stats(self) -> TextStats:
+        stats = TextStats()
+        for name, value in zip(COUNT_FIELDS, self.totals):
+            setattr(stats, name, value)
+        stats.segment_count += 1
+        return stats
+
+    def _segment_at(self, offset: int) -> int:
+        return int(np.searchsorted(self.starts, offset, side="right")) - 1
+
+    @staticmethod
+    def check_edit(offset: int, delete_count: int, length: int):
+        if offset < 0 or delete_count < 0 or offset + delete_count > length:
+            raise ValueError(
+                f"Edit at offset {offset} deleting {delete_count} characters "
+                f"is outside the document (length {length})"
+            )
+
+    def check_edits(self, edits: List[Dict[str, Any]]):
+        """Validasi semua edit terhadap panjang dokumen berjalan sebelum ada yang diterapkan"""
+        length = self.length
+        for edit in edits:
+            delete_count = edit.get("delete_count", 0)
+            self.check_edit(edit["offset"], delete_count, length)
+            length += len(edit.get("insert_text", "")) - delete_count
+
+    def apply_edit(self, offset: int, delete_count: int, insert_text: str):
+        """Ganti `delete_count` karakter mulai `offset` dengan `insert_text`"""
+        self.check_edit(offset, delete_count, self.length)
+
+        # Jendela: kalimat yang tersentuh edit ditambah satu kalimat di setiap sisi,
+        # karena edit di batas kalimat bisa menggabung atau memecah kalimat tetangga
+        last_index = len(self.texts) - 1
+        first = max(0, self._segment_at(offset) - 1)
+        last = min(last_index, self._segment_at(offset + delete_count) + 1)
+
+        window_start = int(self.starts[first])
+        window = "".join(self.texts[first:last + 1])
+        local = offset - window_start
+        window = window[:local] + insert_text + window[local + delete_count:]
+
+        segments = segment_text(window)
+        if not segments and first == 0 and last == last_index:
+            segments = [("", ZERO_COUNTS)]
+        new_texts = [segment for segment, _ in segments]
+        new_counts = [counts for _, counts in segments]
+
+        for counts in self.counts[first:last + 1]:
+            self.totals = [total - value for total, value in zip(self.totals, counts)]
+        for counts in new_counts:
+            self.totals = [total + value for total, value in zip(self.totals, counts)]
+
+        delta = len(insert_text) - delete_count
+        new_lengths = np.fromiter((len(segment) for segment in new_texts), dtype=np.int64, count=len(new_texts))
+        new_starts = window_start + np.concatenate(([0], np.cumsum(new_lengths)[:-1])) if len(new_texts) else new_lengths
+
+        if len(new_texts) == last - first + 1:
+            # Jumlah kalimat tetap (kasus umum saat mengetik): perbarui di tempat
+            self.starts[first:last + 1] = new_starts
+            self.starts[last + 1:] += delta
+        else:
+            self.starts = np.concatenate((self.starts[:first], new_starts, self.starts[last + 1:] + delta))
+        self.texts[first:last + 1] = new_texts
+        self.counts[first:last + 1] = new_counts
+        self.length += delta
+        self.version += 1
+
+
+class ReadabilitySessionService:
+    """
+    Sesi evaluasi readability untuk editor: klien mengirim delta edit, server
+    memperbarui counter kalimat yang berubah saja. Sesi yang menganggur kedaluwarsa
+    setelah TTL dan sesi yang paling lama tidak dipakai dikeluarkan jika batas memori terlampaui.
+    """
+
+    def __init__(
+        self,
+        evaluation_service: EvaluationService,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
+        self.evaluation_service = evaluation_service
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("READABILITY_SESSION_TTL", 1800)
+        )
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            os.getenv("READABILITY_SESSION_MAX_BYTES", 256 * 1024 * 1024)
+        )
+        # Urut dari yang paling lama tidak dipakai
+        self._sessions: "OrderedDict[str, ReadabilitySession]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.expired = 0
+        self.evicted = 0
+
+    async def create_session(self, text: str, metrics: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Buat sesi baru dari teks awal"""
+        segments = await run_cpu_bound(segment_text, text, pure=True)
+        session = ReadabilitySession(uuid.uuid4().hex, metrics or DEFAULT_METRICS, segments)
+        if session.memory_bytes > self.max_bytes:
+            raise ValueError("Document is too large for a live evaluation session")
+        with self._lock:
+            self._sessions[session.session_id] = session
+            self._memory_bytes += session.memory_bytes
+            self._enforce_limits()
+        return self._result(session, 0.0)
+
+    def apply_edits(
+        self,
+        session_id: str,
+        edits: List[Dict[str, Any]],
+        base_version: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Terapkan delta edit secara berurutan dan kembalikan metrik terbaru.
+        Satu batch diterapkan seluruhnya atau tidak sama sekali: semua edit divalidasi dulu.
+        Biasanya hanya kalimat yang tersentuh dianalisis ulang, tetapi kalimat tanpa tanda
+        akhir bisa sepanjang dokumen; jalankan lewat run_cpu_bound, bukan di event loop.
+        """
+        start_time = time.perf_counter()
+        with self._lock:
+            session = self._touch(session_id)
+
+        with session.lock:
+            if base_version is not None and base_version != session.version:
+                raise SessionVersionConflictError(session_id, base_version, session.version)
+
+            session.check_edits(edits)
+            try:
+                for edit in edits:
+                    session.apply_edit(edit["offset"], edit.get("delete_count", 0), edit.get("insert_text", ""))
+            finally:
+                memory_bytes = session.memory_bytes
+            result = self._result(session, (time.perf_counter() - start_time) * 1000)
+
+        with self._lock:
+            # Sesi bisa sudah dikeluarkan selama edit; memorinya sudah dikurangi saat itu
+            if self._sessions.get(session_id) is session:
+                self._memory_bytes += memory_bytes - session.accounted_bytes
+                session.accounted_bytes = memory_bytes
+            self._enforce_limits()
+        return result
+
+    def get_session(self, session_id: str, include_text: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            session = self._touch(session_id)
+        with session.lock:
+            result = self._result(session, 0.0)
+            if include_text:
+                result["text"] = session.text
+        return result
+
+    def close_session(self, session_id: str):
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                raise SessionNotFoundError(session_id)
+            self._memory_bytes -= session.accounted_bytes
+
+    def _touch(self, session_id: str) -> ReadabilitySession:
+        self._expire()
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise SessionNotFoundError(session_id)
+        session.last_access = time.time()
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def _expire(self):
+        deadline = time.time() - self.ttl_seconds
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if session.last_access > deadline:
+                break
+            self._remove_oldest()
+            self.expired += 1
+
+    def _enforce_limits(self):
+        # Sesi yang baru dipakai ada di akhir, jadi tidak pernah dikeluarkan di sini
+        self._expire()
+        while self._memory_bytes > self.max_bytes and len(self._sessions) > 1:
+            self._remove_oldest()
+            self.evicted += 1
+
+    def _remove_oldest(self):
+        _, session = self._sessions.popitem(last=False)
+        self._memory_bytes -= session.accounted_bytes
+
+    def _result(self, session: ReadabilitySession, elapsed_ms: float) -> Dict[str, Any]:
+        stats = session.stats()
+        result = self.evaluation_service.evaluate_stats(stats, session.metrics)
+        result.update({
+            "session_id": session.session_id,
+            "version": session.version,
+            "length": session.length,
+            "word_count": stats.word_count,
+            "sentence_count": stats.sentence_count,
+            "elapsed_ms": elapsed_ms
+        })
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._expire()
+            return {
+                "sessions": len(self._sessions),
+                "memory_bytes": self._memory_bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "expired": self.expired,
+                "evicted": self.evicted
+            }
@@ -0,0 +1,127 @@
+from typing import Dict, Any, Callable, Optional
+import asyncio
+import os
+import threading
+import time
+
+
+class ServiceNotReadyError(Exception):
+    """Service belum siap (masih warm-up atau gagal dimuat)"""
+
+    def __init__(self, name: str, reason: str):
+        self.name = name
+        self.reason = reason
+        super().__init__(f"Service '{name}' is not ready: {reason}")
+
+
+class LazyService:
+    """
+    Membungkus service yang mahal untuk dibuat.
+    Instance dibuat saat warm-up di background atau pada request pertama.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any], wait_timeout: float = 10.0):
+        self.name = name
+        self.factory = factory
+        self.wait_timeout = wait_timeout
+        self.state = "pending"  # pending, loading, ready, failed
+        self.warmup_time: Optional[float] = None
+        self.error: Optional[str] = None
+        self._instance = None
+        self._lock = threading.Lock()
+        self._load_future: Optional[asyncio.Future] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._instance is not None
+
+    def instance(self) -> Any:
+        """Ambil instance, membuatnya secara sinkron jika belum ada"""
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    if self.state == "failed":
+                        raise ServiceNotReadyError(self.name, self.error)
+                    self.state = "loading"
+                    start_time = time.perf_counter()
+                    try:
+                        instance = self.factory()
+                    except Exception as e:
+                        self.state = "failed"
+                        self.error = str(e)
+                        raise ServiceNotReadyError(self.name, self.error)
+                    self.warmup_time = time.perf_counter() - start_time
+                    self._instance = instance
+                    self.state = "ready"
+        return self._instance
+
+    def start_warm_up(self) -> asyncio.Future:
+        """Mulai membuat instance di thread tanpa memblokir event loop"""
+        loop = asyncio.get_running_loop()
+        if self._load_future is None or (
+            self._load_future.get_loop() is not loop and not self._load_future.done()
+        ):
+            self._load_future = loop.run_in_executor(None, self.instance)
+        return self._load_future
+
+    async def get(self, timeout: Optional[float] = None) -> Any:
+        """
+        Ambil instance; tunggu warm-up paling lama `timeout` detik.
+        Raise ServiceNotReadyError jika belum siap dalam batas waktu.
+        """
+        if self._instance is not None:
+            return self._instance
+        if self.state == "failed":
+            raise ServiceNotReadyError(self.name, self.error)
+
+        timeout = self.wait_timeout if timeout is None else timeout
+        future = self.start_warm_up()
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise ServiceNotReadyError(self.name, "still warming up")
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "warmup_time": self.warmup_time,
+            "error": self.error
+        }
+
+
+class ServiceRegistry:
+    """Daftar service yang dibuat secara lazy dan di-warm-up saat startup"""
+
+    def __init__(self):
+        self._services: Dict[str, LazyService] = {}
+        self.wait_timeout = float(os.getenv("SERVICE_READY_TIMEOUT", 10))
+        self.warmup_started_at: Optional[float] = None
+        self.warmup_time: Optional[float] = None
+
+    def register(self, name: str, factory: Callable[[], Any]) -> LazyService:
+        service = LazyService(name, factory, wait_timeout=self.wait_timeout)
+        self._services[name] = service
+        return service
+
+    async def warm_up(self):
+        """Buat semua service satu per satu di background"""
+        self.warmup_started_at = time.time()
+        start_time = time.perf_counter()
+        for service in self._services.values():
+            try:
+                await service.start_warm_up()
+                print(f"Service '{service.name}' ready in {service.warmup_time:.2f}s")
+            except Exception as e:
+                print(f"Error warming up service '{service.name}': {e}")
+        self.warmup_time = time.perf_counter() - start_time
+
+    def readiness(self) -> Dict[str, Any]:
+        """Status setiap service untuk readiness probe"""
+        return {
+            "ready": all(service.is_ready for service in self._services.values()),
+            "warmup_time": self.warmup_time,
+            "services": {name: service.get_status() for name, service in self._services.items()}
+        }
+
+
+registry = ServiceRegistry()
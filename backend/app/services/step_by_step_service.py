@@ -1,9 +1,27 @@
 from typing import Dict, Any, List, Optional
 import re
 import asyncio
+import os
+
+from app.utils.executors import run_cpu_bound
+from app.utils.lexicon import LEXICON_DIR, load_lexicon
 
 class StepByStepService:
+    # Dipakai jika file leksikon tidak tersedia
+    DEFAULT_REPLACEMENTS = {
+        "menggunakan": "pakai",
+        "melakukan": "lakukan",
+        "mengikuti": "ikuti",
+        "memastikan": "pastikan",
+        "melengkapi": "lengkapi",
+        "menyelesaikan": "selesaikan"
+    }
+
     def __init__(self):
+        self.lexicon = load_lexicon(
+            os.getenv("INSTRUCTION_LEXICON_PATH", LEXICON_DIR / "instructions_id.tsv"),
+            fallback=self.DEFAULT_REPLACEMENTS
+        )
         self.step_templates = {
             "form": self._create_form_steps,
             "registration": self._create_registration_steps,
@@ -63,10 +81,8 @@ class StepByStepService:
     ) -> List[Dict[str, str]]:
         """Create steps berdasarkan jenis instruksi"""
         
-        if instruction_type in self.step_templates:
-            return self.step_templates[instruction_type](instruction, user_level)
-        else:
-            return self._create_general_steps(instruction, user_level)
+        create_steps = self.step_templates.get(instruction_type, self._create_general_steps)
+        return await run_cpu_bound(create_steps, instruction, user_level)
     
     def _create_form_steps(self, instruction: str, user_level: str) -> List[Dict[str, str]]:
         """Create steps untuk mengisi formulir"""
@@ -211,20 +227,7 @@ class StepByStepService:
         """Simplify a single sentence"""
         
         # Remove complex words
-        replacements = {
-            "menggunakan": "pakai",
-            "melakukan": "lakukan",
-            "mengikuti": "ikuti",
-            "memastikan": "pastikan",
-            "melengkapi": "lengkapi",
-            "menyelesaikan": "selesaikan"
-        }
-        
-        simplified = sentence
-        for complex_word, simple_word in replacements.items():
-            simplified = simplified.replace(complex_word, simple_word)
-        
-        return simplified
+        return self.lexicon.substitute(sentence)
     
     def _create_example_for_sentence(self, sentence: str) -> str:
         """Create example for a sentence"""
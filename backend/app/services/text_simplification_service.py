@@ -1,29 +1,107 @@
 import re
 # import textstat
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 import asyncio
-# from transformers import AutoTokenizer, AutoModelForCausalLM
-# import torch
+import time
 import os
 
+from app.services.inference_backend import (
+    InferenceBackend,
+    MicroBatcher,
+    RuleBasedBackend,
+    TransformersBackend
+)
+from app.utils.lexicon import LEXICON_DIR, load_lexicon
+from app.utils.executors import run_cpu_bound
+from app.utils.readability_cache import get_readability_cache
+from app.utils.result_cache import ResultCache, make_cache_key
+from app.utils.text_analysis import TERMINATORS
+from app.utils.text_stats import (
+    COUNT_FIELDS,
+    AnalyzedDocument,
+    TextStats,
+    analyze_text,
+    compute_text_stats,
+    merge_text_stats
+)
+
+# Karakter khusus yang dibuang saat preprocessing
+SPECIAL_CHARACTERS = re.compile(r'[^\w\s.,!?;:()-]+')
+
+# Set metrik readability_score di cache readability bersama
+READABILITY_METRIC_SET = "simplify:1"
+
 class TextSimplificationService:
+    # Dipakai jika file leksikon tidak tersedia
+    DEFAULT_WORD_REPLACEMENTS = {
+        "mengeluarkan": "membuat",
+        "peraturan": "aturan",
+        "subsidi": "bantuan biaya",
+        "triwulan": "3 bulan",
+        "berlaku": "mulai digunakan",
+        # Frasa utuh agar "berlaku mulai" tidak menjadi "mulai digunakan dimulai"
+        "berlaku mulai": "mulai digunakan sejak",
+        "mengenai": "tentang",
+        "mulai": "dimulai"
+    }
+
     def __init__(self):
-        self.model_name = "microsoft/DialoGPT-medium"  # Fallback model
+        self.model_name = os.getenv("MODEL_NAME", "microsoft/DialoGPT-medium")  # Fallback model
         self.tokenizer = None
         self.model = None
+        self.backend: InferenceBackend = RuleBasedBackend(self._simplify_with_rules)
+        self.batcher: Optional[MicroBatcher] = None
         self._load_model()
+        self.lexicon = load_lexicon(
+            os.getenv("LEXICON_PATH", LEXICON_DIR / "simplification_id.tsv"),
+            fallback=self.DEFAULT_WORD_REPLACEMENTS
+        )
+        self.result_cache = ResultCache.from_env("SIMPLIFY_CACHE", table="simplification_cache")
+        # Cache readability bersama dengan EvaluationService
+        self.readability_cache = get_readability_cache()
+        self.sentence_cache = ResultCache.from_env(
+            "SENTENCE_CACHE", table="sentence_cache", max_entries=16384
+        )
     
     def _load_model(self):
-        """Load LLaMA model atau fallback ke model yang tersedia"""
+        """Load backend inference sesuai INFERENCE_BACKEND (default: rule-based)"""
         try:
-            # Untuk demo, kita akan menggunakan prompt engineering dengan model yang tersedia
-            # Dalam production, gunakan LLaMA 3 dengan fine-tuning
-            print("Loading text simplification model...")
-            # Model loading akan diimplementasikan sesuai dengan resources yang tersedia
-            pass
+            backend_name = os.getenv("INFERENCE_BACKEND", "rules")
+            if backend_name == "transformers":
+                print(f"Loading text simplification model {self.model_name}...")
+                backend = TransformersBackend(
+                    self.model_name,
+                    cache_dir=os.getenv("MODEL_CACHE_DIR"),
+                    max_new_tokens=int(os.getenv("INFERENCE_MAX_NEW_TOKENS", 256)),
+                    temperature=float(os.getenv("TEMPERATURE", 0.7))
+                )
+                backend.load()
+                self.set_backend(backend)
+            else:
+                print("Using rule-based text simplification backend")
         except Exception as e:
             print(f"Error loading model: {e}")
     
+    def set_backend(self, backend: InferenceBackend):
+        """Ganti backend inference; backend yang mendukung batching dijalankan lewat MicroBatcher"""
+        self.backend = backend
+        self.tokenizer = getattr(backend, "tokenizer", None)
+        self.model = getattr(backend, "model", None)
+        if backend.batched:
+            self.batcher = MicroBatcher(
+                backend,
+                max_batch_size=int(os.getenv("INFERENCE_MAX_BATCH_SIZE", 8)),
+                max_wait_ms=float(os.getenv("INFERENCE_MAX_WAIT_MS", 10))
+            )
+        else:
+            self.batcher = None
+    
+    def get_inference_stats(self) -> Dict[str, Any]:
+        """Statistik backend inference dan micro-batching"""
+        if self.batcher is not None:
+            return self.batcher.get_stats()
+        return {"backend": self.backend.name, "batched": False}
+    
     async def simplify_text(
         self, 
         text: str, 
@@ -35,42 +113,288 @@ class TextSimplificationService:
         """
         Menyederhanakan teks menggunakan AI model
         """
+        # Hash teks dan lookup cache (bisa ke SQLite) di CPU pool, bukan di event loop
+        cache_key, cached = await run_cpu_bound(
+            self._lookup_result, text, target_level, language, max_length
+        )
+        if cached is not None:
+            result = dict(cached)
+            if not result.get("readability_handle"):
+                # Statistik handle sudah keluar dari cache readability: daftarkan ulang
+                result["readability_handle"], _ = await self.readability_cache.score(
+                    result["simplified_text"], READABILITY_METRIC_SET, self._readability_from_stats
+                )
+            result["sentences_reused"] = result.get("sentence_count", 0)
+            result["sentences_recomputed"] = 0
+            return result
+        
         try:
             # Preprocessing
-            cleaned_text = self._preprocess_text(text)
+            document = await run_cpu_bound(self._analyze_input, text)
+            sentences = document.sentences
             
-            # Generate simplified text using prompt engineering
-            simplified_text = await self._generate_simplified_text(
-                cleaned_text, target_level, language, max_length
+            # Simplify per kalimat; kalimat yang tidak berubah diambil dari cache
+            simplified_sentences, reused = await self._simplify_sentences(
+                sentences, target_level, language
             )
+            joined_text = " ".join(entry["simplified_text"] for entry in simplified_sentences)
             
-            # Calculate readability metrics
-            readability_score = self._calculate_readability(simplified_text)
+            # Ensure max length
+            simplified_text = self._truncate(joined_text, max_length)
+            
+            # Teks yang tidak dipotong: statistiknya = jumlah statistik kalimat (sudah di-cache)
+            stats = self._merge_sentence_stats(simplified_sentences) if simplified_text == joined_text else None
+            
+            # Calculate readability metrics lewat cache bersama; handle-nya bisa
+            # dipakai /api/evaluate/readability tanpa mengirim ulang teks
+            readability_handle, readability = await self.readability_cache.score(
+                simplified_text, READABILITY_METRIC_SET, self._readability_from_stats, stats=stats
+            )
+            readability_score = readability["readability_score"]
+            simplified_words = readability["word_count"]
             
             # Calculate word count reduction
-            original_words = len(text.split())
-            simplified_words = len(simplified_text.split())
-            word_reduction = original_words - simplified_words
+            word_reduction = document.word_count - simplified_words
             
-            return {
+            result = {
                 "simplified_text": simplified_text,
                 "readability_score": readability_score,
-                "word_count_reduction": word_reduction
+                "word_count_reduction": word_reduction,
+                "sentence_count": len(sentences),
+                "readability_handle": readability_handle
             }
+            await run_cpu_bound(self.result_cache.set, cache_key, result)
+            
+            result = dict(result)
+            result["sentences_reused"] = reused
+            result["sentences_recomputed"] = len(sentences) - reused
+            return result
             
         except Exception as e:
             # Fallback to rule-based simplification
             return await self._fallback_simplification(text, target_level)
     
+    async def _simplify_sentences(
+        self,
+        sentences: List[str],
+        target_level: str,
+        language: str
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Simplify setiap kalimat, memakai ulang hasil kalimat yang sudah pernah diproses.
+        Return hasil per kalimat dan jumlah kalimat yang diambil dari cache.
+        """
+        if self.batcher is None:
+            # Backend tanpa batching: lookup dan simplify sekali jalan di CPU pool
+            return await run_cpu_bound(self._simplify_sentences_sync, sentences, target_level, language)
+        
+        keys, entries, missing = await run_cpu_bound(
+            self._lookup_sentences, sentences, target_level, language
+        )
+        
+        # Kalimat yang berubah diproses bersamaan (micro-batcher menggabungkannya)
+        computed = await asyncio.gather(*[
+            self._simplify_sentence(sentences[i], target_level, language) for i in missing
+        ])
+        for i, entry in zip(missing, computed):
+            entries[i] = entry
+        await run_cpu_bound(self._store_sentences, [(keys[i], entries[i]) for i in missing])
+        
+        return entries, len(sentences) - len(missing)
+    
+    def _store_sentences(self, items: List[Tuple[str, Dict[str, Any]]]):
+        for key, entry in items:
+            self.sentence_cache.set(key, entry)
+    
+    def _lookup_sentences(
+        self,
+        sentences: List[str],
+        target_level: str,
+        language: str
+    ) -> Tuple[List[str], List[Optional[Dict[str, Any]]], List[int]]:
+        """Cari hasil setiap kalimat di cache; return kunci, hasil, dan index yang belum ada"""
+        keys = [self._sentence_cache_key(sentence, target_level, language) for sentence in sentences]
+        entries = [self.sentence_cache.get(key) for key in keys]
+        missing = [i for i, entry in enumerate(entries) if entry is None]
+        return keys, entries, missing
+    
+    async def _simplify_sentence(self, sentence: str, target_level: str, language: str) -> Dict[str, Any]:
+        """Simplify satu kalimat beserta kontribusinya ke readability"""
+        try:
+            prompt = self._create_simplification_prompt(sentence, target_level, language)
+            simplified = await self._run_inference(prompt, sentence)
+        except Exception:
+            simplified = self._simplify_with_rules(sentence)
+        
+        return self._sentence_entry(simplified)
+    
+    def _simplify_sentences_sync(
+        self,
+        sentences: List[str],
+        target_level: str,
+        language: str
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Versi sinkron _simplify_sentences: backend dipanggil sekali untuk semua kalimat baru"""
+        keys, entries, missing = self._lookup_sentences(sentences, target_level, language)
+        if not missing:
+            return entries, len(sentences)
+        
+        new_sentences = [sentences[i] for i in missing]
+        prompts = [self._create_simplification_prompt(s, target_level, language) for s in new_sentences]
+        try:
+            outputs = self.backend.generate_batch(prompts, new_sentences)
+        except Exception:
+            outputs = [""] * len(new_sentences)
+        
+        for i, sentence, output in zip(missing, new_sentences, outputs):
+            if output.strip():
+                simplified = self._improve_simplification(output)
+            else:
+                simplified = self._simplify_with_rules(sentence)
+            entries[i] = self._sentence_entry(simplified)
+            self.sentence_cache.set(keys[i], entries[i])
+        
+        return entries, len(sentences) - len(missing)
+    
+    def _sentence_entry(self, simplified: str) -> Dict[str, Any]:
+        """Hasil satu kalimat beserta kontribusinya ke readability"""
+        stats = compute_text_stats(simplified)
+        return {
+            "simplified_text": simplified,
+            "word_count": stats.word_count,
+            # Jumlah segmen tambahan pada len(re.split(r'[.!?]+', text))
+            "sentence_segments": stats.segment_count - 1,
+            # Semua counter TextStats (urutan COUNT_FIELDS) untuk merge_text_stats
+            "counts": [getattr(stats, name) for name in COUNT_FIELDS]
+        }
+    
+    def _merge_sentence_stats(self, entries: List[Dict[str, Any]]) -> Optional[TextStats]:
+        """
+        Statistik kalimat-kalimat yang digabung dengan spasi, dari counter per kalimat.
+        None jika ada entri tanpa counter (cache lama) atau kalimat yang tidak berakhir
+        dengan tanda akhir, karena penggabungan hanya tepat di akhir kalimat.
+        """
+        parts = []
+        for entry in entries:
+            counts = entry.get("counts")
+            if counts is None or not entry["simplified_text"].endswith(tuple(TERMINATORS)):
+                return None
+            parts.append(TextStats.from_counts(counts))
+        return merge_text_stats(parts)
+    
+    def _sentence_cache_key(self, sentence: str, target_level: str, language: str) -> str:
+        """Fingerprint kalimat: hash kalimat + parameter + backend"""
+        return make_cache_key(sentence, target_level, language, self.backend.name)
+    
+    def _lookup_result(
+        self, text: str, target_level: str, language: str, max_length: int
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        cache_key = self._result_cache_key(text, target_level, language, max_length)
+        cached = self.result_cache.get(cache_key)
+        handle = cached.get("readability_handle") if cached is not None else None
+        if handle and self.readability_cache.get_text_stats(handle) is None:
+            # Hasil masih di cache, tetapi handle-nya tidak bisa di-resolve lagi
+            cached = dict(cached, readability_handle=None)
+        return cache_key, cached
+    
+    def _result_cache_key(self, text: str, target_level: str, language: str, max_length: int) -> str:
+        """Kunci cache: hash teks yang dinormalisasi (spasi) + parameter + backend"""
+        normalized_text = " ".join(text.split())
+        return make_cache_key(normalized_text, target_level, language, max_length, self.backend.name)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Statistik cache hasil simplify_text dan cache per kalimat"""
+        stats = self.result_cache.get_stats()
+        stats["sentences"] = self.sentence_cache.get_stats()
+        stats["readability"] = self.readability_cache.get_stats()
+        return stats
+    
+    async def simplify_text_stream(
+        self,
+        text: str,
+        target_level: str = "simple",
+        language: str = "id",
+        max_length: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Menyederhanakan teks per kalimat dan mengirim setiap kalimat segera setelah selesai.
+        Setiap event membawa pengurangan kata dan readability yang berjalan.
+        Event `done` memakai pemotongan yang sama dengan simplify_text (3 kalimat jika
+        teks melebihi max_length), jadi bisa berisi lebih sedikit kalimat dari yang dikirim.
+        """
+        start_time = time.time()
+        time_to_first_sentence = None
+        document = await run_cpu_bound(self._analyze_input, text)
+
+        original_words = 0
+        simplified_words = 0
+        # Sama dengan len(re.split(r'[.!?]+', text)) pada teks gabungan
+        sentence_segments = 1
+        simplified_length = 0
+        simplified_sentences = []
+
+        sentence_word_counts = document.sentence_word_counts()
+        for index, sentence in enumerate(document.sentences):
+            entries, _ = await self._simplify_sentences([sentence], target_level, language)
+            entry = entries[0]
+            simplified = entry["simplified_text"]
+
+            simplified_sentences.append(simplified)
+            original_words += sentence_word_counts[index]
+            simplified_words += entry["word_count"]
+            sentence_segments += entry["sentence_segments"]
+            simplified_length += len(simplified) + 1
+
+            elapsed = time.time() - start_time
+            if time_to_first_sentence is None:
+                time_to_first_sentence = elapsed
+
+            yield {
+                "event": "sentence",
+                "index": index,
+                "original_sentence": sentence,
+                "simplified_sentence": simplified,
+                "word_count_reduction": original_words - simplified_words,
+                "readability_score": self._readability_from_counts(simplified_words, sentence_segments),
+                "elapsed_time": elapsed,
+                "time_to_first_sentence": time_to_first_sentence
+            }
+
+            # Panjang akhir baru diketahui setelah semua kalimat, jadi kalimat setelah
+            # yang ketiga bisa sudah terkirim; berhenti begitu batas terlampaui
+            if simplified_length > max_length and len(simplified_sentences) >= 3:
+                break
+
+        # Pemotongan akhir seperti simplify_text: lebih dari max_length -> 3 kalimat pertama
+        joined_text = " ".join(simplified_sentences)
+        simplified_text = self._truncate(joined_text, max_length)
+        if simplified_text != joined_text:
+            stats = compute_text_stats(simplified_text)
+            simplified_words = stats.word_count
+            sentence_segments = stats.segment_count
+
+        yield {
+            "event": "done",
+            "simplified_text": simplified_text,
+            "readability_score": self._readability_from_counts(simplified_words, sentence_segments),
+            # Seperti simplify_text: dibandingkan dengan seluruh teks asli
+            "word_count_reduction": document.word_count - simplified_words,
+            "sentence_count": len(simplified_sentences),
+            "time_to_first_sentence": time_to_first_sentence or 0.0,
+            "processing_time": time.time() - start_time
+        }
+
+    def _analyze_input(self, text: str) -> AnalyzedDocument:
+        """Preprocess dan analisis teks input dalam satu langkah"""
+        return analyze_text(self._preprocess_text(text))
+    
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text untuk simplification"""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = " ".join(text.split())
         
         # Remove special characters yang tidak perlu
-        text = re.sub(r'[^\w\s.,!?;:()-]', '', text)
-        
-        return text
+        return SPECIAL_CHARACTERS.sub('', text)
     
     async def _generate_simplified_text(
         self, 
@@ -87,14 +411,19 @@ class TextSimplificationService:
         # Prompt template untuk text simplification
         prompt = self._create_simplification_prompt(text, target_level, language)
         
-        # Simulasi AI response (dalam production, gunakan actual model)
-        simplified_text = await self._simulate_ai_response(prompt, text)
+        simplified_text = await self._run_inference(prompt, text)
         
         # Ensure max length
+        return self._truncate(simplified_text, max_length)
+    
+    def _truncate(self, simplified_text: str, max_length: int) -> str:
+        """Batasi teks panjang menjadi 3 kalimat pertama"""
         if len(simplified_text) > max_length:
             sentences = simplified_text.split('. ')
-            simplified_text = '. '.join(sentences[:3]) + '.'
-        
+            simplified_text = '. '.join(sentences[:3])
+            # Kalimat ketiga bisa sudah bertanda akhir (teks tepat 3 kalimat)
+            if not simplified_text.endswith(('.', '!', '?')):
+                simplified_text += '.'
         return simplified_text
     
     def _create_simplification_prompt(self, text: str, target_level: str, language: str) -> str:
@@ -119,37 +448,32 @@ class TextSimplificationService:
         
         return prompt
     
-    async def _simulate_ai_response(self, prompt: str, original_text: str) -> str:
-        """Simulate AI response untuk demo purposes"""
+    async def _run_inference(self, prompt: str, original_text: str) -> str:
+        """Jalankan backend inference; fallback ke aturan jika output kosong"""
+        
+        if self.batcher is not None:
+            output = await self.batcher.submit(prompt, original_text)
+        else:
+            output = (await run_cpu_bound(self.backend.generate_batch, [prompt], [original_text]))[0]
         
-        # Rule-based simplification sebagai fallback
-        simplified = self._rule_based_simplification(original_text)
+        if not output.strip():
+            return self._simplify_with_rules(original_text)
         
-        # Add some AI-like improvements
-        simplified = self._improve_simplification(simplified)
+        return self._improve_simplification(output)
+    
+    def _simplify_with_rules(self, text: str) -> str:
+        """Rule-based simplification dengan perbaikan tambahan"""
+        
+        simplified = self._rule_based_simplification(text)
         
-        return simplified
+        # Add some AI-like improvements
+        return self._improve_simplification(simplified)
     
     def _rule_based_simplification(self, text: str) -> str:
         """Rule-based text simplification sebagai fallback"""
         
-        # Dictionary untuk kata-kata kompleks -> sederhana
-        word_replacements = {
-            "mengeluarkan": "membuat",
-            "peraturan": "aturan",
-            "subsidi": "bantuan biaya",
-            "triwulan": "3 bulan",
-            "berlaku": "mulai digunakan",
-            "pemerintah": "pemerintah",
-            "mengenai": "tentang",
-            "mulai": "dimulai",
-            "kedua": "kedua"
-        }
-        
-        # Replace complex words
-        simplified_text = text
-        for complex_word, simple_word in word_replacements.items():
-            simplified_text = simplified_text.replace(complex_word, simple_word)
+        # Replace complex words (satu kali jalan, utuh per kata)
+        simplified_text = self.lexicon.substitute(text)
         
         # Split long sentences
         sentences = simplified_text.split('. ')
@@ -169,7 +493,7 @@ class TextSimplificationService:
         """Improve simplification dengan additional rules"""
         
         # Ensure sentences end with periods
-        if not text.endswith('.'):
+        if not text.endswith(('.', '!', '?')):
             text += '.'
         
         # Remove redundant words
@@ -180,11 +504,24 @@ class TextSimplificationService:
         
         return text.strip()
     
-    def _calculate_readability(self, text: str) -> Dict[str, float]:
+    def _calculate_readability(
+        self,
+        text: str,
+        document: Optional[AnalyzedDocument] = None
+    ) -> Dict[str, float]:
         """Calculate readability metrics"""
         # Simple readability calculation without external dependencies
-        words = len(text.split())
-        sentences = len(re.split(r'[.!?]+', text))
+        document = document or analyze_text(text)
+        return self._readability_from_counts(document.word_count, document.segment_count)
+
+    def _readability_from_stats(self, stats: TextStats) -> Dict[str, Any]:
+        return {
+            "readability_score": self._readability_from_counts(stats.word_count, stats.segment_count),
+            "word_count": stats.word_count
+        }
+
+    def _readability_from_counts(self, words: int, sentences: int) -> Dict[str, float]:
+        """Calculate readability metrics dari jumlah kata dan kalimat"""
         avg_words_per_sentence = words / sentences if sentences > 0 else 0
         
         # Simple scoring based on average words per sentence
@@ -206,11 +543,11 @@ class TextSimplificationService:
         """Fallback simplification jika AI model gagal"""
         
         simplified_text = self._rule_based_simplification(text)
-        readability_score = self._calculate_readability(simplified_text)
+        simplified_document = analyze_text(simplified_text)
+        readability_score = self._calculate_readability(simplified_text, simplified_document)
         
         original_words = len(text.split())
-        simplified_words = len(simplified_text.split())
-        word_reduction = original_words - simplified_words
+        word_reduction = original_words - simplified_document.word_count
         
         return {
             "simplified_text": simplified_text,
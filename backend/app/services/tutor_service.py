@@ -1,41 +1,125 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 import asyncio
+import os
 import re
+import threading
+import time
+
+import numpy as np
+
+from app.utils.concept_index import MATCH_EXACT, MATCH_FUZZY, MATCH_PARTIAL, ConceptIndex
+from app.utils.concept_ranker import ConceptRanker
+from app.utils.embeddings import HashedNgramEmbedder
+from app.utils.executors import run_cpu_bound
+from app.utils.knowledge_ingest import (
+    PHASE_INDEXING,
+    PHASE_SWAPPING,
+    IngestionBusyError,
+    IngestionJob,
+    load_snapshot
+)
+from app.utils.knowledge_store import KNOWLEDGE_DB_PATH, KnowledgeStore, build_snapshot
+from app.utils.result_cache import ResultCache, make_cache_key
+from app.utils.vector_index import IVFIndex
+
+# Confidence per jenis kecocokan konsep
+MATCH_CONFIDENCE = {
+    MATCH_EXACT: 0.9,
+    MATCH_PARTIAL: 0.7,
+    MATCH_FUZZY: 0.5
+}
+# Confidence tertinggi untuk hasil ranking BM25 (skor sama dengan batas atas skor query)
+RANKED_CONFIDENCE = 0.85
+# Pencarian FTS5 langsung di snapshot selama indeks di memori masih dibangun ulang
+FULL_TEXT_CONFIDENCE = 0.6
+# Pencarian semantik (embedding n-gram): confidence = SEMANTIC_CONFIDENCE * cosine similarity
+SEMANTIC_CONFIDENCE = 0.6
+SEMANTIC_MIN_SIMILARITY = float(os.getenv("TUTOR_SEMANTIC_MIN_SIMILARITY", 0.3))
+SEMANTIC_SEARCH = os.getenv("TUTOR_SEMANTIC_SEARCH", "True").lower() == "true"
+# Embedding konsep dihitung per batch saat indeks dibangun
+EMBED_BATCH_SIZE = 4096
+# Jumlah job ingestion terakhir yang statusnya disimpan
+MAX_INGESTION_JOBS = 20
+# Pola pertanyaan yang tidak mengubah konsep yang ditanyakan ("apa itu X", "jelaskan X")
+QUESTION_TEMPLATE = re.compile(r"\b(?:apa maksud|apa itu|jelaskan|definisi|pengertian)\s+(.+)$")
+QUESTION_WORD_PATTERN = re.compile(r"\w+")
+# user_level bebas diisi klien; hanya sekian level pertama yang jawabannya di-cache
+MAX_CACHED_LEVELS = 8
+NO_TERMS_CONFIDENCE = 0.3
+NO_MATCH_CONFIDENCE = 0.2
+
+DEFAULT_KNOWLEDGE = {
+    "definition": "Konsep yang Anda tanyakan belum tersedia dalam database kami",
+    "simple_explanation": "Maaf, saya belum bisa menjelaskan konsep ini. Silakan coba dengan kata kunci yang berbeda.",
+    "examples": [],
+    "related_concepts": []
+}
+
+# Isi awal knowledge base jika database belum ada
+SEED_KNOWLEDGE = {
+    "asuransi": {
+        "definition": "Asuransi adalah perlindungan finansial yang memberikan bantuan saat terjadi hal buruk",
+        "simple_explanation": "Asuransi seperti payung saat hujan. Anda bayar sedikit setiap bulan, tapi jika terjadi kecelakaan atau sakit, asuransi akan membantu membayar biayanya.",
+        "examples": [
+            "Asuransi kesehatan: membantu bayar biaya rumah sakit",
+            "Asuransi mobil: membantu bayar kerusakan mobil",
+            "Asuransi jiwa: memberikan uang untuk keluarga jika terjadi hal buruk"
+        ],
+        "related_concepts": ["perlindungan", "premi", "klaim", "polis"]
+    },
+    "subsidi": {
+        "definition": "Subsidi adalah bantuan uang dari pemerintah untuk mengurangi biaya",
+        "simple_explanation": "Subsidi seperti diskon dari pemerintah. Pemerintah membantu membayar sebagian biaya supaya masyarakat tidak perlu bayar mahal.",
+        "examples": [
+            "Subsidi BBM: pemerintah membantu bayar sebagian harga bensin",
+            "Subsidi listrik: pemerintah membantu bayar sebagian tagihan listrik",
+            "Subsidi pendidikan: pemerintah membantu bayar biaya sekolah"
+        ],
+        "related_concepts": ["bantuan", "pemerintah", "biaya", "diskon"]
+    },
+    "investasi": {
+        "definition": "Investasi adalah menanam uang untuk mendapat keuntungan di masa depan",
+        "simple_explanation": "Investasi seperti menanam pohon. Anda tanam uang sekarang, tunggu beberapa tahun, lalu dapat hasil yang lebih banyak.",
+        "examples": [
+            "Deposito: simpan uang di bank dengan bunga",
+            "Saham: beli bagian kecil dari perusahaan",
+            "Emas: beli emas untuk dijual lagi nanti"
+        ],
+        "related_concepts": ["keuntungan", "saham", "deposito", "emas"]
+    }
+}
 
 class TutorService:
-    def __init__(self):
-        self.knowledge_base = {
-            "asuransi": {
-                "definition": "Asuransi adalah perlindungan finansial yang memberikan bantuan saat terjadi hal buruk",
-                "simple_explanation": "Asuransi seperti payung saat hujan. Anda bayar sedikit setiap bulan, tapi jika terjadi kecelakaan atau sakit, asuransi akan membantu membayar biayanya.",
-                "examples": [
-                    "Asuransi kesehatan: membantu bayar biaya rumah sakit",
-                    "Asuransi mobil: membantu bayar kerusakan mobil",
-                    "Asuransi jiwa: memberikan uang untuk keluarga jika terjadi hal buruk"
-                ],
-                "related_concepts": ["perlindungan", "premi", "klaim", "polis"]
-            },
-            "subsidi": {
-                "definition": "Subsidi adalah bantuan uang dari pemerintah untuk mengurangi biaya",
-                "simple_explanation": "Subsidi seperti diskon dari pemerintah. Pemerintah membantu membayar sebagian biaya supaya masyarakat tidak perlu bayar mahal.",
-                "examples": [
-                    "Subsidi BBM: pemerintah membantu bayar sebagian harga bensin",
-                    "Subsidi listrik: pemerintah membantu bayar sebagian tagihan listrik",
-                    "Subsidi pendidikan: pemerintah membantu bayar biaya sekolah"
-                ],
-                "related_concepts": ["bantuan", "pemerintah", "biaya", "diskon"]
-            },
-            "investasi": {
-                "definition": "Investasi adalah menanam uang untuk mendapat keuntungan di masa depan",
-                "simple_explanation": "Investasi seperti menanam pohon. Anda tanam uang sekarang, tunggu beberapa tahun, lalu dapat hasil yang lebih banyak.",
-                "examples": [
-                    "Deposito: simpan uang di bank dengan bunga",
-                    "Saham: beli bagian kecil dari perusahaan",
-                    "Emas: beli emas untuk dijual lagi nanti"
-                ],
-                "related_concepts": ["keuntungan", "saham", "deposito", "emas"]
-            }
-        }
+    def __init__(self, knowledge_path: str = KNOWLEDGE_DB_PATH):
+        # Knowledge base di SQLite (read-only, dipakai bersama semua worker)
+        if not os.path.exists(knowledge_path):
+            count = build_snapshot(SEED_KNOWLEDGE.items(), knowledge_path)
+            print(f"Created knowledge base with {count} concepts at {knowledge_path}")
+        self.knowledge_base = KnowledgeStore(knowledge_path)
+        
+        # Indeks nama konsep dan indeks BM25 di memori, disamakan dengan snapshot knowledge base
+        self.concept_index = ConceptIndex()
+        self.concept_ranker = ConceptRanker()
+        # Indeks vektor untuk pertanyaan yang memparafrasekan konsep tanpa menyebut namanya
+        self.embedder = HashedNgramEmbedder()
+        self.vector_index = IVFIndex(self.embedder.dim)
+        self._vector_concepts: List[str] = []
+        self._vector_ids: Dict[str, int] = {}
+        self._index_snapshot = 0
+        self._index_data_version: Optional[int] = None
+        self._index_revision = 0
+        self._index_lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+        self._rebuild_thread: Optional[threading.Thread] = None
+        # Pertanyaan kanonik -> (konsep, confidence) dan (konsep, user_level) -> jawaban jadi
+        self.question_cache = ResultCache.from_env("TUTOR_QUESTION_CACHE", table="tutor_question_cache", max_entries=16384)
+        self.answer_cache = ResultCache.from_env("TUTOR_ANSWER_CACHE", table="tutor_answer_cache", max_entries=4096)
+        self._answer_levels = set()
+        # Naik setiap kali cache dibatalkan; jawaban yang dihitung sebelumnya tidak disimpan
+        self._cache_generation = 0
+        self.ingestion_jobs: Dict[str, IngestionJob] = {}
+        self._ingestion_lock = threading.Lock()
+        self._sync_indexes()
     
     async def answer_question(
         self, 
@@ -47,38 +131,62 @@ class TutorService:
         Menjawab pertanyaan pengguna dengan penjelasan sederhana
         """
         try:
-            # Extract key terms from question
-            key_terms = self._extract_key_terms(question)
-            
-            # Find relevant knowledge
-            knowledge = self._find_relevant_knowledge(key_terms)
-            
-            # Generate answer
-            answer = await self._generate_answer(question, knowledge, user_level)
+            generation = self._cache_generation
             
-            # Generate explanation
-            explanation = self._generate_explanation(knowledge, user_level)
+            # Pertanyaan dengan kata-kata berbeda untuk konsep yang sama memakai entri cache yang sama
+            templated, topic = self._normalize_question(question)
+            question_key = make_cache_key("tutor-question", templated, topic)
+            resolved = self.question_cache.get(question_key)
+            knowledge = None
+            if resolved is None:
+                # Extract key terms from question
+                key_terms = [topic] if templated else self._extract_key_terms(topic)
+                
+                # Find relevant knowledge (confidence dari probe indeks yang sama); indeks
+                # disamakan dengan knowledge base di thread, bukan di event loop
+                generation, concept, knowledge, confidence_score = await run_cpu_bound(
+                    self._resolve_question, key_terms, topic
+                )
+                if generation == self._cache_generation:
+                    self.question_cache.set(question_key, [concept, confidence_score])
+            else:
+                concept, confidence_score = resolved
             
-            # Get examples
-            examples = knowledge.get("examples", [])
+            answer_key = make_cache_key("tutor-answer", concept, user_level)
+            rendered = self.answer_cache.get(answer_key)
+            if rendered is None:
+                if knowledge is None and concept:
+                    # Query SQLite di thread, bukan di event loop
+                    knowledge = await run_cpu_bound(self.knowledge_base.get, concept)
+                knowledge = knowledge or DEFAULT_KNOWLEDGE
+                rendered = {
+                    "answer": await self._generate_answer(question, knowledge, user_level),
+                    "explanation": self._generate_explanation(knowledge, user_level),
+                    "examples": knowledge.get("examples", []),
+                    "related_concepts": knowledge.get("related_concepts", [])
+                }
+                cacheable_level = user_level in self._answer_levels or len(self._answer_levels) < MAX_CACHED_LEVELS
+                if generation == self._cache_generation and cacheable_level:
+                    self._answer_levels.add(user_level)
+                    self.answer_cache.set(answer_key, rendered)
             
-            # Get related concepts
-            related_concepts = knowledge.get("related_concepts", [])
-            
-            # Calculate confidence score
-            confidence_score = self._calculate_confidence(key_terms, knowledge)
-            
-            return {
-                "answer": answer,
-                "explanation": explanation,
-                "examples": examples,
-                "related_concepts": related_concepts,
-                "confidence_score": confidence_score
-            }
+            return dict(rendered, confidence_score=confidence_score)
             
         except Exception as e:
             return await self._fallback_answer(question, user_level)
     
+    def _normalize_question(self, question: str) -> Tuple[bool, str]:
+        """
+        Bentuk kanonik pertanyaan: huruf kecil, tanpa tanda baca dan spasi ganda.
+        Jika memakai pola seperti "apa itu X?", hanya X yang dipakai (templated=True),
+        sehingga "Apa itu asuransi?" dan "jelaskan asuransi ?" menjadi kunci yang sama.
+        """
+        text = " ".join(QUESTION_WORD_PATTERN.findall(question.lower()))
+        match = QUESTION_TEMPLATE.search(text)
+        if match:
+            return True, match.group(1)
+        return False, text
+    
     def _extract_key_terms(self, question: str) -> List[str]:
         """Extract key terms dari pertanyaan"""
         
@@ -106,29 +214,261 @@ class TutorService:
         
         return key_terms
     
-    def _find_relevant_knowledge(self, key_terms: List[str]) -> Dict[str, Any]:
-        """Find relevant knowledge berdasarkan key terms"""
+    def _resolve_question(
+        self, key_terms: List[str], question: str = ""
+    ) -> Tuple[int, Optional[str], Dict[str, Any], float]:
+        """
+        Sinkronkan indeks lalu cari knowledge; generasi cache diambil setelah sinkronisasi
+        agar hasil tidak disimpan jika cache dibatalkan di tengah pencarian.
+        """
+        self._sync_indexes()
+        generation = self._cache_generation
+        return (generation, *self._find_relevant_knowledge(key_terms, question))
+    
+    def _find_relevant_knowledge(
+        self, key_terms: List[str], question: str = ""
+    ) -> Tuple[Optional[str], Dict[str, Any], float]:
+        """
+        Find relevant knowledge berdasarkan key terms: (konsep, knowledge, confidence);
+        konsep None jika yang dipakai knowledge default.
+        Nama konsep yang persis sama langsung dipakai; selain itu konsep diurutkan
+        dengan BM25, lalu kecocokan sebagian/salah ketik pada nama, lalu kemiripan
+        embedding seluruh pertanyaan sebagai cadangan terakhir.
+        Selama indeks untuk snapshot baru masih dibangun, indeks FTS5 snapshot itu
+        dipakai lebih dulu agar konsep baru sudah bisa ditemukan.
+        Indeks disamakan oleh pemanggil (_resolve_question).
+        """
         
-        for term in key_terms:
-            term_clean = term.strip().lower()
-            if term_clean in self.knowledge_base:
-                return self.knowledge_base[term_clean]
+        if self.knowledge_base.snapshot_version != self._index_snapshot:
+            found = self._search_snapshot(key_terms, question)
+            if found is not None:
+                return found
         
-        # If no exact match, try partial matching
-        for term in key_terms:
-            term_clean = term.strip().lower()
-            for concept, knowledge in self.knowledge_base.items():
-                if term_clean in concept or concept in term_clean:
-                    return knowledge
+        match = self.concept_index.lookup(key_terms)
+        if match is not None and match[1] == MATCH_EXACT:
+            knowledge = self.knowledge_base.get(match[0])
+            if knowledge is not None:
+                return match[0], knowledge, self._calculate_confidence(key_terms, MATCH_EXACT)
+        
+        for concept, _, confidence in self._rank_concepts(" ".join(key_terms), top_k=1):
+            knowledge = self.knowledge_base.get(concept)
+            if knowledge is not None:
+                return concept, knowledge, confidence
+        
+        if match is not None:
+            concept, match_type = match
+            knowledge = self.knowledge_base.get(concept)
+            if knowledge is not None:
+                return concept, knowledge, self._calculate_confidence(key_terms, match_type)
+        
+        for concept, similarity in self._semantic_search(question or " ".join(key_terms), top_k=1):
+            knowledge = self.knowledge_base.get(concept)
+            if knowledge is not None and similarity >= SEMANTIC_MIN_SIMILARITY:
+                return concept, knowledge, round(SEMANTIC_CONFIDENCE * similarity, 4)
         
         # Return default knowledge
+        return None, DEFAULT_KNOWLEDGE, self._calculate_confidence(key_terms, None)
+    
+    def _search_snapshot(
+        self, key_terms: List[str], question: str = ""
+    ) -> Optional[Tuple[str, Dict[str, Any], float]]:
+        """Nama konsep persis, lalu pencarian FTS5 (BM25 SQLite) di snapshot yang aktif"""
+        for term in key_terms:
+            concept = term.strip().lower()
+            knowledge = self.knowledge_base.get(concept)
+            if knowledge is not None:
+                return concept, knowledge, self._calculate_confidence(key_terms, MATCH_EXACT)
+        for concept, _ in self.knowledge_base.search(" ".join(key_terms) or question, limit=1):
+            knowledge = self.knowledge_base.get(concept)
+            if knowledge is not None:
+                return concept, knowledge, FULL_TEXT_CONFIDENCE
+        return None
+    
+    def _rank_concepts(self, query: str, top_k: int) -> List[Tuple[str, float, float]]:
+        """(konsep, skor BM25, confidence); confidence = skor relatif terhadap skor maksimum query"""
+        results = self.concept_ranker.search(query, top_k=top_k)
+        if not results:
+            return []
+        max_score = self.concept_ranker.max_score(query)
+        return [
+            (concept, score, round(RANKED_CONFIDENCE * min(1.0, score / max_score), 4))
+            for concept, score in results
+        ]
+    
+    def _semantic_search(self, text: str, top_k: int) -> List[Tuple[str, float]]:
+        """(konsep, cosine similarity) terdekat dengan embedding teks"""
+        if not SEMANTIC_SEARCH or not text.strip():
+            return []
+        results = self.vector_index.search(self.embedder.embed(text), k=top_k)
+        return [(self._vector_concepts[vector_id], similarity) for vector_id, similarity in results]
+    
+    def _semantic_text(self, concept: str, knowledge: Dict[str, Any]) -> str:
+        return " ".join([concept, knowledge.get("definition", "")] + knowledge.get("related_concepts", []))
+    
+    def _build_indexes(self, rows: Iterable[Tuple[int, str, Dict[str, Any]]], count: int = 0) -> Dict[str, Any]:
+        """
+        Bangun indeks nama, BM25, dan vektor dari isi snapshot dalam satu kali baca,
+        tanpa memuat semua knowledge ke memori. `count` (perkiraan jumlah konsep)
+        dipakai untuk mengalokasikan matriks embedding sekali saja.
+        Hasilnya dipasang dengan _install_indexes.
+        """
+        concept_index = ConceptIndex()
+        concepts: List[str] = []
+        vectors = np.zeros((count if SEMANTIC_SEARCH else 0, self.embedder.dim), dtype=np.float32)
+        texts: List[str] = []
+        revision = 0
+        
+        def embed_pending():
+            nonlocal vectors
+            end = len(concepts)
+            if end > len(vectors):
+                grown = np.zeros((max(end, 2 * len(vectors)), self.embedder.dim), dtype=np.float32)
+                grown[:len(vectors)] = vectors
+                vectors = grown
+            vectors[end - len(texts):end] = self.embedder.embed_batch(texts)
+            texts.clear()
+        
+        def entries():
+            nonlocal revision
+            for row_revision, concept, knowledge in rows:
+                concept_index.add(concept)
+                concepts.append(concept)
+                revision = max(revision, row_revision)
+                if SEMANTIC_SEARCH:
+                    texts.append(self._semantic_text(concept, knowledge))
+                    if len(texts) >= EMBED_BATCH_SIZE:
+                        embed_pending()
+                yield concept, knowledge
+        
+        concept_ranker = ConceptRanker(entries())
+        if texts:
+            embed_pending()
+        vector_index = IVFIndex(self.embedder.dim)
+        if SEMANTIC_SEARCH and concepts:
+            vector_index.build(vectors[:len(concepts)], np.arange(len(concepts)))
         return {
-            "definition": "Konsep yang Anda tanyakan belum tersedia dalam database kami",
-            "simple_explanation": "Maaf, saya belum bisa menjelaskan konsep ini. Silakan coba dengan kata kunci yang berbeda.",
-            "examples": [],
-            "related_concepts": []
+            "concept_index": concept_index,
+            "concept_ranker": concept_ranker,
+            "vector_index": vector_index,
+            "vector_concepts": concepts,
+            "revision": revision
         }
     
+    def _install_indexes(self, indexes: Dict[str, Any], snapshot: int, data_version: int):
+        """Pasang indeks hasil _build_indexes; dipanggil sambil memegang _index_lock"""
+        self._invalidate_answers(None)
+        self.concept_index = indexes["concept_index"]
+        self.concept_ranker = indexes["concept_ranker"]
+        self.vector_index = indexes["vector_index"]
+        self._vector_concepts = indexes["vector_concepts"]
+        self._vector_ids = {concept: vector_id for vector_id, concept in enumerate(self._vector_concepts)}
+        self._index_snapshot = snapshot
+        self._index_revision = indexes["revision"]
+        self._index_data_version = data_version
+    
+    def _add_vector(self, concept: str, knowledge: Dict[str, Any]):
+        old_id = self._vector_ids.get(concept)
+        if old_id is not None:
+            self.vector_index.remove(old_id)
+        vector_id = len(self._vector_concepts)
+        self._vector_concepts.append(concept)
+        self._vector_ids[concept] = vector_id
+        if SEMANTIC_SEARCH:
+            self.vector_index.add(self.embedder.embed(self._semantic_text(concept, knowledge)), vector_id)
+    
+    def _invalidate_answers(self, concepts: Optional[List[str]]):
+        """
+        Batalkan cache jawaban untuk konsep yang berubah (None = semua, saat snapshot diganti).
+        Konsep baru bisa mengubah hasil resolusi pertanyaan mana pun, jadi cache pertanyaan
+        selalu dikosongkan.
+        """
+        self._cache_generation += 1
+        self.question_cache.clear()
+        if concepts is None:
+            self.answer_cache.clear()
+            return
+        for concept in concepts:
+            for user_level in list(self._answer_levels):
+                self.answer_cache.invalidate(make_cache_key("tutor-answer", concept, user_level))
+    
+    def search_concepts(self, question: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        """Konsep paling relevan untuk pertanyaan, diurutkan dengan skor BM25"""
+        self._sync_indexes()
+        results = []
+        for concept, score, confidence in self._rank_concepts(question, top_k):
+            knowledge = self.knowledge_base.get(concept)
+            if knowledge is not None:
+                results.append({
+                    "concept": concept,
+                    "score": score,
+                    "confidence": confidence,
+                    "definition": knowledge["definition"]
+                })
+        return results
+    
+    def _sync_indexes(self):
+        """
+        Samakan indeks nama konsep, indeks BM25, dan indeks vektor dengan knowledge base.
+        Snapshot baru (CLI, ingestion di worker lain): semua indeks dibangun ulang di
+        thread latar belakang lalu ditukar, sementara request tetap memakai indeks lama.
+        Perubahan lewat add_knowledge (di worker mana pun) ditambahkan secara inkremental.
+        """
+        store = self.knowledge_base
+        data_version = store.data_version()
+        snapshot = store.snapshot_version
+        if snapshot == self._index_snapshot and data_version == self._index_data_version:
+            return
+        if snapshot != self._index_snapshot and self._index_snapshot != 0:
+            self._start_rebuild()
+            return
+        if not self._index_lock.acquire(blocking=self._index_snapshot == 0):
+            return
+        try:
+            if snapshot != self._index_snapshot:
+                # Pembangunan pertama (saat service dibuat)
+                indexes = self._build_indexes(store.iter_changes(-1), count=len(store))
+                self._install_indexes(indexes, snapshot, data_version)
+            else:
+                rows = store.changes_since(self._index_revision)
+                for revision, concept, knowledge in rows:
+                    self.concept_index.add(concept)
+                    self.concept_ranker.add(concept, knowledge)
+                    self._add_vector(concept, knowledge)
+                    self._index_revision = revision
+                self._index_data_version = data_version
+                if rows:
+                    self._invalidate_answers([concept for _, concept, _ in rows])
+        finally:
+            self._index_lock.release()
+    
+    def _start_rebuild(self):
+        """Mulai membangun ulang indeks untuk snapshot baru, kecuali sudah ada yang berjalan"""
+        with self._rebuild_lock:
+            if self._rebuild_thread is not None and self._rebuild_thread.is_alive():
+                return
+            self._rebuild_thread = threading.Thread(target=self._rebuild_indexes, name="tutor-index-rebuild", daemon=True)
+            self._rebuild_thread.start()
+    
+    def _rebuild_indexes(self):
+        store = self.knowledge_base
+        try:
+            # Versi diambil sebelum membaca baris: jika snapshot berganti lagi selama
+            # pembangunan, indeks terpasang dengan versi lama dan dibangun ulang lagi
+            data_version = store.data_version()
+            snapshot = store.snapshot_version
+            if snapshot <= self._index_snapshot:
+                return
+            start_time = time.perf_counter()
+            indexes = self._build_indexes(store.iter_changes(-1), count=len(store))
+            with self._index_lock:
+                # Ingestion di worker ini mungkin sudah memasang snapshot yang lebih baru
+                if snapshot > self._index_snapshot:
+                    self._install_indexes(indexes, snapshot, data_version)
+            print(f"Rebuilt tutor indexes for knowledge snapshot {snapshot} "
+                  f"({len(indexes['vector_concepts'])} concepts) in {time.perf_counter() - start_time:.2f}s")
+        except Exception as e:
+            print(f"Error rebuilding tutor indexes: {e}")
+    
     async def _generate_answer(self, question: str, knowledge: Dict[str, Any], user_level: str) -> str:
         """Generate answer berdasarkan knowledge dan user level"""
         
@@ -150,27 +490,12 @@ class TutorService:
         else:
             return simple_explanation
     
-    def _calculate_confidence(self, key_terms: List[str], knowledge: Dict[str, Any]) -> float:
-        """Calculate confidence score untuk jawaban"""
+    def _calculate_confidence(self, key_terms: List[str], match_type: Optional[str]) -> float:
+        """Calculate confidence score dari jenis kecocokan konsep"""
         
         if not key_terms:
-            return 0.3
-        
-        # Check if we have exact match
-        for term in key_terms:
-            term_clean = term.strip().lower()
-            if term_clean in self.knowledge_base:
-                return 0.9
-        
-        # Check if we have partial match
-        for term in key_terms:
-            term_clean = term.strip().lower()
-            for concept in self.knowledge_base.keys():
-                if term_clean in concept or concept in term_clean:
-                    return 0.7
-        
-        # No match found
-        return 0.2
+            return NO_TERMS_CONFIDENCE
+        return MATCH_CONFIDENCE.get(match_type, NO_MATCH_CONFIDENCE)
     
     async def _fallback_answer(self, question: str, user_level: str) -> Dict[str, Any]:
         """Fallback answer jika terjadi error"""
@@ -186,9 +511,91 @@ class TutorService:
     def add_knowledge(self, concept: str, knowledge: Dict[str, Any]):
         """Add new knowledge to the knowledge base"""
         
-        self.knowledge_base[concept.lower()] = knowledge
+        self.knowledge_base.put(concept, knowledge)
+        self._sync_indexes()
+    
+    def start_ingestion(
+        self,
+        source: str,
+        size_bytes: int = 0,
+        merge: bool = False,
+        name: Optional[str] = None,
+        remove_source: bool = False
+    ) -> IngestionJob:
+        """
+        Mulai ingestion file JSONL di thread latar belakang; status dibaca lewat get_ingestion_job.
+        Hanya satu ingestion yang boleh berjalan sekaligus.
+        """
+        with self._ingestion_lock:
+            for job in self.ingestion_jobs.values():
+                if job.running:
+                    raise IngestionBusyError(job.job_id)
+            job = IngestionJob(source, size_bytes, merge=merge, name=name)
+            self.ingestion_jobs[job.job_id] = job
+            while len(self.ingestion_jobs) > MAX_INGESTION_JOBS:
+                del self.ingestion_jobs[next(iter(self.ingestion_jobs))]
+        
+        threading.Thread(
+            target=self.ingest_knowledge,
+            args=(job, remove_source),
+            name=f"ingest-{job.job_id[:8]}",
+            daemon=True
+        ).start()
+        return job
+    
+    def ingest_knowledge(self, job: IngestionJob, remove_source: bool = False):
+        """
+        Tulis snapshot baru dari file JSONL, bangun semua indeks untuk snapshot itu,
+        lalu pasang file dan indeks sekaligus. Sampai saat itu request tetap dijawab
+        dari snapshot dan indeks lama, tidak pernah dari keadaan setengah jadi.
+        Perubahan lewat add_knowledge selama ingestion tidak ikut ke snapshot baru.
+        """
+        store = self.knowledge_base
+        temp_path = None
+        job.start()
+        try:
+            temp_path = load_snapshot(job.source, store.path, job, store if job.merge else None)
+            job.set_phase(PHASE_INDEXING)
+            staged = KnowledgeStore(temp_path)
+            indexes = self._build_indexes(staged.iter_changes(-1), count=len(staged))
+            
+            job.set_phase(PHASE_SWAPPING)
+            with self._index_lock:
+                os.replace(temp_path, store.path)
+                store.reload()
+                self._install_indexes(indexes, store.snapshot_version, store.data_version())
+            job.finish(job.concepts)
+            stats = job.to_dict()
+            print(f"Ingested {stats['concepts']} concepts from {job.name} in {stats['elapsed_seconds']}s "
+                  f"({stats['rejected']} rejected lines)")
+        except Exception as e:
+            job.fail(e)
+            print(f"Ingestion {job.job_id} failed: {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+        finally:
+            if remove_source and os.path.exists(job.source):
+                os.remove(job.source)
+    
+    def get_ingestion_job(self, job_id: str) -> Optional[IngestionJob]:
+        return self.ingestion_jobs.get(job_id)
     
     def get_available_concepts(self) -> List[str]:
         """Get list of available concepts"""
         
         return list(self.knowledge_base.keys())
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit rate cache pertanyaan kanonik dan cache jawaban per (konsep, user_level)"""
+        return {
+            "questions": self.question_cache.get_stats(),
+            "answers": self.answer_cache.get_stats()
+        }
+    
+    def get_knowledge_stats(self) -> Dict[str, Any]:
+        """Snapshot knowledge base yang aktif dan ukuran indeks nama konsep"""
+        stats = self.knowledge_base.get_stats()
+        stats["indexed_concepts"] = len(self.concept_index)
+        stats["ranker"] = self.concept_ranker.get_stats()
+        stats["vectors"] = self.vector_index.get_stats()
+        return stats
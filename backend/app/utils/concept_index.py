@@ -0,0 +1,188 @@
+"""
+Indeks nama konsep untuk TutorService.
+
+- exact   : hash map nama konsep -> id (urutan penambahan)
+- partial : istilah yang merupakan bagian nama konsep dicari lewat irisan posting
+            list trigram; nama konsep di dalam istilah dicari dengan mencoba semua
+            substring istilah di hash map (biaya tergantung panjang istilah, bukan jumlah konsep)
+- fuzzy   : salah ketik ditoleransi dengan menghitung trigram bersama lalu
+            memverifikasi kandidat terbaik dengan jarak edit
+"""
+from array import array
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+NGRAM_SIZE = 3
+# Minimal proporsi trigram bersama (koefisien Dice) sebelum jarak edit dihitung
+FUZZY_MIN_SIMILARITY = 0.4
+# Jumlah kandidat fuzzy terbaik yang diverifikasi dengan jarak edit
+FUZZY_CANDIDATES = 16
+FUZZY_MIN_LENGTH = 4
+
+MATCH_EXACT = "exact"
+MATCH_PARTIAL = "partial"
+MATCH_FUZZY = "fuzzy"
+
+
+def ngrams(text: str, padded: bool = False) -> List[str]:
+    """Trigram karakter; `padded` menambah spasi di awal dan akhir untuk pencarian fuzzy"""
+    if padded:
+        text = f" {text} "
+    return [text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)]
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Jarak Levenshtein; berhenti lebih awal dan mengembalikan limit + 1 jika melebihi batas"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def max_typos(term: str) -> int:
+    return 1 if len(term) <= 6 else 2
+
+
+class ConceptIndex:
+    """Pencarian konsep dengan waktu sublinear terhadap jumlah konsep"""
+
+    def __init__(self, concepts: Iterable[str] = ()):
+        self.concepts: List[str] = []
+        self.ids: Dict[str, int] = {}
+        # Posting list trigram tanpa padding (substring) dan dengan padding (fuzzy)
+        self._postings: Dict[str, array] = {}
+        self._padded_postings: Dict[str, array] = {}
+        self._padded_sizes = array("H")
+        self._lengths = set()
+        # add() memperbesar posting list yang mungkin sedang dibaca lookup() di thread lain
+        self._lock = threading.Lock()
+        for concept in concepts:
+            self.add(concept)
+
+    def __len__(self) -> int:
+        return len(self.concepts)
+
+    def __contains__(self, concept: str) -> bool:
+        return concept in self.ids
+
+    def add(self, concept: str) -> int:
+        """Tambah konsep (huruf kecil); konsep yang sudah ada tidak diindeks ulang"""
+        with self._lock:
+            return self._add(concept)
+
+    def _add(self, concept: str) -> int:
+        concept_id = self.ids.get(concept)
+        if concept_id is not None:
+            return concept_id
+        concept_id = len(self.concepts)
+        self.concepts.append(concept)
+        self.ids[concept] = concept_id
+        self._lengths.add(len(concept))
+        for gram in set(ngrams(concept)):
+            self._postings.setdefault(gram, array("I")).append(concept_id)
+        padded = set(ngrams(concept, padded=True))
+        for gram in padded:
+            self._padded_postings.setdefault(gram, array("I")).append(concept_id)
+        self._padded_sizes.append(min(len(padded), 0xFFFF))
+        return concept_id
+
+    def lookup(self, terms: List[str]) -> Optional[Tuple[str, str]]:
+        """
+        Konsep terbaik untuk istilah-istilah pertanyaan beserta jenis kecocokannya.
+        Urutan prioritas sama dengan pencarian linear lama: kecocokan persis untuk
+        istilah mana pun, lalu kecocokan sebagian (konsep yang paling awal ditambahkan),
+        lalu salah ketik.
+        """
+        with self._lock:
+            return self._lookup(terms)
+
+    def _lookup(self, terms: List[str]) -> Optional[Tuple[str, str]]:
+        cleaned = [term.strip().lower() for term in terms]
+        for term in cleaned:
+            if term in self.ids:
+                return term, MATCH_EXACT
+
+        for term in cleaned:
+            candidates = self._partial_candidates(term)
+            if candidates:
+                return self.concepts[min(candidates)], MATCH_PARTIAL
+
+        for term in cleaned:
+            concept = self._fuzzy_match(term)
+            if concept is not None:
+                return concept, MATCH_FUZZY
+        return None
+
+    def _partial_candidates(self, term: str) -> List[int]:
+        if not term:
+            return []
+        candidates = []
+
+        # Nama konsep yang muncul di dalam istilah (misalnya "asuransi kesehatan")
+        for length in self._lengths:
+            for start in range(len(term) - length + 1):
+                concept_id = self.ids.get(term[start:start + length])
+                if concept_id is not None:
+                    candidates.append(concept_id)
+
+        # Istilah yang merupakan bagian nama konsep: irisan posting list, mulai dari yang terpendek
+        grams = set(ngrams(term))
+        if grams:
+            postings = [self._postings.get(gram) for gram in grams]
+            if all(postings):
+                postings.sort(key=len)
+                shared = np.frombuffer(postings[0], dtype=np.uint32)
+                for posting in postings[1:]:
+                    shared = np.intersect1d(shared, np.frombuffer(posting, dtype=np.uint32), assume_unique=True)
+                    if len(shared) == 0:
+                        break
+                candidates.extend(
+                    int(concept_id) for concept_id in shared
+                    if term in self.concepts[concept_id]
+                )
+        return candidates
+
+    def _fuzzy_match(self, term: str) -> Optional[str]:
+        if len(term) < FUZZY_MIN_LENGTH:
+            return None
+        grams = set(ngrams(term, padded=True))
+        postings = [
+            np.frombuffer(self._padded_postings[gram], dtype=np.uint32)
+            for gram in grams if gram in self._padded_postings
+        ]
+        if not postings:
+            return None
+
+        concept_ids, shared = np.unique(np.concatenate(postings), return_counts=True)
+        sizes = np.frombuffer(self._padded_sizes, dtype=np.uint16)[concept_ids]
+        similarity = 2.0 * shared / (len(grams) + sizes)
+        keep = similarity >= FUZZY_MIN_SIMILARITY
+        concept_ids, similarity = concept_ids[keep], similarity[keep]
+        if len(concept_ids) == 0:
+            return None
+
+        # Kandidat paling mirip diverifikasi dengan jarak edit (seri: konsep paling awal)
+        order = np.lexsort((concept_ids, -similarity))[:FUZZY_CANDIDATES]
+        limit = max_typos(term)
+        best = None
+        for concept_id in concept_ids[order].tolist():
+            concept = self.concepts[concept_id]
+            distance = edit_distance(term, concept, limit)
+            if distance <= limit and (best is None or distance < best[0]):
+                best = (distance, concept)
+                if distance == 1:
+                    break
+        return best[1] if best else None
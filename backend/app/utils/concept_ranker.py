@@ -0,0 +1,242 @@
+"""
+Ranking konsep tutor dengan BM25 di atas matriks term-dokumen sparse (SciPy).
+
+Setiap dokumen adalah satu konsep: nama (diberi bobot lebih), definisi, penjelasan
+sederhana, dan related_concepts. Bobot BM25 per (dokumen, term) dihitung di muka
+ke matriks CSC, jadi satu query hanya menjumlahkan beberapa kolom.
+
+Konsep baru masuk ke bagian delta kecil tanpa membangun ulang matriks utama.
+Delta digabung ke matriks utama (tanpa tokenisasi ulang) jika sudah cukup besar;
+saat itu juga panjang rata-rata dokumen diperbarui dan dokumen lama yang sudah
+diganti dibuang.
+"""
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Token nama konsep diulang agar kecocokan pada nama lebih berbobot
+NAME_BOOST = 3
+# Delta digabung jika lebih besar dari batas ini atau dari proporsi dokumen utama
+COMPACT_MIN_ROWS = 1024
+COMPACT_RATIO = 0.1
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def document_tokens(concept: str, knowledge: Dict[str, Any]) -> List[str]:
+    tokens = tokenize(concept) * NAME_BOOST
+    tokens.extend(tokenize(knowledge.get("definition", "")))
+    tokens.extend(tokenize(knowledge.get("simple_explanation", "")))
+    for related in knowledge.get("related_concepts", []):
+        tokens.extend(tokenize(related))
+    return tokens
+
+
+class ConceptRanker:
+    """Indeks BM25 konsep dengan penambahan inkremental"""
+
+    def __init__(self, entries: Iterable[Tuple[str, Dict[str, Any]]] = (), k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self.vocabulary: Dict[str, int] = {}
+        self.concepts: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self._df = np.zeros(0, dtype=np.int64)
+        self._lengths = np.zeros(0, dtype=np.float64)
+        self._alive = np.zeros(0, dtype=bool)
+
+        # Matriks utama: frekuensi term (CSR, untuk membaca baris) dan bobot BM25 (CSC, untuk query)
+        self._main_tf = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self._main_weights = sparse.csc_matrix((0, 0), dtype=np.float32)
+        self._avgdl = 1.0
+        # Delta: (kolom, frekuensi) per dokumen setelah matriks utama dibangun
+        self._delta: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._delta_weights: Optional[sparse.csc_matrix] = None
+        # add() dan compact() mengganti beberapa array sekaligus; search() tidak boleh melihat setengahnya
+        self._lock = threading.Lock()
+
+        self._build(entries)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _term_counts(self, concept: str, knowledge: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        counts = Counter(document_tokens(concept, knowledge))
+        columns = []
+        for term in counts:
+            column = self.vocabulary.get(term)
+            if column is None:
+                column = self.vocabulary[term] = len(self.vocabulary)
+            columns.append(column)
+        return (
+            np.fromiter(columns, dtype=np.int64, count=len(columns)),
+            np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        )
+
+    def _build(self, entries: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Bangun matriks utama sekaligus dari semua entri"""
+        indptr = [0]
+        indices: List[np.ndarray] = []
+        data: List[np.ndarray] = []
+        for concept, knowledge in entries:
+            self.rows[concept] = len(self.concepts)
+            self.concepts.append(concept)
+            columns, counts = self._term_counts(concept, knowledge)
+            indices.append(columns)
+            data.append(counts)
+            indptr.append(indptr[-1] + len(columns))
+
+        rows = len(self.concepts)
+        tf = sparse.csr_matrix(
+            (
+                np.concatenate(data) if data else np.zeros(0, dtype=np.float32),
+                np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64),
+                np.array(indptr, dtype=np.int64)
+            ),
+            shape=(rows, len(self.vocabulary))
+        )
+        # Konsep yang muncul lebih dari sekali: hanya entri terakhir yang dipakai
+        self._alive = np.zeros(rows, dtype=bool)
+        self._alive[np.fromiter(self.rows.values(), dtype=np.int64, count=len(self.rows))] = True
+        self._set_main(tf)
+
+    def _set_main(self, tf: sparse.csr_matrix):
+        """Pasang matriks utama baru dan hitung ulang df, panjang dokumen, dan bobot BM25"""
+        self._main_tf = tf
+        self._delta = []
+        self._delta_weights = None
+        self._lengths = np.asarray(tf.sum(axis=1)).ravel().astype(np.float64)
+        alive_tf = tf[self._alive] if not self._alive.all() else tf
+        self._df = np.bincount(alive_tf.indices, minlength=len(self.vocabulary)).astype(np.int64)
+        alive_lengths = self._lengths[self._alive]
+        self._avgdl = float(alive_lengths.mean()) if len(alive_lengths) else 1.0
+        self._main_weights = self._weights(tf, self._lengths).tocsc()
+
+    def _weights(self, tf: sparse.csr_matrix, lengths: np.ndarray) -> sparse.csr_matrix:
+        """Bagian BM25 yang bergantung pada dokumen: tf * (k1 + 1) / (tf + k1 * norm)"""
+        row_of = np.repeat(np.arange(tf.shape[0]), np.diff(tf.indptr))
+        norm = self.k1 * (1 - self.b + self.b * lengths[row_of] / self._avgdl)
+        data = tf.data * (self.k1 + 1) / (tf.data + norm)
+        return sparse.csr_matrix((data.astype(np.float32), tf.indices, tf.indptr), shape=tf.shape)
+
+    def add(self, concept: str, knowledge: Dict[str, Any]):
+        """Tambah atau ganti satu konsep tanpa membangun ulang matriks utama"""
+        with self._lock:
+            self._add(concept, knowledge)
+
+    def _add(self, concept: str, knowledge: Dict[str, Any]):
+        old_row = self.rows.get(concept)
+        if old_row is not None:
+            self._alive[old_row] = False
+            np.subtract.at(self._df, self._row_columns(old_row), 1)
+
+        columns, counts = self._term_counts(concept, knowledge)
+        if len(self._df) < len(self.vocabulary):
+            self._df = np.concatenate((self._df, np.zeros(len(self.vocabulary) - len(self._df), dtype=np.int64)))
+        np.add.at(self._df, columns, 1)
+
+        self.rows[concept] = len(self.concepts)
+        self.concepts.append(concept)
+        self._alive = np.append(self._alive, True)
+        self._lengths = np.append(self._lengths, counts.sum())
+        self._delta.append((columns, counts))
+        self._delta_weights = None
+
+        if len(self._delta) > max(COMPACT_MIN_ROWS, COMPACT_RATIO * self._main_tf.shape[0]):
+            self._compact()
+
+    def _row_columns(self, row: int) -> np.ndarray:
+        main_rows = self._main_tf.shape[0]
+        if row < main_rows:
+            start, end = self._main_tf.indptr[row], self._main_tf.indptr[row + 1]
+            return self._main_tf.indices[start:end]
+        return self._delta[row - main_rows][0]
+
+    def _delta_tf(self) -> sparse.csr_matrix:
+        indptr = np.cumsum([0] + [len(columns) for columns, _ in self._delta])
+        return sparse.csr_matrix(
+            (
+                np.concatenate([counts for _, counts in self._delta]),
+                np.concatenate([columns for columns, _ in self._delta]),
+                indptr
+            ),
+            shape=(len(self._delta), len(self.vocabulary))
+        )
+
+    def compact(self):
+        """Gabungkan delta ke matriks utama dan buang dokumen yang sudah diganti"""
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        main = self._main_tf
+        main = sparse.csr_matrix((main.data, main.indices, main.indptr), shape=(main.shape[0], len(self.vocabulary)))
+        tf = sparse.vstack([main, self._delta_tf()], format="csr") if self._delta else main
+        keep = np.flatnonzero(self._alive)
+        if len(keep) < tf.shape[0]:
+            tf = tf[keep]
+            self.concepts = [self.concepts[row] for row in keep]
+            self.rows = {concept: row for row, concept in enumerate(self.concepts)}
+        self._alive = np.ones(tf.shape[0], dtype=bool)
+        self._set_main(tf)
+
+    def _idf(self, columns: np.ndarray) -> np.ndarray:
+        documents = len(self.rows)
+        df = self._df[columns]
+        return np.log1p((documents - df + 0.5) / (df + 0.5))
+
+    def _query_columns(self, text: str) -> np.ndarray:
+        columns = [self.vocabulary[term] for term in dict.fromkeys(tokenize(text)) if term in self.vocabulary]
+        return np.array(columns, dtype=np.int64)
+
+    def max_score(self, text: str) -> float:
+        """Batas atas skor BM25 untuk query ini (dipakai untuk menormalkan skor ke 0..1)"""
+        with self._lock:
+            columns = self._query_columns(text)
+            return float(self._idf(columns).sum() * (self.k1 + 1)) if len(columns) else 0.0
+
+    def search(self, text: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Konsep dengan skor BM25 tertinggi untuk teks pertanyaan"""
+        with self._lock:
+            return self._search(text, top_k)
+
+    def _search(self, text: str, top_k: int) -> List[Tuple[str, float]]:
+        columns = self._query_columns(text)
+        if len(columns) == 0 or not self.rows:
+            return []
+        idf = self._idf(columns)
+
+        scores = np.zeros(len(self.concepts), dtype=np.float64)
+        main_rows, main_columns = self._main_weights.shape
+        in_main = columns < main_columns
+        if main_rows and in_main.any():
+            scores[:main_rows] = self._main_weights[:, columns[in_main]] @ idf[in_main]
+        if self._delta:
+            if self._delta_weights is None:
+                self._delta_weights = self._weights(self._delta_tf(), self._lengths[main_rows:]).tocsc()
+            scores[main_rows:] = self._delta_weights[:, columns] @ idf
+        scores[~self._alive] = 0.0
+
+        top_k = min(top_k, len(scores))
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self.concepts[row], float(scores[row])) for row in candidates if scores[row] > 0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "documents": len(self.rows),
+            "terms": len(self.vocabulary),
+            "main_rows": self._main_tf.shape[0],
+            "delta_rows": len(self._delta),
+            "nonzeros": int(self._main_weights.nnz)
+        }
@@ -0,0 +1,72 @@
+"""
+Embedding teks tanpa model dan tanpa jaringan: hashed n-gram.
+
+Fitur setiap teks adalah kata utuh dan n-gram karakter (3-5) dari setiap kata.
+Fitur di-hash (CRC32, stabil antar proses) ke salah satu dari `dim` dimensi dengan
+tanda +/-, ditimbang sublinear (1 + log tf), lalu dinormalkan L2 sehingga hasil
+kali titik sama dengan cosine similarity. N-gram karakter membuat kata berimbuhan
+(pemerintahan, pemerintah) tetap berdekatan.
+"""
+import os
+import re
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", 256))
+NGRAM_SIZES = (3, 4, 5)
+# Bobot kata utuh relatif terhadap satu n-gram karakter
+WORD_WEIGHT = 2.0
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=1 << 16)
+def _word_features(word: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Hash fitur satu kata (kata utuh + n-gram karakter) beserta jumlahnya"""
+    features: Counter = Counter()
+    features["w:" + word] += WORD_WEIGHT
+    padded = f" {word} "
+    for size in NGRAM_SIZES:
+        for start in range(len(padded) - size + 1):
+            features[padded[start:start + size]] += 1.0
+    hashes = np.fromiter(
+        (zlib.crc32(feature.encode("utf-8")) for feature in features),
+        dtype=np.uint32, count=len(features)
+    )
+    return hashes, np.fromiter(features.values(), dtype=np.float64, count=len(features))
+
+
+class HashedNgramEmbedder:
+    """Embedding float32 berdimensi tetap dari n-gram karakter yang di-hash"""
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self.dim = dim
+
+    def _slots(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Dimensi dan bobot bertanda untuk setiap fitur unik teks"""
+        words = WORD_PATTERN.findall(text.lower())
+        if not words:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        parts = [_word_features(word) for word in words]
+        # Fitur yang sama dari kata berbeda (n-gram bersama) dijumlahkan sebelum 1 + log(tf)
+        hashes, inverse = np.unique(np.concatenate([part[0] for part in parts]), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate([part[1] for part in parts]))
+        signs = np.where(hashes & 0x80000000, -1.0, 1.0)
+        return (hashes % self.dim).astype(np.int64), (signs * (1.0 + np.log(counts))).astype(np.float32)
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Matriks (len(texts), dim) float32 yang kontigu, setiap baris ber-norma 1 (atau nol)"""
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            slots, weights = self._slots(text)
+            vectors[row] = np.bincount(slots, weights=weights, minlength=self.dim)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
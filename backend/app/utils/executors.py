@@ -0,0 +1,185 @@
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class ExecutorBusyError(Exception):
+    """Antrian endpoint penuh; request ditolak agar server tidak kelebihan beban"""
+
+    def __init__(self, name: str, queue_depth: int):
+        self.name = name
+        self.queue_depth = queue_depth
+        super().__init__(f"Endpoint '{name}' is busy ({queue_depth} requests waiting)")
+
+
+class ExecutorLane:
+    """
+    Batas concurrency per endpoint dengan antrian terbatas.
+    Request di atas max_concurrency menunggu; jika antrian sudah max_queue, request ditolak.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.active = 0
+        self.waiting = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def acquire(self):
+        semaphore = self._get_semaphore()
+        if semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise ExecutorBusyError(self.name, self.waiting)
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+
+    def release(self):
+        self.active -= 1
+        self.completed += 1
+        self._semaphore.release()
+
+    async def slot(self):
+        """Dependency FastAPI: tahan satu slot selama request diproses"""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "queue_depth": self.waiting,
+            "completed": self.completed,
+            "rejected": self.rejected
+        }
+
+
+_lanes: Dict[str, ExecutorLane] = {}
+
+
+def get_lane(name: str, max_concurrency: Optional[int] = None, max_queue: int = 64) -> ExecutorLane:
+    """Ambil lane endpoint; batas bisa diatur lewat env `<NAME>_MAX_CONCURRENCY` dan `<NAME>_MAX_QUEUE`"""
+    if name not in _lanes:
+        prefix = name.upper()
+        if max_concurrency is None:
+            max_concurrency = os.cpu_count() or 1
+        _lanes[name] = ExecutorLane(
+            name,
+            max_concurrency=int(os.getenv(f"{prefix}_MAX_CONCURRENCY", max_concurrency)),
+            max_queue=int(os.getenv(f"{prefix}_MAX_QUEUE", max_queue))
+        )
+    return _lanes[name]
+
+
+def get_lane_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: lane.get_stats() for name, lane in _lanes.items()}
+
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+# Tugas run_cpu_bound yang dikirim dan selesai (termasuk yang menunggu worker pool)
+_cpu_submitted = 0
+_cpu_completed = 0
+
+
+def process_pool_workers() -> int:
+    return int(os.getenv("CPU_EXECUTOR_WORKERS", os.cpu_count() or 1))
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=process_pool_workers())
+    return _process_pool
+
+
+def _get_pool(pure: bool) -> Executor:
+    global _thread_pool
+    # Fungsi murni (bisa di-pickle) boleh dijalankan di process pool
+    if pure and os.getenv("CPU_EXECUTOR", "thread") == "process":
+        return _get_process_pool()
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=process_pool_workers(),
+            thread_name_prefix="cpu"
+        )
+    return _thread_pool
+
+
+async def run_cpu_bound(fn: Callable, *args: Any, pure: bool = False, **kwargs: Any) -> Any:
+    """
+    Jalankan pekerjaan CPU-bound di luar event loop.
+    `pure=True` untuk fungsi level modul yang bisa dijalankan di process pool (CPU_EXECUTOR=process).
+    """
+    global _cpu_submitted, _cpu_completed
+    loop = asyncio.get_running_loop()
+    _cpu_submitted += 1
+    try:
+        return await loop.run_in_executor(_get_pool(pure), functools.partial(fn, *args, **kwargs))
+    finally:
+        _cpu_completed += 1
+
+
+def get_cpu_pool_stats() -> Dict[str, Any]:
+    """Pemakaian pool CPU bersama oleh run_cpu_bound"""
+    return {
+        "executor": os.getenv("CPU_EXECUTOR", "thread"),
+        "max_workers": process_pool_workers(),
+        "in_flight": _cpu_submitted - _cpu_completed,
+        "completed": _cpu_completed
+    }
+
+
+async def run_in_process(fn: Callable, *args: Any, **kwargs: Any) -> Any:
+    """
+    Jalankan fungsi murni di process pool apa pun CPU_EXECUTOR-nya.
+    Dipakai untuk pekerjaan yang sengaja dipecah ke beberapa core (shard dokumen besar).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_process_pool(), functools.partial(fn, *args, **kwargs))
+
+
+def _reset_after_fork():
+    """
+    Proses anak hasil fork mewarisi objek pool, tetapi tidak thread/proses worker-nya;
+    pool dibuang (tanpa shutdown) agar anak membuat pool sendiri saat pertama dipakai.
+    """
+    global _thread_pool, _process_pool, _cpu_submitted, _cpu_completed
+    _thread_pool = None
+    _process_pool = None
+    _cpu_submitted = 0
+    _cpu_completed = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def shutdown_executors():
+    global _thread_pool, _process_pool
+    if _thread_pool is not None:
+        _thread_pool.shutdown(wait=False, cancel_futures=True)
+        _thread_pool = None
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
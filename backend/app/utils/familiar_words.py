@@ -0,0 +1,193 @@
+"""
+Daftar kata familiar untuk metrik Dale-Chall.
+
+Daftar teks (satu kata per baris atau dipisah spasi) dikompilasi menjadi file biner
+terurut lalu dibaca lewat mmap. Startup tidak perlu membangun set Python, dan semua
+worker uvicorn berbagi halaman memori yang sama dari page cache.
+
+File biner disimpan di FAMILIAR_WORDS_CACHE_DIR (default ~/.cache/buddytext), bukan
+di samping file sumber, sehingga folder data boleh read-only.
+
+Format file biner (semua bilangan little-endian):
+    header   : magic (4 byte) + jumlah kata (uint32)
+    offsets  : jumlah kata + 1 uint32, posisi awal setiap kata di blok data
+    data     : kata UTF-8 huruf kecil, terurut per byte, tanpa pemisah
+
+Kompilasi manual dari folder backend:
+    python -m app.utils.familiar_words [sumber.txt]
+"""
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+from app.utils.lexicon import LEXICON_DIR
+
+MAGIC = b"BTFW"
+HEADER = struct.Struct("<4sI")
+
+FAMILIAR_WORDS_PATH = os.getenv("FAMILIAR_WORDS_PATH") or str(LEXICON_DIR / "familiar_words_id.txt")
+FAMILIAR_WORDS_CACHE_DIR = os.getenv("FAMILIAR_WORDS_CACHE_DIR") or str(
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "buddytext"
+)
+FAMILIAR_CACHE_SIZE = int(os.getenv("FAMILIAR_CACHE_SIZE", 65536))
+
+# Partikel/klitik yang boleh dilepas sebelum mencari kata dasar (rumahnya -> rumah)
+CLITICS = ("nya", "lah", "kah", "pun", "ku", "mu")
+EDGE_PUNCTUATION = re.compile(r"^\W+|\W+$")
+
+
+class FamiliarWordList:
+    """Pencarian kata di file biner terurut yang di-mmap (binary search)"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a compiled familiar word list")
+        self._count = count
+        offsets_end = HEADER.size + 4 * (count + 1)
+        if sys.byteorder == "little":
+            self._offsets = memoryview(self._mmap)[HEADER.size:offsets_end].cast("I")
+        else:
+            # Mesin big-endian: offset disalin ke memori lalu dibalik urutan byte-nya
+            offsets = array("I", self._mmap[HEADER.size:offsets_end])
+            offsets.byteswap()
+            self._offsets = memoryview(offsets)
+        self._data_start = offsets_end
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _word_at(self, index: int) -> bytes:
+        start = self._data_start + self._offsets[index]
+        return self._mmap[start:self._data_start + self._offsets[index + 1]]
+
+    def __contains__(self, word: str) -> bool:
+        key = word.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._word_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low < self._count and self._word_at(low) == key
+
+    def close(self):
+        self._offsets.release()
+        self._mmap.close()
+
+
+def read_word_list(path: Union[str, Path]) -> List[str]:
+    """Baca kata dari file teks; baris diawali '#' diabaikan"""
+    words = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.lstrip().startswith("#"):
+                continue
+            words.update(word.lower() for word in line.split())
+    return sorted(words)
+
+
+def compile_word_list(words: Iterable[str], target: Union[str, Path]) -> int:
+    """Tulis kata terurut ke file biner; diganti secara atomik agar pembaca lama tetap valid"""
+    encoded = sorted({word.lower().encode("utf-8") for word in words})
+    offsets = array("I", [0])
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(encoded)))
+        f.write(offsets.tobytes())
+        f.write(b"".join(encoded))
+    os.replace(temp_path, target)
+    return len(encoded)
+
+
+def compiled_path(source: Union[str, Path]) -> Path:
+    """Lokasi file biner untuk `source` di folder cache (satu file per path sumber)"""
+    source = Path(source).resolve()
+    digest = hashlib.sha256(str(source).encode("utf-8")).hexdigest()[:16]
+    return Path(FAMILIAR_WORDS_CACHE_DIR) / f"{source.stem}-{digest}.bin"
+
+
+def load_familiar_words(source: Optional[str] = None) -> Optional[FamiliarWordList]:
+    """
+    Buka daftar kata familiar hasil kompilasi.
+    File biner dibuat ulang jika belum ada atau lebih lama dari file sumber.
+    """
+    source = Path(source or FAMILIAR_WORDS_PATH)
+    target = compiled_path(source)
+    try:
+        if source.exists() and (
+            not target.exists() or target.stat().st_mtime < source.stat().st_mtime
+        ):
+            count = compile_word_list(read_word_list(source), target)
+            print(f"Compiled {count} familiar words to {target}")
+        words = FamiliarWordList(target)
+        print(f"Loaded {len(words)} familiar words from {target}")
+        return words
+    except (OSError, ValueError) as e:
+        print(f"Error loading familiar words from {source}: {e}")
+        return None
+
+
+_familiar_words: Optional[FamiliarWordList] = None
+_loaded = False
+_lock = threading.Lock()
+
+
+def get_familiar_words() -> Optional[FamiliarWordList]:
+    """Daftar kata familiar bersama (dimuat sekali per proses)"""
+    global _familiar_words, _loaded
+    if not _loaded:
+        with _lock:
+            if not _loaded:
+                _familiar_words = load_familiar_words()
+                _loaded = True
+    return _familiar_words
+
+
+def _is_known(word: str, words: FamiliarWordList) -> bool:
+    if word in words:
+        return True
+    for clitic in CLITICS:
+        if word.endswith(clitic) and len(word) > len(clitic) + 2 and word[:-len(clitic)] in words:
+            return True
+    return False
+
+
+@lru_cache(maxsize=FAMILIAR_CACHE_SIZE)
+def is_familiar_word(token: str) -> bool:
+    """
+    True jika token termasuk kata familiar.
+    Angka dan simbol tidak dihitung sebagai kata sulit; kata ulang (anak-anak)
+    familiar jika semua bagiannya familiar. Tanpa daftar kata semua token familiar.
+    """
+    words = get_familiar_words()
+    word = EDGE_PUNCTUATION.sub("", token.lower())
+    if words is None or not any(c.isalpha() for c in word):
+        return True
+    return all(_is_known(part, words) for part in word.split("-") if part)
+
+
+if __name__ == "__main__":
+    source = Path(sys.argv[1] if len(sys.argv) > 1 else FAMILIAR_WORDS_PATH)
+    count = compile_word_list(read_word_list(source), compiled_path(source))
+    print(f"Compiled {count} familiar words to {compiled_path(source)}")
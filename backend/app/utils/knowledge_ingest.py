@@ -0,0 +1,212 @@
+"""
+Ingestion glosarium besar (JSONL) ke knowledge base tutor.
+
+Setiap baris adalah satu objek JSON berisi nama konsep dan field knowledge:
+    {"concept": "subsidi", "definition": "...", "simple_explanation": "...",
+     "examples": [...], "related_concepts": [...]}
+
+File dibaca baris per baris dan langsung ditulis ke snapshot SQLite baru, jadi
+memori tidak bergantung pada ukuran file. Baris yang tidak valid dilewati dan
+dicatat (beberapa pesan pertama saja) tanpa menggagalkan seluruh ingestion.
+
+Bangun snapshot dari folder backend (worker memakai snapshot baru dalam
+KNOWLEDGE_RELOAD_INTERVAL detik):
+    python -m app.utils.knowledge_ingest glosarium.jsonl [--target knowledge.db] [--merge]
+"""
+import argparse
+import json
+import os
+import threading
+import time
+import uuid
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from app.utils.knowledge_store import (
+    KNOWLEDGE_DB_PATH,
+    KnowledgeStore,
+    normalize_knowledge,
+    snapshot_temp_path,
+    write_snapshot
+)
+
+# Jumlah pesan kesalahan validasi yang disimpan per job
+MAX_REPORTED_ERRORS = 20
+
+PHASE_QUEUED = "queued"
+PHASE_LOADING = "loading"
+PHASE_INDEXING = "indexing"
+PHASE_SWAPPING = "swapping"
+PHASE_DONE = "done"
+PHASE_FAILED = "failed"
+
+KnowledgeRow = Tuple[str, str, str, str, str]
+
+
+class IngestionBusyError(Exception):
+    """Masih ada ingestion lain yang berjalan untuk knowledge base yang sama"""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        super().__init__(f"Ingestion job {job_id} is still running")
+
+
+class IngestionJob:
+    """Progress satu ingestion; diperbarui oleh thread ingestion, dibaca oleh endpoint status"""
+
+    def __init__(self, source: Union[str, Path], size_bytes: int = 0, merge: bool = False, name: Optional[str] = None):
+        self.job_id = uuid.uuid4().hex
+        self.source = str(source)
+        # Nama yang dilaporkan (misalnya nama file upload, bukan path file sementara)
+        self.name = name or self.source
+        self.size_bytes = size_bytes
+        self.merge = merge
+        self.phase = PHASE_QUEUED
+        self.lines_read = 0
+        self.bytes_read = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.concepts = 0
+        self.errors: List[str] = []
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.loaded_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def start(self):
+        self.phase = PHASE_LOADING
+        self.started_at = time.time()
+
+    def set_phase(self, phase: str):
+        if phase == PHASE_INDEXING:
+            self.loaded_at = time.time()
+        self.phase = phase
+
+    def reject(self, line_number: int, message: str):
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"line {line_number}: {message}")
+
+    def finish(self, concepts: int):
+        self.concepts = concepts
+        self.phase = PHASE_DONE
+        self.finished_at = time.time()
+
+    def fail(self, error: Exception):
+        self.error = str(error)
+        self.phase = PHASE_FAILED
+        self.finished_at = time.time()
+
+    @property
+    def running(self) -> bool:
+        return self.phase not in (PHASE_DONE, PHASE_FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        now = time.time()
+        elapsed = ((self.finished_at or now) - self.started_at) if self.started_at else 0.0
+        loading = ((self.loaded_at or self.finished_at or now) - self.started_at) if self.started_at else 0.0
+        return {
+            "job_id": self.job_id,
+            "source": self.name,
+            "merge": self.merge,
+            "phase": self.phase,
+            "lines_read": self.lines_read,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "concepts": self.concepts,
+            "bytes_read": self.bytes_read,
+            "size_bytes": self.size_bytes,
+            "progress": round(self.bytes_read / self.size_bytes, 4) if self.size_bytes else None,
+            "elapsed_seconds": round(elapsed, 3),
+            # Throughput fase loading (baca, validasi, tulis ke SQLite)
+            "lines_per_second": round(self.lines_read / loading, 1) if loading > 0 else 0.0,
+            "mb_per_second": round(self.bytes_read / loading / 2**20, 2) if loading > 0 else 0.0,
+            "errors": self.errors,
+            "error": self.error
+        }
+
+
+def iter_jsonl(path: Union[str, Path], job: IngestionJob) -> Iterator[KnowledgeRow]:
+    """Baris knowledge yang valid dari file JSONL; baris tidak valid dicatat di job"""
+    with open(path, "rb") as f:
+        for line_number, line in enumerate(f, 1):
+            job.lines_read = line_number
+            job.bytes_read += len(line)
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                if not isinstance(entry, dict):
+                    raise ValueError("Line must be a JSON object")
+                row = normalize_knowledge(entry.get("concept"), entry)
+            except (ValueError, AttributeError) as e:
+                job.reject(line_number, str(e))
+                continue
+            job.accepted += 1
+            yield row
+
+
+def iter_store_rows(store: KnowledgeStore) -> Iterator[KnowledgeRow]:
+    """Isi snapshot yang sedang aktif sebagai baris, untuk mode merge"""
+    for _, concept, knowledge in store.iter_changes(-1):
+        yield normalize_knowledge(concept, knowledge)
+
+
+def load_snapshot(
+    source: Union[str, Path],
+    target: Union[str, Path],
+    job: IngestionJob,
+    base: Optional[KnowledgeStore] = None
+) -> Path:
+    """
+    Tulis snapshot baru dari file JSONL ke file sementara di samping target.
+    Dengan `base`, isi knowledge base lama ikut disalin dan entri file menimpanya.
+    File belum dipasang; pemanggil yang melakukan os.replace.
+    """
+    temp_path = snapshot_temp_path(target)
+    rows = iter_jsonl(source, job)
+    if base is not None:
+        rows = chain(iter_store_rows(base), rows)
+    try:
+        job.concepts = write_snapshot(rows, temp_path)
+    except BaseException:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+    return temp_path
+
+
+def _print_progress(job: IngestionJob, stop: threading.Event):
+    while not stop.wait(1.0):
+        stats = job.to_dict()
+        print(f"{stats['phase']}: {stats['lines_read']} lines, {stats['rejected']} rejected, "
+              f"{stats['lines_per_second']:,.0f} lines/s, {stats['mb_per_second']} MB/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a tutor knowledge snapshot from a JSONL glossary")
+    parser.add_argument("source")
+    parser.add_argument("--target", default=KNOWLEDGE_DB_PATH)
+    parser.add_argument("--merge", action="store_true", help="keep concepts already in the target")
+    args = parser.parse_args()
+
+    job = IngestionJob(args.source, os.path.getsize(args.source), merge=args.merge)
+    base = KnowledgeStore(args.target) if args.merge and os.path.exists(args.target) else None
+    stop = threading.Event()
+    threading.Thread(target=_print_progress, args=(job, stop), daemon=True).start()
+    job.start()
+    try:
+        temp_path = load_snapshot(args.source, args.target, job, base)
+        job.set_phase(PHASE_SWAPPING)
+        os.replace(temp_path, args.target)
+        job.finish(job.concepts)
+    finally:
+        stop.set()
+    stats = job.to_dict()
+    print(f"Built knowledge snapshot with {stats['concepts']} concepts at {args.target} "
+          f"({stats['accepted']} accepted, {stats['rejected']} rejected, {stats['elapsed_seconds']}s, "
+          f"{stats['lines_per_second']:,.0f} lines/s)")
+    for error in stats["errors"]:
+        print(f"  {error}")
@@ -0,0 +1,270 @@
+"""
+Knowledge base tutor di SQLite dengan indeks FTS5 atas definisi dan penjelasan.
+
+Setiap worker membuka file database secara read-only. Snapshot baru dibangun di
+file sementara lalu dipasang dengan os.replace (atomik); worker mendeteksi inode
+yang berubah dan membuka koneksi baru, sementara request yang sedang berjalan
+tetap memakai koneksi snapshot lama sampai selesai.
+
+Bangun snapshot dari file JSON ({"konsep": {...}}) dari folder backend:
+    python -m app.utils.knowledge_store sumber.json [target.db]
+"""
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+KNOWLEDGE_DB_PATH = os.getenv("KNOWLEDGE_DB_PATH") or str(
+    Path(__file__).resolve().parents[2] / "data" / "knowledge" / "knowledge.db"
+)
+# Seberapa sering (detik) worker memeriksa apakah snapshot sudah diganti
+KNOWLEDGE_RELOAD_INTERVAL = float(os.getenv("KNOWLEDGE_RELOAD_INTERVAL", 2.0))
+
+TABLES = """
+CREATE TABLE IF NOT EXISTS concepts (
+    id INTEGER PRIMARY KEY,
+    concept TEXT NOT NULL UNIQUE,
+    definition TEXT NOT NULL DEFAULT '',
+    simple_explanation TEXT NOT NULL DEFAULT '',
+    examples TEXT NOT NULL DEFAULT '[]',
+    related_concepts TEXT NOT NULL DEFAULT '[]',
+    -- 0 untuk isi snapshot; naik setiap put() agar worker lain bisa mengambil perubahan saja
+    revision INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS concepts_revision ON concepts(revision);
+CREATE VIRTUAL TABLE IF NOT EXISTS concepts_fts USING fts5(
+    concept, definition, simple_explanation,
+    content='concepts', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+# Menjaga indeks FTS tetap sinkron untuk penulisan satu per satu (add_knowledge)
+TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS concepts_ai AFTER INSERT ON concepts BEGIN
+    INSERT INTO concepts_fts(rowid, concept, definition, simple_explanation)
+    VALUES (new.id, new.concept, new.definition, new.simple_explanation);
+END;
+CREATE TRIGGER IF NOT EXISTS concepts_au AFTER UPDATE ON concepts BEGIN
+    INSERT INTO concepts_fts(concepts_fts, rowid, concept, definition, simple_explanation)
+    VALUES ('delete', old.id, old.concept, old.definition, old.simple_explanation);
+    INSERT INTO concepts_fts(rowid, concept, definition, simple_explanation)
+    VALUES (new.id, new.concept, new.definition, new.simple_explanation);
+END;
+"""
+
+UPSERT = """
+INSERT INTO concepts (concept, definition, simple_explanation, examples, related_concepts, revision)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(concept) DO UPDATE SET
+    definition = excluded.definition,
+    simple_explanation = excluded.simple_explanation,
+    examples = excluded.examples,
+    related_concepts = excluded.related_concepts,
+    revision = excluded.revision
+"""
+
+KNOWLEDGE_COLUMNS = "definition, simple_explanation, examples, related_concepts"
+
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def normalize_knowledge(concept: str, knowledge: Dict[str, Any]) -> Tuple[str, str, str, str, str]:
+    """Validasi satu entri dan ubah menjadi baris tabel concepts"""
+    concept = (concept or "").strip().lower()
+    if not concept:
+        raise ValueError("Concept name is required")
+    if not isinstance(knowledge, dict):
+        raise ValueError(f"Knowledge for '{concept}' must be an object")
+
+    texts = []
+    for field in ("definition", "simple_explanation"):
+        value = knowledge.get(field, "")
+        if not isinstance(value, str):
+            raise ValueError(f"'{field}' for '{concept}' must be a string")
+        texts.append(value)
+    lists = []
+    for field in ("examples", "related_concepts"):
+        value = knowledge.get(field, [])
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise ValueError(f"'{field}' for '{concept}' must be a list of strings")
+        lists.append(json.dumps(value, ensure_ascii=False))
+    if not any(texts):
+        raise ValueError(f"'{concept}' needs a definition or simple_explanation")
+    return (concept, texts[0], texts[1], lists[0], lists[1])
+
+
+def snapshot_temp_path(target: Union[str, Path]) -> Path:
+    """File sementara di folder yang sama dengan target, agar os.replace tetap atomik"""
+    target = Path(target)
+    return target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def write_snapshot(rows: Iterable[Tuple[str, str, str, str, str]], path: Union[str, Path]) -> int:
+    """
+    Tulis database knowledge baru dari baris normalize_knowledge (dibaca sebagai stream).
+    Indeks FTS dibangun sekali di akhir; mengembalikan jumlah konsep.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+
+    db = sqlite3.connect(path)
+    try:
+        db.executescript(TABLES)
+        db.executemany(UPSERT, (row + (0,) for row in rows))
+        db.execute("INSERT INTO concepts_fts(concepts_fts) VALUES ('rebuild')")
+        db.executescript(TRIGGERS)
+        db.commit()
+        return db.execute("SELECT count(*) FROM concepts").fetchone()[0]
+    finally:
+        db.close()
+
+
+def build_snapshot(entries: Iterable[Tuple[str, Dict[str, Any]]], target: Union[str, Path]) -> int:
+    """Bangun database knowledge baru dari (konsep, knowledge) lalu pasang secara atomik"""
+    temp_path = snapshot_temp_path(target)
+    count = write_snapshot((normalize_knowledge(concept, knowledge) for concept, knowledge in entries), temp_path)
+    os.replace(temp_path, target)
+    return count
+
+
+def _row_to_knowledge(row: Tuple[str, str, str, str]) -> Dict[str, Any]:
+    return {
+        "definition": row[0],
+        "simple_explanation": row[1],
+        "examples": json.loads(row[2]),
+        "related_concepts": json.loads(row[3])
+    }
+
+
+class KnowledgeStore:
+    """
+    Akses knowledge base seperti dict (get, in, [], keys, len) lewat query berindeks.
+    Penulisan memakai koneksi terpisah yang dibuka per operasi.
+    """
+
+    def __init__(self, path: Union[str, Path] = KNOWLEDGE_DB_PATH, reload_interval: float = KNOWLEDGE_RELOAD_INTERVAL):
+        self.path = Path(path)
+        self.reload_interval = reload_interval
+        self.snapshot_version = 0
+        self._reader: Optional[sqlite3.Connection] = None
+        self._inode: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Koneksi read-only ke snapshot terbaru; snapshot diperiksa paling sering tiap reload_interval"""
+        now = time.monotonic()
+        if self._reader is None or now - self._checked_at >= self.reload_interval:
+            with self._lock:
+                self._checked_at = now
+                inode = os.stat(self.path).st_ino
+                if inode != self._inode or self._reader is None:
+                    # Koneksi lama tidak ditutup di sini; request yang masih memakainya
+                    # selesai dulu, lalu koneksi dibebaskan saat tidak ada lagi referensi
+                    self._reader = sqlite3.connect(
+                        f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+                    )
+                    self._inode = inode
+                    self.snapshot_version += 1
+                    print(f"Opened knowledge snapshot {self.path} (version {self.snapshot_version})")
+        return self._reader
+
+    def reload(self):
+        """Periksa snapshot sekarang juga, tanpa menunggu reload_interval"""
+        self._checked_at = 0.0
+        self._connection()
+
+    def get(self, concept: str, default: Any = None) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            f"SELECT {KNOWLEDGE_COLUMNS} FROM concepts WHERE concept = ?",
+            (concept,)
+        ).fetchone()
+        return _row_to_knowledge(row) if row else default
+
+    def __getitem__(self, concept: str) -> Dict[str, Any]:
+        knowledge = self.get(concept)
+        if knowledge is None:
+            raise KeyError(concept)
+        return knowledge
+
+    def __contains__(self, concept: str) -> bool:
+        return self._connection().execute(
+            "SELECT 1 FROM concepts WHERE concept = ?", (concept,)
+        ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT count(*) FROM concepts").fetchone()[0]
+
+    def keys(self) -> Iterator[str]:
+        for (concept,) in self._connection().execute("SELECT concept FROM concepts ORDER BY id"):
+            yield concept
+
+    def iter_changes(self, revision: int) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """
+        (revision, konsep, knowledge) yang berubah setelah revision tertentu, untuk
+        memperbarui indeks di memori; revision -1 membaca seluruh snapshot.
+        """
+        rows = self._connection().execute(
+            f"SELECT revision, concept, {KNOWLEDGE_COLUMNS} FROM concepts WHERE revision > ? ORDER BY revision, id",
+            (revision,)
+        )
+        for row in rows:
+            yield row[0], row[1], _row_to_knowledge(row[2:])
+
+    def changes_since(self, revision: int) -> List[Tuple[int, str, Dict[str, Any]]]:
+        return list(self.iter_changes(revision))
+
+    def data_version(self) -> int:
+        """Berubah setiap kali koneksi lain menulis ke snapshot yang sedang dibuka"""
+        return self._connection().execute("PRAGMA data_version").fetchone()[0]
+
+    def search(self, text: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """Konsep yang definisi/penjelasannya paling cocok dengan teks (skor BM25, makin besar makin cocok)"""
+        tokens = SEARCH_TOKEN_PATTERN.findall(text.lower())
+        if not tokens:
+            return []
+        query = " OR ".join(f'"{token}"' for token in dict.fromkeys(tokens))
+        rows = self._connection().execute(
+            "SELECT c.concept, bm25(concepts_fts) FROM concepts_fts "
+            "JOIN concepts c ON c.id = concepts_fts.rowid "
+            "WHERE concepts_fts MATCH ? ORDER BY bm25(concepts_fts) LIMIT ?",
+            (query, limit)
+        ).fetchall()
+        return [(concept, -score) for concept, score in rows]
+
+    def put(self, concept: str, knowledge: Dict[str, Any]):
+        """Tambah atau perbarui satu konsep di snapshot yang sedang aktif"""
+        row = normalize_knowledge(concept, knowledge)
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            # Revisi berikutnya diambil dan dipakai dalam transaksi yang sama
+            db.execute("BEGIN IMMEDIATE")
+            revision = db.execute("SELECT coalesce(max(revision), 0) + 1 FROM concepts").fetchone()[0]
+            db.execute(UPSERT, row + (revision,))
+            db.execute("COMMIT")
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "concepts": len(self),
+            "snapshot_version": self.snapshot_version,
+            "reload_interval": self.reload_interval
+        }
+
+
+if __name__ == "__main__":
+    source = Path(sys.argv[1])
+    target = Path(sys.argv[2] if len(sys.argv) > 2 else KNOWLEDGE_DB_PATH)
+    with open(source, encoding="utf-8") as f:
+        count = build_snapshot(json.load(f).items(), target)
+    print(f"Built knowledge snapshot with {count} concepts at {target}")
@@ -0,0 +1,142 @@
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# Kata: huruf/angka, termasuk kata ulang dengan tanda hubung (anak-anak)
+WORD_PATTERN = re.compile(r"\w+(?:-\w+)*")
+
+# Kunci khusus di node trie untuk menyimpan kata pengganti
+_VALUE = ""
+
+LEXICON_DIR = Path(os.getenv("LEXICON_DIR", Path(__file__).resolve().parents[2] / "data" / "lexicon"))
+
+
+class LexiconSubstitutor:
+    """
+    Mengganti kata/frasa kompleks dengan padanan sederhana dalam satu kali jalan.
+
+    Leksikon dikompilasi sekali menjadi trie per-kata, sehingga biaya
+    penggantian hanya bergantung pada panjang teks, bukan jumlah entri.
+    Pencocokan selalu utuh per kata ("mulai" tidak cocok di dalam "memulai")
+    dan memilih frasa terpanjang yang cocok.
+    """
+
+    def __init__(self, lexicon: Optional[Dict[str, str]] = None):
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+        if lexicon:
+            self.update(lexicon.items())
+
+    def __len__(self) -> int:
+        return self._size
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "LexiconSubstitutor":
+        """Load leksikon dari file TSV: `kata_kompleks<TAB>kata_sederhana`"""
+        substitutor = cls()
+        substitutor.update(cls._read_pairs(path))
+        return substitutor
+
+    @staticmethod
+    def _read_pairs(path: Union[str, Path]) -> Iterable[Tuple[str, str]]:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                parts = line.split("\t")
+                if len(parts) != 2:
+                    continue
+                yield parts[0], parts[1]
+
+    def update(self, pairs: Iterable[Tuple[str, str]]):
+        """Tambahkan pasangan (kompleks, sederhana) ke trie"""
+        for complex_phrase, simple_phrase in pairs:
+            path = [w.lower() for w in WORD_PATTERN.findall(complex_phrase)]
+            simple_phrase = simple_phrase.strip()
+            if not path or path == [simple_phrase.lower()]:
+                continue
+            node = self._root
+            for word in path:
+                node = node.setdefault(word, {})
+            if _VALUE not in node:
+                self._size += 1
+            node[_VALUE] = simple_phrase
+
+    def substitute(self, text: str) -> str:
+        """Ganti semua kata/frasa kompleks dalam satu kali jalan"""
+        return self.substitute_with_count(text)[0]
+
+    def substitute_with_count(self, text: str) -> Tuple[str, int]:
+        """Seperti `substitute`, tetapi juga mengembalikan jumlah penggantian"""
+        root = self._root
+        if not root:
+            return text, 0
+
+        words = [(m.start(), m.end(), m.group().lower()) for m in WORD_PATTERN.finditer(text)]
+        output: List[str] = []
+        replaced = 0
+        prev_end = 0
+        i = 0
+        n = len(words)
+
+        while i < n:
+            start, end, lowered = words[i]
+            node = root.get(lowered)
+            if node is None:
+                i += 1
+                continue
+
+            # Cari frasa terpanjang yang cocok mulai dari kata ke-i
+            match_index = i if _VALUE in node else -1
+            match_value = node.get(_VALUE)
+            j = i + 1
+            while j < n:
+                gap = text[words[j - 1][1]:words[j][0]]
+                if gap.strip():
+                    break
+                node = node.get(words[j][2])
+                if node is None:
+                    break
+                if _VALUE in node:
+                    match_index = j
+                    match_value = node[_VALUE]
+                j += 1
+
+            if match_index < 0:
+                i += 1
+                continue
+
+            output.append(text[prev_end:start])
+            output.append(self._match_case(text[start:end], match_value))
+            prev_end = words[match_index][1]
+            replaced += 1
+            i = match_index + 1
+
+        if not replaced:
+            return text, 0
+        output.append(text[prev_end:])
+        return "".join(output), replaced
+
+    @staticmethod
+    def _match_case(original: str, replacement: str) -> str:
+        """Sesuaikan huruf kapital pengganti dengan kata aslinya"""
+        if not replacement:
+            return replacement
+        if len(original) > 1 and original.isupper():
+            return replacement.upper()
+        if original[0].isupper():
+            return replacement[0].upper() + replacement[1:]
+        return replacement
+
+
+def load_lexicon(path: Union[str, Path], fallback: Optional[Dict[str, str]] = None) -> LexiconSubstitutor:
+    """Load leksikon dari file, atau gunakan fallback jika file tidak bisa dibaca"""
+    try:
+        lexicon = LexiconSubstitutor.from_file(path)
+        print(f"Loaded {len(lexicon)} lexicon entries from {path}")
+        return lexicon
+    except Exception as e:
+        print(f"Error loading lexicon {path}: {e}")
+        return LexiconSubstitutor(fallback)
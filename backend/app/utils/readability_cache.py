@@ -0,0 +1,150 @@
+"""
+Cache readability bersama untuk simplification dan evaluation.
+
+Kunci utama adalah hash teks (handle). Di bawah handle disimpan statistik teks
+(TextStats) beserta teksnya, dan hasil skor per set metrik. Respons simplify
+mengembalikan handle sehingga /api/evaluate/readability bisa memakainya tanpa
+mengirim ulang dan menghitung ulang teks yang sama.
+"""
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.utils.executors import run_cpu_bound
+from app.utils.result_cache import ResultCache, make_cache_key
+from app.utils.text_stats import COUNT_FIELDS, TextStats
+from app.utils.text_stats_parallel import compute_text_stats_parallel
+
+# Naikkan jika cara menghitung TextStats berubah agar entri persisten lama tidak dipakai
+TEXT_STATS_VERSION = 2
+
+# Teks lebih panjang dari ini hanya disimpan statistiknya, tanpa teksnya
+READABILITY_CACHE_MAX_TEXT = int(os.getenv("READABILITY_CACHE_MAX_TEXT", 200_000))
+
+
+def text_handle(text: str) -> str:
+    """Handle readability untuk sebuah teks (hash SHA-256)"""
+    return make_cache_key("readability", TEXT_STATS_VERSION, text)
+
+
+class ReadabilityCache:
+    """Statistik dan skor readability per hash teks, dipakai bersama oleh beberapa service"""
+
+    def __init__(self, cache: ResultCache, max_text_length: int = READABILITY_CACHE_MAX_TEXT):
+        self.cache = cache
+        self.max_text_length = max_text_length
+
+    @classmethod
+    def from_env(cls) -> "ReadabilityCache":
+        return cls(ResultCache.from_env("READABILITY_CACHE", table="readability_cache", max_entries=4096))
+
+    def get_text_stats(self, handle: str) -> Optional[TextStats]:
+        entry = self.cache.get(self._stats_key(handle))
+        if entry is None:
+            return None
+        return TextStats.from_counts(entry["counts"])
+
+    def get_text(self, handle: str) -> Optional[str]:
+        """Teks asli untuk handle; None jika tidak ada, kedaluwarsa, atau terlalu panjang untuk disimpan"""
+        entry = self.cache.get(self._stats_key(handle))
+        return entry["text"] if entry is not None else None
+
+    def set_stats(self, handle: str, text: str, stats: TextStats):
+        self.cache.set(self._stats_key(handle), {
+            "text": text if len(text) <= self.max_text_length else None,
+            "counts": [getattr(stats, name) for name in COUNT_FIELDS]
+        })
+
+    async def score(
+        self,
+        text: str,
+        metric_set: str,
+        scorer: Callable[[TextStats], Dict[str, Any]],
+        stats: Optional[TextStats] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Skor readability untuk `metric_set` (nama set metrik beserta versinya).
+        `scorer` hanya dipanggil jika skor untuk teks dan set metrik ini belum ada.
+        `stats` yang sudah diketahui pemanggil (misalnya jumlah statistik per kalimat)
+        disimpan untuk handle tanpa memproses ulang teks.
+        """
+        handle = await run_cpu_bound(text_handle, text)
+        scores_key = self._scores_key(handle, metric_set)
+        scores = self.cache.get(scores_key)
+        if scores is not None:
+            return handle, dict(scores)
+
+        cached_stats = self.get_text_stats(handle)
+        if cached_stats is not None:
+            stats = cached_stats
+        else:
+            if stats is None:
+                # Statistik dihitung di CPU pool (dokumen besar dibagi ke beberapa proses);
+                # cache tetap dikelola di proses ini
+                stats = await compute_text_stats_parallel(text)
+            self.set_stats(handle, text, stats)
+        scores = scorer(stats)
+        self.cache.set(scores_key, scores)
+        return handle, dict(scores)
+
+    def score_handle(
+        self,
+        handle: str,
+        metric_set: str,
+        scorer: Callable[[TextStats], Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Skor untuk handle tanpa teksnya (teks panjang hanya disimpan statistiknya).
+        None jika statistik handle sudah keluar dari cache.
+        """
+        scores_key = self._scores_key(handle, metric_set)
+        scores = self.cache.get(scores_key)
+        if scores is not None:
+            return dict(scores)
+        stats = self.get_text_stats(handle)
+        if stats is None:
+            return None
+        scores = scorer(stats)
+        self.cache.set(scores_key, scores)
+        return dict(scores)
+
+    @staticmethod
+    def metric_set_key(name: str, metrics: List[str], version: int = 0) -> str:
+        return f"{name}:{version}:{','.join(sorted(metrics))}"
+
+    def _stats_key(self, handle: str) -> str:
+        return f"{handle}:stats"
+
+    def _scores_key(self, handle: str, metric_set: str) -> str:
+        return make_cache_key(handle, metric_set)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.cache.get_stats()
+        stats["max_text_length"] = self.max_text_length
+        return stats
+
+
+_readability_cache: Optional[ReadabilityCache] = None
+_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    # Worker hasil fork membuat cache sendiri: lock dan koneksi SQLite milik proses induk
+    # tidak boleh dipakai bersama
+    global _readability_cache, _lock
+    _readability_cache = None
+    _lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_readability_cache() -> ReadabilityCache:
+    """Cache readability bersama (satu per proses)"""
+    global _readability_cache
+    if _readability_cache is None:
+        with _lock:
+            if _readability_cache is None:
+                _readability_cache = ReadabilityCache.from_env()
+    return _readability_cache
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Buat kunci cache dari hash SHA-256 semua bagian"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def sqlite_path_from_url(database_url: str) -> Optional[str]:
+    """Ambil path file dari DATABASE_URL (`sqlite:///./buddytext.db`)"""
+    match = re.match(r"^sqlite:///(.+)$", database_url or "")
+    return match.group(1) if match else None
+
+
+# Tier SQLite dibersihkan (entri kedaluwarsa + batas jumlah baris) setiap sekian penulisan
+DISK_PURGE_EVERY = 256
+
+
+class ResultCache:
+    """
+    Cache hasil dengan LRU + TTL di memori dan tier SQLite opsional.
+    Nilai disimpan sebagai JSON sehingga proses yang restart bisa langsung hangat.
+    Tier SQLite dibatasi `max_disk_entries` baris (diperiksa setiap DISK_PURGE_EVERY
+    penulisan); entri yang paling dulu kedaluwarsa dibuang lebih dulu.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600,
+        db_path: Optional[str] = None,
+        table: str = "result_cache",
+        max_disk_entries: Optional[int] = None
+    ):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.table = table
+        if max_disk_entries is None:
+            max_disk_entries = self.max_entries * 8
+        self.max_disk_entries = max(1, max_disk_entries)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._writes_since_purge = 0
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.disk_evictions = 0
+
+        if db_path:
+            self._open_db(db_path)
+
+    @classmethod
+    def from_env(
+        cls,
+        prefix: str,
+        table: str,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600
+    ) -> "ResultCache":
+        """Buat cache dari env `<PREFIX>_SIZE`, `<PREFIX>_DISK_SIZE`, `<PREFIX>_TTL`, `<PREFIX>_PERSIST`"""
+        db_path = None
+        if os.getenv(f"{prefix}_PERSIST", "False").lower() == "true":
+            db_path = sqlite_path_from_url(os.getenv("DATABASE_URL", "sqlite:///./buddytext.db"))
+        max_entries = int(os.getenv(f"{prefix}_SIZE", max_entries))
+        return cls(
+            max_entries=max_entries,
+            ttl_seconds=float(os.getenv(f"{prefix}_TTL", ttl_seconds)),
+            db_path=db_path,
+            table=table,
+            max_disk_entries=int(os.getenv(f"{prefix}_DISK_SIZE", max_entries * 8))
+        )
+
+    def _open_db(self, db_path: str):
+        try:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_expires_at ON {self.table} (expires_at)"
+            )
+            self._db.commit()
+            self._purge_db()
+        except sqlite3.Error as e:
+            print(f"Error opening cache database {db_path}: {e}")
+            self._db = None
+
+    def _purge_db(self):
+        """Hapus baris kedaluwarsa lalu buang baris tertua di atas max_disk_entries"""
+        self._writes_since_purge = 0
+        now = time.time()
+        expired = self._db.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (now,)).rowcount
+        self.expirations += max(0, expired)
+        rows = self._db.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        excess = rows - self.max_disk_entries
+        if excess > 0:
+            self._db.execute(
+                f"DELETE FROM {self.table} WHERE key IN "
+                f"(SELECT key FROM {self.table} ORDER BY expires_at LIMIT ?)",
+                (excess,)
+            )
+            self.disk_evictions += excess
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Ambil nilai dari cache; None jika tidak ada atau kedaluwarsa"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+
+            value = self._get_from_db(key, now)
+            if value is not None:
+                self.hits += 1
+                self.disk_hits += 1
+                self._store(key, value, now + self.ttl_seconds)
+                return value
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any):
+        """Simpan nilai (harus bisa diserialisasi ke JSON)"""
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._store(key, value, expires_at)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, json.dumps(value), expires_at)
+                    )
+                    self._db.commit()
+                    self._writes_since_purge += 1
+                    if self._writes_since_purge >= min(DISK_PURGE_EVERY, self.max_disk_entries):
+                        self._purge_db()
+                except sqlite3.Error as e:
+                    print(f"Error writing cache entry: {e}")
+
+    def _store(self, key: str, value: Any, expires_at: float):
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _get_from_db(self, key: str, now: float) -> Optional[Any]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._db.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self._db.commit()
+                self.expirations += 1
+                return None
+            return json.loads(row[0])
+        except sqlite3.Error as e:
+            print(f"Error reading cache entry: {e}")
+            return None
+
+    def invalidate(self, key: str):
+        """Hapus satu entri dari semua tier"""
+        with self._lock:
+            self._entries.pop(key, None)
+            if self._db is not None:
+                self._db.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self._db.commit()
+
+    def clear(self):
+        """Kosongkan cache di memori dan di disk"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute(f"DELETE FROM {self.table}")
+                self._db.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counter hit/miss/eviction"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "max_disk_entries": self.max_disk_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "persistent": self._db is not None,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "disk_evictions": self.disk_evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,30 @@
+import os
+import re
+from functools import lru_cache
+
+# Onset suku kata berikutnya: konsonan tunggal, digraf (ng, ny, sy, kh)
+# atau gugus serapan konsonan + l/r (pr, tr, kl, ...)
+_ONSET = r"(?:ng|ny|sy|kh|[bcdfgkpt][lr]|[b-df-hj-np-tv-z])"
+
+# Inti suku kata. Diftong ai/au/oi/ei dihitung satu suku kata jika berada di akhir
+# kata (pan-tai, ker-bau), langsung diikuti sufiks -an (pa-kai-an) atau diikuti onset
+# suku kata berikutnya (sau-da-ra, boi-kot, bau-ran). Selain itu vokalnya dipisah
+# (ma-in, la-ut, ba-ik). ai/oi/ei juga dipisah jika konsonan berikutnya adalah akhir
+# kata dasar yang diberi sufiks -an (ma-i-nan, per-ma-i-nan).
+_DIPHTHONG_END = r"(?![a-z])|an(?![a-z])"
+SYLLABLE_NUCLEUS_PATTERN = re.compile(
+    rf"(?:[ao]i|ei)(?={_DIPHTHONG_END}|(?!{_ONSET}an(?![a-z])){_ONSET}[aeiou])"
+    rf"|au(?={_DIPHTHONG_END}|{_ONSET}[aeiou])"
+    r"|[aeiou]"
+)
+
+SYLLABLE_CACHE_SIZE = int(os.getenv("SYLLABLE_CACHE_SIZE", 65536))
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def count_syllables(word: str) -> int:
+    """
+    Jumlah suku kata bahasa Indonesia (minimal 1).
+    Hasil disimpan di cache LRU karena frekuensi kata sangat timpang.
+    """
+    return len(SYLLABLE_NUCLEUS_PATTERN.findall(word.lower())) or 1
@@ -0,0 +1,15 @@
+"""
+Definisi token dan kalimat yang dipakai bersama.
+Tokenisasi sendiri hanya ada di TextStatsAccumulator (text_stats), yang juga
+membangun AnalyzedDocument lewat analyze_text.
+"""
+import re
+
+# Token = rangkaian karakter non-spasi (sama dengan str.split())
+TOKEN_PATTERN = re.compile(r"\S+")
+# Rangkaian tanda akhir kalimat (sama dengan re.split(r'[.!?]+', text))
+TERMINATOR_PATTERN = re.compile(r"[.!?]+")
+TERMINATORS = ".!?"
+
+# Kata dengan lebih dari 8 huruf dianggap kata panjang/kompleks
+LONG_WORD_LENGTH = 8
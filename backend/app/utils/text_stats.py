@@ -0,0 +1,484 @@
+from array import array
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.utils.familiar_words import is_familiar_word
+from app.utils.syllables import count_syllables
+from app.utils.text_analysis import LONG_WORD_LENGTH, TERMINATOR_PATTERN, TERMINATORS, TOKEN_PATTERN
+
+# Kata pendek (<= 4 huruf) dan polisilabel (>= 3 suku kata)
+SHORT_WORD_LENGTH = 4
+POLYSYLLABLE_MIN = 3
+
+
+class TextStats:
+    """
+    Statistik teks hasil satu kali jalan.
+    Semua metrik readability dan rekomendasi dihitung dari struktur ini,
+    jadi menambah metrik tidak menambah pemrosesan teks.
+    """
+
+    __slots__ = (
+        "word_count",
+        "sentence_count",
+        "segment_count",
+        "char_count",
+        "letter_count",
+        "syllable_count",
+        "polysyllable_count",
+        "short_word_count",
+        "long_word_count",
+        "unfamiliar_word_count"
+    )
+
+    def __init__(self):
+        self.word_count = 0
+        self.sentence_count = 0
+        # Jumlah potongan dari re.split(r'[.!?]+', text), dipakai rumus readability lama
+        self.segment_count = 1
+        self.char_count = 0
+        self.letter_count = 0
+        self.syllable_count = 0
+        self.polysyllable_count = 0
+        self.short_word_count = 0
+        self.long_word_count = 0
+        # Kata di luar daftar kata familiar (kata sulit ala Dale-Chall)
+        self.unfamiliar_word_count = 0
+
+    @classmethod
+    def from_counts(cls, counts: List[int]) -> "TextStats":
+        """TextStats dari counter dengan urutan COUNT_FIELDS (misalnya dari cache)"""
+        stats = cls()
+        for name, value in zip(cls.__slots__, counts):
+            setattr(stats, name, value)
+        return stats
+
+    @property
+    def medium_word_count(self) -> int:
+        return self.word_count - self.short_word_count - self.long_word_count
+
+    @property
+    def avg_words_per_segment(self) -> float:
+        return self.word_count / self.segment_count if self.segment_count > 0 else 0
+
+    @property
+    def avg_words_per_sentence(self) -> float:
+        return self.word_count / self.sentence_count if self.sentence_count > 0 else 0
+
+    @property
+    def avg_syllables_per_word(self) -> float:
+        return self.syllable_count / self.word_count if self.word_count > 0 else 0
+
+    @property
+    def avg_letters_per_word(self) -> float:
+        return self.letter_count / self.word_count if self.word_count > 0 else 0
+
+    @property
+    def long_word_ratio(self) -> float:
+        return self.long_word_count / self.word_count if self.word_count > 0 else 0
+
+    @property
+    def unfamiliar_word_ratio(self) -> float:
+        return self.unfamiliar_word_count / self.word_count if self.word_count > 0 else 0
+
+
+class AnalyzedDocument(TextStats):
+    """
+    Teks beserta token, batas kalimat, dan semua counter TextStats dari satu kali jalan.
+    Dibuat sekali per teks (analyze_text) lalu dipakai bersama oleh simplification,
+    readability, dan evaluation sehingga teks tidak di-tokenisasi ulang.
+    """
+
+    __slots__ = (
+        "text",
+        "token_starts",
+        "token_ends",
+        "sentence_token_ranges"
+    )
+
+    def __init__(self, text: str):
+        super().__init__()
+        self.text = text
+        # Offset awal/akhir setiap token (array ringkas, bukan list tuple)
+        self.token_starts = array("q")
+        self.token_ends = array("q")
+        # Index token pertama dan token setelah terakhir, bergantian per kalimat
+        self.sentence_token_ranges = array("q")
+
+    @property
+    def tokens(self) -> List[str]:
+        text = self.text
+        return [text[start:end] for start, end in zip(self.token_starts, self.token_ends)]
+
+    @property
+    def sentence_spans(self) -> List[Tuple[int, int]]:
+        """Offset (start, end) setiap kalimat dalam teks"""
+        ranges = self.sentence_token_ranges
+        return [
+            (self.token_starts[ranges[i]], self.token_ends[ranges[i + 1] - 1])
+            for i in range(0, len(ranges), 2)
+        ]
+
+    @property
+    def sentences(self) -> List[str]:
+        text = self.text
+        return [text[start:end] for start, end in self.sentence_spans]
+
+    def sentence_word_counts(self) -> List[int]:
+        ranges = self.sentence_token_ranges
+        return [ranges[i + 1] - ranges[i] for i in range(0, len(ranges), 2)]
+
+
+COUNT_FIELDS = TextStats.__slots__
+SENTENCE_INDEX = COUNT_FIELDS.index("sentence_count")
+SEGMENT_INDEX = COUNT_FIELDS.index("segment_count")
+
+# Karakter spasi tempat potongan teks boleh dibelah (token utuh di kedua sisi)
+WHITESPACE = " \n\t\r\f\v"
+# Token tanpa spasi yang lebih panjang dari ini diproses tanpa menunggu chunk berikutnya,
+# agar memori tetap sebesar satu chunk. Token seperti itu bisa terpotong menjadi beberapa
+# kata sehingga counter-nya berbeda dari compute_text_stats (lihat TextStatsAccumulator)
+MAX_CARRY_LENGTH = 1 << 16
+# Akhir kalimat: tanda akhir sebagai karakter terakhir token (diikuti spasi)
+SENTENCE_END_PATTERN = re.compile(r"[.!?](?=\s)")
+
+
+class TextStatsAccumulator:
+    """
+    Membangun TextStats secara bertahap dari potongan teks (misalnya file upload).
+    Token yang terpotong di batas chunk ditahan sampai chunk berikutnya dan status
+    kalimat terbuka dibawa antar chunk, jadi hasilnya sama dengan compute_text_stats
+    untuk seluruh teks. Memori hanya sebesar satu chunk.
+
+    Pengecualian: token tanpa spasi yang lebih panjang dari MAX_CARRY_LENGTH tidak
+    ditahan utuh. Token itu dipotong di batas chunk dan setiap potongan dihitung
+    sebagai kata sendiri (word_count, suku kata, dan lainnya ikut berbeda). Teks
+    seperti itu bukan teks bacaan sehingga skornya tidak bermakna.
+
+    Jika `section_size` > 0, statistik juga dipecah per bagian: bagian ditutup di akhir
+    kalimat pertama setelah minimal `section_size` karakter. Dengan `document`, offset
+    token dan batas kalimat juga dicatat dan finish() mengisi counter dokumen itu.
+    """
+
+    def __init__(self, section_size: int = 0, document: Optional[AnalyzedDocument] = None):
+        self.section_size = section_size
+        self.document = document
+        # Index token pertama kalimat yang sedang terbuka (hanya dengan `document`)
+        self._sentence_first_token = 0
+        # Counter kumulatif dengan urutan COUNT_FIELDS; segmen = jumlah kelompok tanda akhir
+        self._counts = [0] * len(COUNT_FIELDS)
+        # Offset akhir setiap bagian yang sudah ditutup dan counter kumulatif saat itu
+        # (datar, len(COUNT_FIELDS) angka per bagian), yaitu prefix sum per bagian
+        self._section_ends = array("q")
+        self._section_totals = array("q")
+        self._section_start = 0
+        self._section_words = 0
+        self._open_sentence = False
+        self._carry = ""
+        self._fed = 0
+
+    @property
+    def characters_fed(self) -> int:
+        return self._fed
+
+    def feed(self, chunk: str):
+        """Proses satu potongan teks"""
+        text_start = self._fed - len(self._carry)
+        text = self._carry + chunk if self._carry else chunk
+        self._fed += len(chunk)
+
+        cut = max(text.rfind(c) for c in WHITESPACE) + 1
+        if len(text) - cut > MAX_CARRY_LENGTH:
+            cut = len(text)
+        self._carry = text[cut:]
+        if cut:
+            self._process(text, cut, text_start)
+
+    def finish(self) -> TextStats:
+        """Proses sisa teks dan kembalikan statistik keseluruhan"""
+        if self._carry:
+            self._process(self._carry, len(self._carry), self._fed - len(self._carry))
+            self._carry = ""
+        if self.section_size > 0 and self._counts[0] > self._section_words:
+            counts = list(self._counts)
+            counts[SENTENCE_INDEX] += 1 if self._open_sentence else 0
+            self._close_section(counts, self._fed)
+        document = self.document
+        if document is not None and self._sentence_first_token < self._counts[0]:
+            document.sentence_token_ranges.append(self._sentence_first_token)
+            document.sentence_token_ranges.append(self._counts[0])
+            self._sentence_first_token = self._counts[0]
+        return _stats_from_counts(self._counts, self._open_sentence, document)
+
+    def _close_section(self, counts: List[int], end: int):
+        self._section_ends.append(end)
+        self._section_totals.extend(counts)
+        self._section_start = end
+        self._section_words = counts[0]
+
+    def section_prefix_sums(self) -> np.ndarray:
+        """Counter kumulatif per bagian sebagai array (bagian + 1, COUNT_FIELDS), baris pertama nol"""
+        totals = np.frombuffer(self._section_totals, dtype=np.int64).reshape(-1, len(COUNT_FIELDS))
+        return np.vstack((np.zeros((1, len(COUNT_FIELDS)), dtype=np.int64), totals))
+
+    def section_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Offset awal dan akhir setiap bagian"""
+        ends = np.frombuffer(self._section_ends, dtype=np.int64)
+        return np.concatenate(([0], ends))[:-1].astype(np.int64), ends.copy()
+
+    @property
+    def sections(self) -> List[Tuple[int, int, TextStats]]:
+        """Bagian yang sudah ditutup: (offset awal, offset akhir, statistik)"""
+        prefix = self.section_prefix_sums().tolist()
+        starts, ends = self.section_bounds()
+        return [
+            (start, end, _stats_from_counts([b - a for a, b in zip(prefix[i], prefix[i + 1])], False))
+            for i, (start, end) in enumerate(zip(starts.tolist(), ends.tolist()))
+        ]
+
+    def _process(self, text: str, end: int, text_start: int):
+        (words, sentences, terminators, chars, letters, syllables,
+         polysyllables, short_words, long_words, unfamiliar_words) = self._counts
+        open_sentence = self._open_sentence
+        section_size = self.section_size
+        document = self.document
+        if document is not None:
+            token_starts = document.token_starts
+            token_ends = document.token_ends
+            sentence_ranges = document.sentence_token_ranges
+            sentence_first_token = self._sentence_first_token
+
+        for match in TOKEN_PATTERN.finditer(text, 0, end):
+            token = match.group()
+            length = len(token)
+            words += 1
+            if document is not None:
+                token_starts.append(text_start + match.start())
+                token_ends.append(text_start + match.end())
+            chars += length
+            if length <= SHORT_WORD_LENGTH:
+                short_words += 1
+            elif length > LONG_WORD_LENGTH:
+                long_words += 1
+
+            letters += length if token.isalnum() else sum(1 for c in token if c.isalnum())
+
+            token_syllables = count_syllables(token)
+            if token_syllables >= POLYSYLLABLE_MIN:
+                polysyllables += 1
+            syllables += token_syllables
+
+            if not is_familiar_word(token):
+                unfamiliar_words += 1
+
+            open_sentence = True
+            if "." in token or "!" in token or "?" in token:
+                terminators += len(TERMINATOR_PATTERN.findall(token))
+                if token[-1] in TERMINATORS:
+                    sentences += 1
+                    open_sentence = False
+                    if document is not None:
+                        sentence_ranges.append(sentence_first_token)
+                        sentence_ranges.append(words)
+                        sentence_first_token = words
+                    token_end = text_start + match.end()
+                    if section_size > 0 and token_end - self._section_start >= section_size:
+                        self._close_section([
+                            words, sentences, terminators, chars, letters, syllables,
+                            polysyllables, short_words, long_words, unfamiliar_words
+                        ], token_end)
+
+        self._counts = [
+            words, sentences, terminators, chars, letters, syllables,
+            polysyllables, short_words, long_words, unfamiliar_words
+        ]
+        self._open_sentence = open_sentence
+        if document is not None:
+            self._sentence_first_token = sentence_first_token
+
+
+def _stats_from_counts(counts: List[int], open_sentence: bool, stats: Optional[TextStats] = None) -> TextStats:
+    if stats is None:
+        stats = TextStats()
+    for name, value in zip(COUNT_FIELDS, counts):
+        setattr(stats, name, value)
+    # Kalimat terakhir tanpa tanda akhir tetap dihitung; segmen lama = 1 + kelompok tanda akhir
+    stats.sentence_count += 1 if open_sentence else 0
+    stats.segment_count += 1
+    return stats
+
+
+def compute_text_stats(text: str) -> TextStats:
+    """Hitung semua statistik teks dalam satu kali jalan"""
+    accumulator = TextStatsAccumulator()
+    accumulator.feed(text)
+    return accumulator.finish()
+
+
+def analyze_text(text: str) -> AnalyzedDocument:
+    """Tokenisasi, segmentasi kalimat, dan semua counter dalam satu kali jalan"""
+    document = AnalyzedDocument(text)
+    accumulator = TextStatsAccumulator(document=document)
+    accumulator.feed(text)
+    accumulator.finish()
+    return document
+
+
+def split_at_sentences(text: str, parts: int, min_size: int = 1) -> List[Tuple[int, int]]:
+    """
+    Batas (awal, akhir) untuk memecah teks menjadi sekitar `parts` bagian yang sama besar.
+    Setiap potongan jatuh tepat setelah token yang diakhiri tanda akhir kalimat,
+    sehingga statistik per bagian bisa digabung dengan merge_text_stats tanpa selisih.
+    """
+    size = max(min_size, -(-len(text) // max(1, parts)))
+    bounds = []
+    start = 0
+    while len(text) - start > size:
+        match = SENTENCE_END_PATTERN.search(text, start + size)
+        if match is None:
+            break
+        bounds.append((start, match.end()))
+        start = match.end()
+    bounds.append((start, len(text)))
+    return bounds
+
+
+def merge_text_stats(parts: List[TextStats]) -> TextStats:
+    """
+    Gabungkan statistik bagian-bagian teks yang dipotong di akhir kalimat.
+    Semua counter dijumlahkan (asosiatif, urutan penggabungan bebas); segment_count
+    setiap bagian sudah berisi +1 sehingga dikurangi satu untuk setiap sambungan.
+    """
+    merged = TextStats()
+    if not parts:
+        return merged
+    for name in COUNT_FIELDS:
+        setattr(merged, name, sum(getattr(stats, name) for stats in parts))
+    merged.segment_count -= max(0, len(parts) - 1)
+    return merged
+
+
+def compute_sentence_stats(text: str) -> Tuple[TextStats, "SentencePrefixSums"]:
+    """Statistik keseluruhan dan prefix sum per kalimat dalam satu kali jalan yang sama"""
+    accumulator = TextStatsAccumulator(section_size=1)
+    accumulator.feed(text)
+    stats = accumulator.finish()
+    return stats, SentencePrefixSums.from_accumulator(accumulator)
+
+
+class TextStatsBatch:
+    """
+    Statistik banyak dokumen sebagai array NumPy (satu elemen per dokumen).
+    Atribut dan properti sama dengan TextStats, jadi rumus metrik yang ditulis
+    dengan operasi NumPy bisa dihitung sekaligus untuk seluruh korpus.
+    """
+
+    FIELDS = TextStats.__slots__
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        for name in self.FIELDS:
+            setattr(self, name, columns[name])
+
+    def __len__(self) -> int:
+        return len(self.word_count)
+
+    @classmethod
+    def from_texts(cls, texts: List[str]) -> "TextStatsBatch":
+        return cls.from_stats([compute_text_stats(text) for text in texts])
+
+    @classmethod
+    def from_stats(cls, stats: List[TextStats]) -> "TextStatsBatch":
+        return cls({
+            name: np.fromiter((getattr(s, name) for s in stats), dtype=np.int64, count=len(stats))
+            for name in cls.FIELDS
+        })
+
+    @classmethod
+    def concatenate(cls, batches: List["TextStatsBatch"]) -> "TextStatsBatch":
+        return cls({
+            name: np.concatenate([getattr(batch, name) for batch in batches])
+            for name in cls.FIELDS
+        })
+
+    def document(self, index: int) -> TextStats:
+        """TextStats untuk satu dokumen"""
+        stats = TextStats()
+        for name in self.FIELDS:
+            setattr(stats, name, int(getattr(self, name)[index]))
+        return stats
+
+    @staticmethod
+    def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        return np.divide(
+            numerator, denominator,
+            out=np.zeros(len(numerator), dtype=np.float64),
+            where=denominator > 0
+        )
+
+    @property
+    def medium_word_count(self) -> np.ndarray:
+        return self.word_count - self.short_word_count - self.long_word_count
+
+    @property
+    def avg_words_per_segment(self) -> np.ndarray:
+        return self._ratio(self.word_count, self.segment_count)
+
+    @property
+    def avg_words_per_sentence(self) -> np.ndarray:
+        return self._ratio(self.word_count, self.sentence_count)
+
+    @property
+    def avg_syllables_per_word(self) -> np.ndarray:
+        return self._ratio(self.syllable_count, self.word_count)
+
+    @property
+    def avg_letters_per_word(self) -> np.ndarray:
+        return self._ratio(self.letter_count, self.word_count)
+
+    @property
+    def long_word_ratio(self) -> np.ndarray:
+        return self._ratio(self.long_word_count, self.word_count)
+
+    @property
+    def unfamiliar_word_ratio(self) -> np.ndarray:
+        return self._ratio(self.unfamiliar_word_count, self.word_count)
+
+
+class SentencePrefixSums:
+    """
+    Counter kumulatif per kalimat (prefix sum).
+    Statistik jendela kalimat [first, last) = prefix[last] - prefix[first], jadi setiap
+    jendela dijawab tanpa memproses ulang teks dan semua jendela dihitung secara vektor.
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, prefix: np.ndarray):
+        self.starts = starts
+        self.ends = ends
+        self.prefix = prefix
+
+    @classmethod
+    def from_accumulator(cls, accumulator: TextStatsAccumulator) -> "SentencePrefixSums":
+        starts, ends = accumulator.section_bounds()
+        return cls(starts, ends, accumulator.section_prefix_sums())
+
+    def __len__(self) -> int:
+        return len(self.ends)
+
+    def window_stats(self, first: np.ndarray, last: np.ndarray) -> TextStatsBatch:
+        """Statistik jendela kalimat [first[i], last[i]) untuk semua i sekaligus"""
+        counts = self.prefix[last] - self.prefix[first]
+        columns = {name: counts[:, index] for index, name in enumerate(COUNT_FIELDS)}
+        # Segmen lama = 1 + kelompok tanda akhir, seperti compute_text_stats pada teks jendela
+        columns["segment_count"] = columns["segment_count"] + 1
+        return TextStatsBatch(columns)
+
+    def sentence_stats(self) -> TextStatsBatch:
+        indices = np.arange(len(self))
+        return self.window_stats(indices, indices + 1)
+
+    def sliding_windows(self, size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Indeks (first, last) semua jendela `size` kalimat berurutan"""
+        first = np.arange(max(0, len(self) - size + 1))
+        return first, first + size
@@ -0,0 +1,37 @@
+"""
+Statistik teks untuk dokumen sangat besar secara map-reduce.
+
+Teks dipecah di akhir kalimat menjadi satu bagian per worker, setiap bagian dihitung
+di process pool (map), lalu counter-nya digabung dengan merge_text_stats (reduce).
+Hasilnya identik dengan compute_text_stats untuk seluruh teks.
+"""
+import asyncio
+import os
+from typing import Optional
+
+from app.utils.executors import process_pool_workers, run_cpu_bound, run_in_process
+from app.utils.text_stats import TextStats, compute_text_stats, merge_text_stats, split_at_sentences
+
+# Teks di bawah ukuran ini (karakter) dihitung serial; overhead kirim ke proses lain tidak sebanding
+PARALLEL_MIN_SIZE = int(os.getenv("EVALUATE_PARALLEL_MIN_SIZE", 1_000_000))
+# Ukuran minimal satu bagian
+PARALLEL_SHARD_SIZE = int(os.getenv("EVALUATE_PARALLEL_SHARD_SIZE", 256 * 1024))
+
+
+async def compute_text_stats_parallel(
+    text: str,
+    workers: Optional[int] = None,
+    min_size: int = PARALLEL_MIN_SIZE
+) -> TextStats:
+    """TextStats seluruh teks; dibagi ke beberapa proses jika teksnya besar"""
+    workers = workers or process_pool_workers()
+    if workers <= 1 or len(text) < min_size:
+        return await run_cpu_bound(compute_text_stats, text, pure=True)
+
+    bounds = split_at_sentences(text, workers, min_size=PARALLEL_SHARD_SIZE)
+    if len(bounds) == 1:
+        return await run_cpu_bound(compute_text_stats, text, pure=True)
+    parts = await asyncio.gather(*(
+        run_in_process(compute_text_stats, text[start:end]) for start, end in bounds
+    ))
+    return merge_text_stats(parts)
@@ -0,0 +1,167 @@
+"""
+Indeks approximate nearest neighbour (IVF) dengan NumPy saja.
+
+Vektor (sudah dinormalkan L2) dikelompokkan dengan spherical k-means menjadi
+`nlist` daftar. Semua vektor disimpan dalam satu matriks float32 kontigu yang
+diurutkan per daftar, jadi satu daftar adalah irisan tanpa salinan. Query hanya
+menghitung kemiripan ke centroid lalu ke isi `nprobe` daftar terdekat.
+
+Vektor baru masuk ke buffer kecil yang dicari secara brute force dan digabung ke
+matriks utama (tanpa melatih ulang centroid) jika sudah cukup besar.
+"""
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+IVF_NPROBE = int(os.getenv("IVF_NPROBE", 16))
+# Di bawah jumlah vektor ini indeks mencari secara brute force (satu daftar)
+IVF_MIN_TRAIN = 4096
+IVF_TRAIN_ITERATIONS = 10
+# Jumlah sampel pelatihan per centroid
+IVF_SAMPLES_PER_LIST = 64
+ASSIGN_CHUNK_SIZE = 65536
+PENDING_MERGE_SIZE = 4096
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indeks k skor tertinggi, terurut menurun"""
+    if len(scores) <= k:
+        return np.argsort(-scores, kind="stable")
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def brute_force_search(vectors: np.ndarray, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Baris dan skor k vektor paling mirip (hasil kali titik) secara eksak"""
+    scores = vectors @ query
+    rows = top_k(scores, k)
+    return rows, scores[rows]
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    assignment = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), ASSIGN_CHUNK_SIZE):
+        chunk = vectors[start:start + ASSIGN_CHUNK_SIZE]
+        assignment[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignment
+
+
+def train_centroids(vectors: np.ndarray, nlist: int, iterations: int = IVF_TRAIN_ITERATIONS, seed: int = 0) -> np.ndarray:
+    """Spherical k-means pada sampel vektor"""
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(vectors), nlist * IVF_SAMPLES_PER_LIST)
+    sample = vectors[np.sort(rng.choice(len(vectors), sample_size, replace=False))]
+    centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = _assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, sample)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        # Centroid tanpa anggota diganti vektor sampel acak
+        empty = norms[:, 0] == 0
+        sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+        norms[empty] = 1.0
+        centroids = (sums / norms).astype(np.float32)
+    return centroids
+
+
+class IVFIndex:
+    """Pencarian vektor terdekat (cosine) dengan inverted file list"""
+
+    def __init__(self, dim: int, nprobe: int = IVF_NPROBE):
+        self.dim = dim
+        self.nprobe = nprobe
+        self.centroids = np.zeros((0, dim), dtype=np.float32)
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self._pending_vectors: List[np.ndarray] = []
+        self._pending_ids: List[int] = []
+        self._removed: set = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.ids) + len(self._pending_ids) - len(self._removed)
+
+    @property
+    def nlist(self) -> int:
+        return len(self.centroids)
+
+    def build(self, vectors: np.ndarray, ids: np.ndarray, nlist: Optional[int] = None, seed: int = 0):
+        """Latih centroid dan susun ulang semua vektor per daftar"""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        ids = np.asarray(ids, dtype=np.int64)
+        if nlist is None:
+            nlist = int(np.sqrt(len(vectors))) if len(vectors) >= IVF_MIN_TRAIN else 0
+        centroids = train_centroids(vectors, nlist, seed=seed) if nlist > 1 else np.zeros((0, self.dim), dtype=np.float32)
+        with self._lock:
+            self.centroids = centroids
+            self._pending_vectors, self._pending_ids, self._removed = [], [], set()
+            self._arrange(vectors, ids)
+
+    def _arrange(self, vectors: np.ndarray, ids: np.ndarray):
+        if self.nlist > 1:
+            assignment = _assign(vectors, self.centroids)
+            order = np.argsort(assignment, kind="stable")
+            self.vectors = vectors[order]
+            self.ids = ids[order]
+            self.offsets = np.searchsorted(assignment[order], np.arange(self.nlist + 1))
+        else:
+            self.vectors = vectors
+            self.ids = ids
+            self.offsets = np.array([0, len(ids)], dtype=np.int64)
+
+    def add(self, vector: np.ndarray, vector_id: int):
+        """Tambah satu vektor; id harus baru (ganti vektor lama dengan remove + id baru)"""
+        with self._lock:
+            self._pending_vectors.append(np.asarray(vector, dtype=np.float32))
+            self._pending_ids.append(vector_id)
+            if len(self._pending_ids) >= PENDING_MERGE_SIZE:
+                self._merge_pending()
+
+    def remove(self, vector_id: int):
+        with self._lock:
+            self._removed.add(vector_id)
+
+    def _merge_pending(self):
+        vectors = np.concatenate((self.vectors, np.vstack(self._pending_vectors)))
+        ids = np.concatenate((self.ids, np.array(self._pending_ids, dtype=np.int64)))
+        if self._removed:
+            keep = ~np.isin(ids, np.fromiter(self._removed, dtype=np.int64))
+            vectors, ids = vectors[keep], ids[keep]
+            self._removed = set()
+        self._pending_vectors, self._pending_ids = [], []
+        self._arrange(vectors, ids)
+
+    def search(self, query: np.ndarray, k: int = 5, nprobe: Optional[int] = None) -> List[Tuple[int, float]]:
+        """(id, cosine similarity) untuk k vektor terdekat"""
+        query = np.asarray(query, dtype=np.float32)
+        with self._lock:
+            fetch = k + len(self._removed)
+            if self.nlist > 1:
+                probes = top_k(self.centroids @ query, min(nprobe or self.nprobe, self.nlist))
+                score_parts = [self.vectors[self.offsets[p]:self.offsets[p + 1]] @ query for p in probes]
+                id_parts = [self.ids[self.offsets[p]:self.offsets[p + 1]] for p in probes]
+            else:
+                score_parts, id_parts = [self.vectors @ query], [self.ids]
+            if self._pending_ids:
+                score_parts.append(np.vstack(self._pending_vectors) @ query)
+                id_parts.append(np.array(self._pending_ids, dtype=np.int64))
+            scores = np.concatenate(score_parts)
+            ids = np.concatenate(id_parts)
+            rows = top_k(scores, fetch)
+            results = [(int(ids[row]), float(scores[row])) for row in rows if int(ids[row]) not in self._removed]
+        return results[:k]
+
+    def get_stats(self) -> Dict[str, int]:
+        sizes = np.diff(self.offsets)
+        return {
+            "vectors": len(self),
+            "dim": self.dim,
+            "nlist": self.nlist,
+            "nprobe": self.nprobe,
+            "pending": len(self._pending_ids),
+            "largest_list": int(sizes.max()) if len(sizes) else 0
+        }
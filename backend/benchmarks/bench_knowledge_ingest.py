@@ -0,0 +1,70 @@
+"""
+Benchmark ingestion glosarium JSONL ke knowledge base tutor.
+
+Menulis glosarium sintetis (default 1M konsep) ke file JSONL sementara, lalu
+menjalankan TutorService.ingest_knowledge: tulis snapshot SQLite, bangun semua
+indeks, dan pasang. Melaporkan throughput per fase dan puncak memori proses,
+yang seharusnya ditentukan oleh ukuran indeks, bukan ukuran file.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_knowledge_ingest.py [--documents 1000000]
+"""
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.tutor_service import TutorService
+from app.utils.knowledge_ingest import IngestionJob
+from benchmarks.bench_tutor_ranker import generate_glossary
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="bench-ingest-"))
+    source = workdir / "glossary.jsonl"
+    start = time.perf_counter()
+    with open(source, "w", encoding="utf-8") as f:
+        for concept, knowledge in generate_glossary(args.documents):
+            f.write(json.dumps(dict(knowledge, concept=concept), ensure_ascii=False) + "\n")
+    size = os.path.getsize(source)
+    print(f"wrote {args.documents} lines ({size / 2**20:.0f} MB) in {time.perf_counter() - start:.2f}s")
+
+    service = TutorService(str(workdir / "knowledge.db"))
+    baseline = peak_rss_mb()
+    job = IngestionJob(source, size)
+    phases = {}
+    start = time.perf_counter()
+    service.ingest_knowledge(job)
+    stats = job.to_dict()
+    if stats["phase"] != "done":
+        raise SystemExit(f"ingestion failed: {stats['error']}")
+    phases["loading"] = job.loaded_at - job.started_at
+    phases["indexing + swap"] = job.finished_at - job.loaded_at
+    print(f"ingested {stats['concepts']} concepts in {time.perf_counter() - start:.2f}s")
+    for phase, seconds in phases.items():
+        print(f"  {phase:<16} {seconds:7.2f}s  {args.documents / seconds:>10,.0f} docs/s")
+    print(f"  loading throughput {stats['lines_per_second']:,.0f} lines/s, {stats['mb_per_second']} MB/s")
+    print(f"peak RSS {peak_rss_mb():.0f} MB (before ingestion {baseline:.0f} MB)")
+    print(f"index stats: {service.get_knowledge_stats()}")
+
+    for path in workdir.iterdir():
+        path.unlink()
+    workdir.rmdir()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark penggantian leksikon: trie satu kali jalan vs loop str.replace.
+
+Throughput LexiconSubstitutor harus tetap datar saat leksikon tumbuh
+dari 10 sampai 50k entri, sedangkan loop str.replace melambat linear.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_lexicon.py
+"""
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.lexicon import LEXICON_DIR, LexiconSubstitutor
+
+LEXICON_SIZES = [10, 100, 1_000, 10_000, 50_000]
+NAIVE_MAX_SIZE = 10_000  # str.replace di atas ini terlalu lambat untuk diukur
+DOCUMENT_WORDS = 20_000
+REPEATS = 3
+
+
+def _random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 12)))
+
+
+def build_lexicon(size: int, rng: random.Random) -> dict:
+    lexicon = dict(LexiconSubstitutor._read_pairs(LEXICON_DIR / "simplification_id.tsv"))
+    while len(lexicon) < size:
+        lexicon["mem" + _random_word(rng)] = _random_word(rng)
+    return dict(list(lexicon.items())[:size])
+
+
+def build_document(lexicon: dict, rng: random.Random) -> str:
+    keys = list(lexicon)
+    words = []
+    for i in range(DOCUMENT_WORDS):
+        # Sekitar 10% kata ada di leksikon
+        words.append(rng.choice(keys) if rng.random() < 0.1 else _random_word(rng))
+        if i % 12 == 11:
+            words[-1] += "."
+    return " ".join(words)
+
+
+def naive_replace(lexicon: dict, text: str) -> str:
+    for complex_word, simple_word in lexicon.items():
+        text = text.replace(complex_word, simple_word)
+    return text
+
+
+def measure(fn, text: str) -> float:
+    """Return throughput terbaik dalam MB/s"""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return len(text.encode("utf-8")) / best / 1e6
+
+
+def main():
+    rng = random.Random(42)
+    print(f"Document: {DOCUMENT_WORDS} words")
+    print(f"{'entries':>8} {'compile (ms)':>13} {'trie MB/s':>10} {'str.replace MB/s':>17}")
+
+    for size in LEXICON_SIZES:
+        lexicon = build_lexicon(size, rng)
+        text = build_document(lexicon, rng)
+
+        start = time.perf_counter()
+        substitutor = LexiconSubstitutor(lexicon)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        trie_mbps = measure(substitutor.substitute, text)
+        if size <= NAIVE_MAX_SIZE:
+            naive = f"{measure(lambda t: naive_replace(lexicon, t), text):17.2f}"
+        else:
+            naive = f"{'-':>17}"
+
+        print(f"{size:>8} {compile_ms:>13.1f} {trie_mbps:>10.2f} {naive}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark evaluasi map-reduce satu dokumen besar.
+
+Dokumen dipecah di akhir kalimat menjadi satu bagian per worker, dihitung di
+process pool, lalu counter-nya digabung. Skrip ini membandingkan waktu 1..N worker
+dengan compute_text_stats serial dan memastikan statistiknya identik.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_parallel_evaluation.py [--sizes 2,8] [--workers 1,2,4]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.executors import shutdown_executors
+from app.utils.text_stats import COUNT_FIELDS, compute_text_stats
+from app.utils.text_stats_parallel import compute_text_stats_parallel
+from benchmarks.corpus import generate_corpus
+
+REPEATS = 3
+
+
+def counts(stats):
+    return [getattr(stats, name) for name in COUNT_FIELDS]
+
+
+async def time_parallel(text: str, workers: int):
+    """Waktu terbaik dari beberapa putaran; putaran pertama menghangatkan pool dan cache worker"""
+    os.environ["CPU_EXECUTOR_WORKERS"] = str(workers)
+    shutdown_executors()
+    stats = await compute_text_stats_parallel(text, workers=workers, min_size=0)
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        await compute_text_stats_parallel(text, workers=workers, min_size=0)
+        best = min(best, time.perf_counter() - start)
+    shutdown_executors()
+    return best, stats
+
+
+def main():
+    cpu_count = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1))) or [1]
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="2,8", help="Ukuran dokumen dalam MB, dipisah koma")
+    parser.add_argument("--workers", default=",".join(map(str, default_workers)))
+    args = parser.parse_args()
+
+    print(f"{cpu_count} CPU cores")
+    print(f"{'size':>6} {'workers':>8} {'seconds':>9} {'MB/s':>8} {'speed-up':>9} {'exact':>6}")
+    for size_mb in (float(size) for size in args.sizes.split(",")):
+        text = generate_corpus(int(size_mb * 1024 * 1024))
+        serial = compute_text_stats(text)  # hangatkan cache suku kata/kata familiar di proses utama
+        serial_seconds = float("inf")
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            compute_text_stats(text)
+            serial_seconds = min(serial_seconds, time.perf_counter() - start)
+        print(f"{size_mb:>5g}M {'serial':>8} {serial_seconds:>9.3f} {size_mb / serial_seconds:>8.1f} {1:>8.2f}x {'':>6}")
+
+        for workers in (int(w) for w in args.workers.split(",")):
+            seconds, stats = asyncio.run(time_parallel(text, workers))
+            exact = counts(stats) == counts(serial)
+            print(
+                f"{size_mb:>5g}M {workers:>8} {seconds:>9.3f} {size_mb / seconds:>8.1f} "
+                f"{serial_seconds / seconds:>8.2f}x {'yes' if exact else 'NO':>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
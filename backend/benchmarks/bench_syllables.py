@@ -0,0 +1,88 @@
+"""
+Benchmark penghitung suku kata: loop per karakter lama vs regex + cache LRU.
+
+Mengukur kata per detik pada token korpus sintetis (cache dingin dan hangat)
+dan ketepatan keduanya pada daftar kata bahasa Indonesia yang sudah dipenggal.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_syllables.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.syllables import count_syllables
+from benchmarks.corpus import generate_corpus
+
+CORPUS_BYTES = 2 * 1024 * 1024
+REPEATS = 3
+
+# Kata dan jumlah suku katanya (diftong, vokal berurutan, digraf, gugus konsonan)
+GOLD = {
+    "pantai": 2, "kerbau": 2, "harimau": 3, "sungai": 2, "amboi": 2, "survei": 2,
+    "saudara": 3, "aula": 2, "boikot": 2, "taufik": 2, "mau": 1,
+    "main": 2, "mainan": 3, "permainan": 4, "mainkan": 3, "pakaian": 3, "bauran": 2, "lautan": 2, "baik": 2, "laut": 2, "daun": 2, "air": 2, "koin": 2, "kaum": 2, "haus": 2,
+    "asuransi": 4, "investasi": 4, "subsidi": 3, "pemerintah": 4, "masyarakat": 4,
+    "nyanyi": 2, "strategi": 3, "pelayanan": 4, "bertanggung": 3, "kesehatan": 4,
+    "ekonomi": 4, "proses": 2, "kredit": 2, "khusus": 2, "syarat": 2, "premi": 2,
+}
+
+
+def legacy_count_syllables(word: str) -> int:
+    """Implementasi lama EvaluationService._count_syllables"""
+    word = word.lower()
+    vowels = "aeiou"
+    syllable_count = 0
+    prev_was_vowel = False
+
+    for char in word:
+        if char in vowels:
+            if not prev_was_vowel:
+                syllable_count += 1
+            prev_was_vowel = True
+        else:
+            prev_was_vowel = False
+
+    if word.endswith('e') and syllable_count > 1:
+        syllable_count -= 1
+
+    return max(1, syllable_count)
+
+
+def words_per_second(fn, words) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for word in words:
+            fn(word)
+        best = min(best, time.perf_counter() - start)
+    return len(words) / best
+
+
+def cold_words_per_second(words) -> float:
+    count_syllables.cache_clear()
+    start = time.perf_counter()
+    for word in words:
+        count_syllables(word)
+    return len(words) / (time.perf_counter() - start)
+
+
+def accuracy(fn) -> float:
+    return sum(fn(word) == expected for word, expected in GOLD.items()) / len(GOLD)
+
+
+def main():
+    words = generate_corpus(CORPUS_BYTES).split()
+    print(f"{len(words)} words, {len(set(words))} distinct")
+    print(f"{'implementation':<24} {'words/s':>12} {'accuracy':>9}")
+    print(f"{'legacy char loop':<24} {words_per_second(legacy_count_syllables, words):>12,.0f} {accuracy(legacy_count_syllables):>9.0%}")
+    print(f"{'regex (no cache)':<24} {words_per_second(count_syllables.__wrapped__, words):>12,.0f} {accuracy(count_syllables):>9.0%}")
+    print(f"{'regex (cold cache)':<24} {cold_words_per_second(words):>12,.0f} {accuracy(count_syllables):>9.0%}")
+    print(f"{'regex (warm cache)':<24} {words_per_second(count_syllables, words):>12,.0f} {accuracy(count_syllables):>9.0%}")
+    print(count_syllables.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark AnalyzedDocument vs jalur lama yang men-tokenisasi ulang teks.
+
+Jalur lama: setiap metrik EvaluationService dan _generate_recommendations
+memanggil text.split() dan re.split(r'[.!?]+', text) sendiri-sendiri.
+Jalur baru: analyze_text() sekali, lalu semua metrik memakai hasilnya.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_text_analysis.py
+"""
+import asyncio
+import random
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.evaluation_service import EvaluationService
+from app.utils.text_stats import analyze_text
+
+DOCUMENT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+METRICS = ["flesch_kincaid", "flesch_reading_ease", "dale_chall", "smog", "ari", "coleman_liau"]
+REPEATS = 5
+
+VOCABULARY = (
+    "pemerintah mengeluarkan peraturan mengenai subsidi energi yang berlaku mulai "
+    "triwulan kedua masyarakat wajib melaksanakan ketentuan tersebut dengan baik dan "
+    "benar sesuai prosedur pendaftaran formulir pembayaran"
+).split()
+
+
+def build_document(size: int, rng: random.Random) -> str:
+    words = []
+    length = 0
+    while length < size:
+        sentence = " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(5, 20)))
+        words.append(sentence.capitalize() + rng.choice([".", ".", "!", "?"]))
+        length += len(words[-1]) + 1
+    return " ".join(words)
+
+
+def legacy_evaluate(text: str):
+    """Salinan jalur lama: enam metrik dan rekomendasi, masing-masing men-tokenisasi ulang"""
+    results = {}
+    for metric in METRICS:
+        words = len(text.split())
+        sentences = len(re.split(r'[.!?]+', text))
+        results[metric] = words / sentences if sentences > 0 else 0
+    sentences = re.split(r'[.!?]+', text)
+    avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences)
+    words = text.split()
+    complex_ratio = len([w for w in words if len(w) > 8]) / len(words) if words else 0
+    return results, avg_sentence_length, complex_ratio
+
+
+def analyzed_evaluate(service: EvaluationService, text: str):
+    return asyncio.run(service.evaluate_text(text, METRICS, document=analyze_text(text)))
+
+
+def measure(fn):
+    """Return (waktu terbaik dalam ms, puncak alokasi dalam KB)"""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024
+
+
+def main():
+    rng = random.Random(42)
+    service = EvaluationService()
+    print(f"{'size':>10} {'legacy ms':>10} {'legacy KB':>10} {'analyzed ms':>12} {'analyzed KB':>12} {'analyze ms':>11}")
+
+    for size in DOCUMENT_SIZES:
+        text = build_document(size, rng)
+        legacy_ms, legacy_kb = measure(lambda: legacy_evaluate(text))
+        analyzed_ms, analyzed_kb = measure(lambda: analyzed_evaluate(service, text))
+        analyze_ms, _ = measure(lambda: analyze_text(text))
+        print(
+            f"{len(text):>10} {legacy_ms:>10.2f} {legacy_kb:>10.0f} "
+            f"{analyzed_ms:>12.2f} {analyzed_kb:>12.0f} {analyze_ms:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark pencarian konsep TutorService: pemindaian linear lama vs ConceptIndex.
+
+Knowledge base sintetis 1k, 100k, dan 1M konsep. Untuk setiap ukuran diukur waktu
+membangun indeks dan latency p50/p95 pencarian persis, sebagian (substring),
+salah ketik, dan istilah yang tidak ada.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_tutor_index.py [--sizes 1000,100000,1000000]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.concept_index import ConceptIndex
+
+SYLLABLES = [
+    "ba", "be", "bi", "da", "di", "ka", "ke", "ku", "la", "li", "ma", "me", "mu", "na",
+    "ni", "pa", "pe", "ra", "ri", "sa", "si", "su", "ta", "ti", "tu", "ya", "ng", "an", "in", "un"
+]
+QUERIES = 200
+# Pemindaian linear lama sangat lambat untuk 1M konsep
+LEGACY_MAX_SECONDS = 20
+
+
+def generate_concepts(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    concepts = set()
+    while len(concepts) < count:
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(3, 6)))
+        if rng.random() < 0.3:
+            name += " " + "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        concepts.add(name)
+    return list(concepts)
+
+
+def make_queries(concepts, rng: random.Random):
+    picks = rng.sample(concepts, QUERIES)
+    typo = [
+        name[:i] + name[i + 1] + name[i] + name[i + 2:]
+        for name in picks for i in [rng.randrange(len(name) - 2)]
+    ]
+    return {
+        "exact": [[name] for name in picks],
+        "partial": [[name[1:-1]] for name in picks],
+        "typo": [[name] for name in typo],
+        "miss": [["zzqxv" + str(i)] for i in range(QUERIES)]
+    }
+
+
+def legacy_lookup(knowledge_base, key_terms):
+    """Implementasi lama _find_relevant_knowledge (dua pemindaian linear)"""
+    for term in key_terms:
+        term_clean = term.strip().lower()
+        if term_clean in knowledge_base:
+            return term_clean
+    for term in key_terms:
+        term_clean = term.strip().lower()
+        for concept in knowledge_base:
+            if term_clean in concept or concept in term_clean:
+                return concept
+    return None
+
+
+def latencies(fn, queries, max_seconds=None):
+    samples = []
+    deadline = time.perf_counter() + max_seconds if max_seconds else None
+    for terms in queries:
+        start = time.perf_counter()
+        fn(terms)
+        samples.append((time.perf_counter() - start) * 1000)
+        if deadline and time.perf_counter() > deadline:
+            break
+    samples.sort()
+    return statistics.median(samples), samples[int(0.95 * (len(samples) - 1))], len(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    args = parser.parse_args()
+
+    print(f"{'concepts':>9} {'query':>8} {'impl':>7} {'p50 ms':>9} {'p95 ms':>9} {'n':>5}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        concepts = generate_concepts(size)
+        knowledge_base = dict.fromkeys(concepts, {})
+
+        start = time.perf_counter()
+        index = ConceptIndex(concepts)
+        print(f"{size:>9} built index in {time.perf_counter() - start:.2f}s")
+
+        queries = make_queries(concepts, random.Random(size))
+        for kind, terms in queries.items():
+            for name, fn, limit in (
+                ("legacy", lambda t: legacy_lookup(knowledge_base, t), LEGACY_MAX_SECONDS),
+                ("index", index.lookup, None)
+            ):
+                p50, p95, n = latencies(fn, terms, limit)
+                print(f"{size:>9} {kind:>8} {name:>7} {p50:>9.3f} {p95:>9.3f} {n:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark ranking BM25 konsep tutor (ConceptRanker).
+
+Membangun indeks dari glosarium sintetis (default 100k konsep), lalu mengukur
+latency p50/p95 query top-5, penambahan konsep inkremental, dan penggabungan delta.
+
+Jalankan dari folder backend:
+    python benchmarks/bench_tutor_ranker.py [--documents 100000]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.concept_ranker import ConceptRanker
+from benchmarks.corpus import CONCEPTS, MODIFIERS, OBJECTS, SUBJECTS, VERBS
+
+QUERIES = 500
+ADDS = 2000
+
+
+def vocabulary():
+    words = set(CONCEPTS)
+    for phrase in SUBJECTS + VERBS + OBJECTS + MODIFIERS:
+        words.update(phrase.lower().split())
+    return sorted(words)
+
+
+def generate_glossary(count: int, seed: int = 11):
+    rng = random.Random(seed)
+    words = vocabulary()
+    # Istilah sintetis tambahan agar kosakata tumbuh seperti glosarium nyata
+    words += [f"istilah{i}" for i in range(count // 10)]
+    for i in range(count):
+        concept = f"{rng.choice(words)} {i}"
+        yield concept, {
+            "definition": " ".join(rng.choices(words, k=rng.randint(8, 20))),
+            "simple_explanation": " ".join(rng.choices(words, k=rng.randint(10, 30))),
+            "examples": [],
+            "related_concepts": rng.sample(words, 3)
+        }
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return statistics.median(samples), samples[int(0.95 * (len(samples) - 1))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=100_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    ranker = ConceptRanker(generate_glossary(args.documents))
+    print(f"built {args.documents} documents in {time.perf_counter() - start:.2f}s: {ranker.get_stats()}")
+
+    rng = random.Random(3)
+    words = vocabulary()
+    for length in (1, 3, 6):
+        samples = []
+        for _ in range(QUERIES):
+            query = " ".join(rng.sample(words, length))
+            start = time.perf_counter()
+            ranker.search(query, top_k=5)
+            samples.append((time.perf_counter() - start) * 1000)
+        p50, p95 = percentiles(samples)
+        print(f"search {length}-word query: p50 {p50:.3f} ms, p95 {p95:.3f} ms")
+
+    samples = []
+    for concept, knowledge in generate_glossary(ADDS, seed=99):
+        start = time.perf_counter()
+        ranker.add(f"baru {concept}", knowledge)
+        samples.append((time.perf_counter() - start) * 1000)
+    p50, p95 = percentiles(samples)
+    print(f"incremental add: p50 {p50:.3f} ms, p95 {p95:.3f} ms, max {max(samples):.1f} ms")
+
+    samples = []
+    for _ in range(QUERIES):
+        query = " ".join(rng.sample(words, 3))
+        start = time.perf_counter()
+        ranker.search(query, top_k=5)
+        samples.append((time.perf_counter() - start) * 1000)
+    p50, p95 = percentiles(samples)
+    print(f"search with {ranker.get_stats()['delta_rows']} delta rows: p50 {p50:.3f} ms, p95 {p95:.3f} ms")
+
+    start = time.perf_counter()
+    ranker.compact()
+    print(f"compact: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
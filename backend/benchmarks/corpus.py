@@ -0,0 +1,51 @@
+"""Korpus sintetis bahasa Indonesia untuk benchmark"""
+import random
+from typing import List
+
+SUBJECTS = [
+    "Pemerintah", "Masyarakat", "Pemohon", "Nasabah", "Peserta", "Warga",
+    "Instansi terkait", "Pemerintah daerah", "Kementerian", "Petugas"
+]
+VERBS = [
+    "mengeluarkan", "melaksanakan", "menyampaikan", "memperoleh", "mengajukan",
+    "menyelenggarakan", "memverifikasi", "mendistribusikan", "mengevaluasi", "melengkapi"
+]
+OBJECTS = [
+    "peraturan mengenai subsidi energi", "permohonan bantuan sosial", "dokumen persyaratan",
+    "formulir pendaftaran online", "kebijakan tarif listrik", "laporan realisasi anggaran",
+    "ketentuan pembayaran iuran", "sosialisasi program kesehatan", "kompensasi kepada penduduk",
+    "informasi jatuh tempo angsuran"
+]
+MODIFIERS = [
+    "yang berlaku mulai triwulan kedua", "sesuai dengan ketentuan yang berlaku",
+    "dalam rangka meningkatkan kesejahteraan", "selambat-lambatnya tanggal 30",
+    "berdasarkan regulasi terbaru", "secara komprehensif dan efisien",
+    "apabila persyaratan telah dipenuhi", "dan wajib melampirkan identitas",
+    "sehingga pelaksanaan menjadi optimal", "karena adanya perubahan anggaran"
+]
+CONCEPTS = ["asuransi", "subsidi", "investasi"]
+
+
+def generate_sentence(rng: random.Random) -> str:
+    parts = [rng.choice(SUBJECTS), rng.choice(VERBS), rng.choice(OBJECTS)]
+    parts.extend(rng.sample(MODIFIERS, rng.randint(0, 3)))
+    return " ".join(parts) + rng.choice([".", ".", ".", "!", "?"])
+
+
+def generate_corpus(size_bytes: int, seed: int = 42) -> str:
+    """Teks sintetis sekitar `size_bytes` byte, selalu sama untuk seed yang sama"""
+    rng = random.Random(seed)
+    sentences: List[str] = []
+    length = 0
+    while length < size_bytes:
+        sentence = generate_sentence(rng)
+        sentences.append(sentence)
+        length += len(sentence.encode("utf-8")) + 1
+    return " ".join(sentences)
+
+
+def generate_questions(count: int, seed: int = 42) -> List[str]:
+    """Pertanyaan tutor dengan variasi pola"""
+    rng = random.Random(seed)
+    patterns = ["Apa itu {}?", "apa maksud {} ?", "Jelaskan {}?", "Definisi {}?", "Bagaimana cara kerja {}"]
+    return [rng.choice(patterns).format(rng.choice(CONCEPTS)) for _ in range(count)]
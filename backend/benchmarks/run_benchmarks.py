@@ -0,0 +1,219 @@
+"""
+Benchmark suite untuk semua service BuddyText.
+
+Setiap service dipanggil langsung (tanpa HTTP) dengan korpus sintetis
+bahasa Indonesia dari 1 KB sampai 10 MB. Hasil berisi throughput, latency
+p50/p95/p99, dan puncak memori, lalu disimpan sebagai JSON. Jika baseline
+diberikan, hasil dibandingkan dan regresi ditandai (exit code 1).
+
+Jalankan dari folder backend:
+    python benchmarks/run_benchmarks.py --output benchmarks/results/latest.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/results/baseline.json
+    python benchmarks/run_benchmarks.py --sizes 1KB,100KB --services evaluation
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.evaluation_service import EvaluationService
+from app.services.step_by_step_service import StepByStepService
+from app.services.text_simplification_service import TextSimplificationService
+from app.services.tutor_service import TutorService
+from benchmarks.corpus import generate_corpus, generate_questions
+
+DEFAULT_SIZES = ["1KB", "10KB", "100KB", "1MB", "10MB"]
+ALL_METRICS = ["flesch_kincaid", "flesch_reading_ease", "dale_chall", "smog", "ari", "coleman_liau"]
+UNITS = {"KB": 1024, "MB": 1024 * 1024}
+
+
+def parse_size(size: str) -> int:
+    size = size.strip().upper()
+    for unit, factor in UNITS.items():
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * factor)
+    return int(size)
+
+
+def percentile(values: List[float], p: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(p * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class ServiceBenchmarks:
+    """Satu fungsi benchmark per service; setiap fungsi memproses satu dokumen"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.simplification = TextSimplificationService()
+        self.evaluation = EvaluationService()
+        self.step_by_step = StepByStepService()
+        self.tutor = TutorService()
+        self.questions = generate_questions(64)
+
+    def run(self, coroutine) -> Any:
+        return self.loop.run_until_complete(coroutine)
+
+    def text_simplification(self, text: str):
+        # Kosongkan cache agar setiap iterasi benar-benar memproses teks
+        self.simplification.result_cache.clear()
+        self.simplification.sentence_cache.clear()
+        return self.run(self.simplification.simplify_text(text, max_length=len(text) + 1))
+
+    def evaluation_metrics(self, text: str):
+        return self.run(self.evaluation.evaluate_text(text, ALL_METRICS))
+
+    def step_by_step_guide(self, text: str):
+        return self.run(self.step_by_step.create_guide(text))
+
+    def tutor_answer(self, text: str):
+        question = f"{text} {self.questions[len(text) % len(self.questions)]}"
+        return self.run(self.tutor.answer_question(question))
+
+    def all(self) -> Dict[str, Callable[[str], Any]]:
+        return {
+            "text_simplification": self.text_simplification,
+            "evaluation": self.evaluation_metrics,
+            "step_by_step": self.step_by_step_guide,
+            "tutor": self.tutor_answer
+        }
+
+
+def measure(fn: Callable[[str], Any], text: str, min_runs: int, max_runs: int, max_seconds: float) -> Dict[str, Any]:
+    """Ukur latency beberapa kali, lalu puncak memori pada satu run terpisah"""
+    fn(text)  # warm-up
+
+    latencies = []
+    started = time.perf_counter()
+    while len(latencies) < max_runs:
+        start = time.perf_counter()
+        fn(text)
+        latencies.append(time.perf_counter() - start)
+        if len(latencies) >= min_runs and time.perf_counter() - started > max_seconds:
+            break
+
+    tracemalloc.start()
+    fn(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    size_bytes = len(text.encode("utf-8"))
+    p50 = percentile(latencies, 0.50)
+    return {
+        "size_bytes": size_bytes,
+        "runs": len(latencies),
+        "latency_mean": statistics.mean(latencies),
+        "latency_p50": p50,
+        "latency_p95": percentile(latencies, 0.95),
+        "latency_p99": percentile(latencies, 0.99),
+        "throughput_mb_per_sec": size_bytes / p50 / 1e6 if p50 > 0 else 0.0,
+        "throughput_docs_per_sec": 1 / p50 if p50 > 0 else 0.0,
+        "peak_memory_bytes": peak
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Bandingkan latency p50 dan puncak memori dengan baseline; return daftar regresi"""
+    regressions = []
+    for service, sizes in results["results"].items():
+        for size, current in sizes.items():
+            previous = baseline.get("results", {}).get(service, {}).get(size)
+            if previous is None:
+                continue
+            for key in ("latency_p50", "peak_memory_bytes"):
+                if previous[key] > 0 and current[key] > previous[key] * (1 + threshold):
+                    change = (current[key] / previous[key] - 1) * 100
+                    regressions.append(
+                        f"{service} @ {size}: {key} {previous[key]:.6g} -> {current[key]:.6g} (+{change:.0f}%)"
+                    )
+    return regressions
+
+
+def print_table(results: Dict[str, Any]):
+    print(f"{'service':<22} {'size':>6} {'runs':>5} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'MB/s':>8} {'peak MB':>8}")
+    for service, sizes in results["results"].items():
+        for size, r in sizes.items():
+            print(
+                f"{service:<22} {size:>6} {r['runs']:>5} "
+                f"{r['latency_p50'] * 1000:>10.2f} {r['latency_p95'] * 1000:>10.2f} {r['latency_p99'] * 1000:>10.2f} "
+                f"{r['throughput_mb_per_sec']:>8.2f} {r['peak_memory_bytes'] / 1e6:>8.1f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite BuddyText")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES), help="Ukuran korpus, misalnya 1KB,1MB")
+    parser.add_argument("--services", default="", help="Service yang diukur (default: semua)")
+    parser.add_argument("--min-runs", type=int, default=3)
+    parser.add_argument("--max-runs", type=int, default=50)
+    parser.add_argument("--max-seconds", type=float, default=2.0, help="Batas waktu pengukuran per service/ukuran")
+    parser.add_argument("--output", default="", help="Simpan hasil sebagai JSON")
+    parser.add_argument("--baseline", default="", help="JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Batas regresi (0.2 = 20%% lebih lambat)")
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    benchmarks = ServiceBenchmarks(loop).all()
+    selected = [s for s in args.services.split(",") if s] or list(benchmarks)
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine()
+        },
+        "results": {}
+    }
+
+    for size in [s.strip() for s in args.sizes.split(",") if s.strip()]:
+        text = generate_corpus(parse_size(size))
+        for service in selected:
+            result = measure(benchmarks[service], text, args.min_runs, args.max_runs, args.max_seconds)
+            results["results"].setdefault(service, {})[size] = result
+
+    loop.close()
+    print_table(results)
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults saved to {output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        print(f"\nCompared with baseline {args.baseline} (commit {baseline.get('meta', {}).get('commit')})")
+        if regressions:
+            print("Regressions:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,22 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
 import uvicorn
+import asyncio
 import os
 from dotenv import load_dotenv
 
+# Load environment variables sebelum modul app diimpor: lane executor dan
+# konstanta konfigurasi di modul app dibaca dari env saat impor
+load_dotenv()
+
 from app.api.text_simplification import router as simplification_router
 from app.api.tutor import router as tutor_router
 from app.api.evaluation import router as evaluation_router
-
-# Load environment variables
-load_dotenv()
+from app.services.registry import registry, ServiceNotReadyError
+from app.utils.executors import ExecutorBusyError, get_cpu_pool_stats, get_lane_stats, shutdown_executors
 
 app = FastAPI(
     title="BuddyText API",
@@ -33,6 +38,32 @@ app.include_router(simplification_router, prefix="/api/simplify", tags=["text-si
 app.include_router(tutor_router, prefix="/api/tutor", tags=["tutor"])
 app.include_router(evaluation_router, prefix="/api/evaluate", tags=["evaluation"])
 
+@app.on_event("startup")
+async def start_warm_up():
+    # Warm-up di background agar server langsung bisa menerima request
+    if os.getenv("SERVICE_WARMUP", "True").lower() == "true":
+        app.state.warmup_task = asyncio.create_task(registry.warm_up())
+
+@app.on_event("shutdown")
+def stop_executors():
+    shutdown_executors()
+
+@app.exception_handler(ExecutorBusyError)
+async def executor_busy_handler(request: Request, exc: ExecutorBusyError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"}
+    )
+
+@app.exception_handler(ServiceNotReadyError)
+async def service_not_ready_handler(request: Request, exc: ServiceNotReadyError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "5"}
+    )
+
 @app.get("/")
 async def root():
     return {
@@ -45,6 +76,22 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: status load dan waktu warm-up setiap service"""
+    readiness = registry.readiness()
+    return JSONResponse(status_code=200 if readiness["ready"] else 503, content=readiness)
+
+@app.get("/executors/stats")
+async def executor_stats():
+    """
+    Concurrency aktif, kedalaman antrian, dan request yang ditolak per endpoint,
+    plus pemakaian pool CPU bersama (`cpu_pool`)
+    """
+    stats = get_lane_stats()
+    stats["cpu_pool"] = get_cpu_pool_stats()
+    return stats
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
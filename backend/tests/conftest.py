@@ -0,0 +1,31 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.corpus import generate_corpus
+
+# Teks dengan kasus tepi tokenisasi: spasi ganda/baris baru, tanda akhir beruntun,
+# angka desimal, kalimat terakhir tanpa tanda akhir
+EDGE_TEXTS = [
+    "",
+    "   ",
+    "Halo",
+    "Halo.",
+    "Halo.  Apa kabar?!\n\nBaik... terima kasih",
+    "Harga naik 3.5 persen. Subsidi dikurangi!",
+    "kata-kata sulit?   ya.",
+]
+
+
+@pytest.fixture
+def texts():
+    return EDGE_TEXTS + [generate_corpus(size, seed=seed) for seed, size in enumerate([200, 2_000, 20_000])]
+
+
+@pytest.fixture
+def rng():
+    return random.Random(1234)
@@ -0,0 +1,98 @@
+import json
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+# Batas waktu satu request batch; request yang macet membuat tes gagal, bukan menggantung
+BATCH_TIMEOUT = 60
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def post_batch(client, documents):
+    """POST /api/simplify/text/batch di thread terpisah; baris NDJSON sebagai dict"""
+    result = {}
+
+    def run():
+        result["response"] = client.post("/api/simplify/text/batch", json={"documents": documents})
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(BATCH_TIMEOUT)
+    assert not thread.is_alive(), "batch request did not complete"
+    response = result["response"]
+    assert response.status_code == 200
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_batch_after_single_simplify_request(client):
+    # Worker batch di-fork setelah thread pool CPU proses server sudah dipakai
+    response = client.post("/api/simplify/text", json={"text": "Pemerintah mengeluarkan peraturan mengenai subsidi."})
+    assert response.status_code == 200
+
+    lines = post_batch(client, [{"text": "Peraturan ini berlaku mulai triwulan kedua."}])
+    assert [line["status"] for line in lines] == ["ok"]
+
+
+def test_batch_lines_are_tagged_by_index(client):
+    documents = [
+        {"text": "Pemerintah mengeluarkan peraturan mengenai subsidi."},
+        {"target_level": "simple"},
+        {"text": "Masyarakat wajib melaksanakan ketentuan tersebut.", "max_length": 100}
+    ]
+    lines = post_batch(client, documents)
+
+    assert sorted(line["index"] for line in lines) == [0, 1, 2]
+    by_index = {line["index"]: line for line in lines}
+    assert by_index[1]["status"] == "error"
+    assert by_index[1]["result"] is None
+    assert "Invalid document" in by_index[1]["error"]
+
+    for index in (0, 2):
+        line = by_index[index]
+        assert line["status"] == "ok"
+        assert line["result"]["original_text"] == documents[index]["text"]
+        assert line["result"]["simplified_text"]
+
+
+def test_batch_handles_resolve_on_the_server(client):
+    lines = post_batch(client, [{"text": "Peraturan mengenai tarif listrik berlaku mulai triwulan kedua."}])
+    result = lines[0]["result"]
+
+    response = client.post("/api/evaluate/readability", json={"handle": result["readability_handle"]})
+    assert response.status_code == 200
+    assert response.json()["text"] == result["simplified_text"]
+
+
+def test_broken_worker_pool_is_replaced():
+    import asyncio
+    import os
+
+    from app.services.batch_simplification_service import BatchSimplificationService
+    from app.services.text_simplification_service import TextSimplificationService
+
+    service = BatchSimplificationService(TextSimplificationService(), max_workers=1)
+    broken = service._get_executor()
+    # Worker mati di tengah jalan -> BrokenProcessPool untuk dokumen berikutnya
+    broken.submit(os._exit, 1)
+
+    async def run(documents):
+        return [item async for item in service.simplify_batch(documents)]
+
+    try:
+        first = asyncio.run(run([{"text": "Satu kalimat saja."}]))
+        assert first[0]["status"] == "error"
+        assert service._executor is not broken
+        assert broken._shutdown_thread
+
+        second = asyncio.run(run([{"text": "Satu kalimat saja."}]))
+        assert second[0]["status"] == "ok"
+    finally:
+        service.shutdown()
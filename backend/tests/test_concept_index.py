@@ -0,0 +1,70 @@
+import pytest
+
+from app.utils.concept_index import (
+    MATCH_EXACT,
+    MATCH_FUZZY,
+    MATCH_PARTIAL,
+    ConceptIndex,
+    edit_distance,
+    ngrams
+)
+
+CONCEPTS = ["asuransi", "asuransi kesehatan", "subsidi", "investasi", "premi", "polis"]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return ConceptIndex(CONCEPTS)
+
+
+@pytest.mark.parametrize("terms, expected", [
+    (["subsidi"], ("subsidi", MATCH_EXACT)),
+    ([" Premi "], ("premi", MATCH_EXACT)),
+    # Kecocokan persis untuk istilah mana pun didahulukan
+    (["asuransi kesehatan", "polis"], ("asuransi kesehatan", MATCH_EXACT)),
+    (["asuransi mobil", "polis"], ("polis", MATCH_EXACT)),
+    # Nama konsep di dalam istilah, lalu istilah di dalam nama konsep (konsep paling awal)
+    (["asuransi mobil"], ("asuransi", MATCH_PARTIAL)),
+    (["suransi"], ("asuransi", MATCH_PARTIAL)),
+    (["kesehatan"], ("asuransi kesehatan", MATCH_PARTIAL)),
+    # Salah ketik
+    (["investsi"], ("investasi", MATCH_FUZZY)),
+    (["subsid1"], ("subsidi", MATCH_FUZZY)),
+    (["xyzw"], None),
+    ([], None),
+    ([""], None),
+])
+def test_lookup(index, terms, expected):
+    assert index.lookup(terms) == expected
+
+
+def test_matches_a_linear_scan(rng):
+    concepts = [f"konsep{i:05d}" for i in range(2000)] + CONCEPTS
+    index = ConceptIndex(concepts)
+    for _ in range(200):
+        concept = rng.choice(concepts)
+        start = rng.randint(0, len(concept) - 3)
+        term = concept[start:start + rng.randint(3, 8)]
+        # Referensi: pencarian linear lama (persis, lalu substring paling awal)
+        if term in concepts:
+            expected = (term, MATCH_EXACT)
+        else:
+            partial = [c for c in concepts if term in c or c in term]
+            expected = (partial[0], MATCH_PARTIAL)
+        assert index.lookup([term]) == expected, term
+
+
+def test_add_is_idempotent():
+    index = ConceptIndex(["subsidi"])
+    assert index.add("subsidi") == 0
+    assert index.add("pajak") == 1
+    assert len(index) == 2 and "pajak" in index
+    assert index.lookup(["pajak"]) == ("pajak", MATCH_EXACT)
+
+
+def test_helpers():
+    assert ngrams("abcd") == ["abc", "bcd"]
+    assert ngrams("ab", padded=True) == [" ab", "ab "]
+    assert edit_distance("subsidi", "subsidi", 2) == 0
+    assert edit_distance("investsi", "investasi", 2) == 1
+    assert edit_distance("abc", "xyzabc", 1) == 2
@@ -0,0 +1,42 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.evaluation_service import MIN_SECTION_SIZE
+from main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def post_file(client, text, **form):
+    return client.post(
+        "/api/evaluate/readability/file",
+        files={"file": ("dokumen.txt", text.encode("utf-8"), "text/plain")},
+        data={name: str(value) for name, value in form.items()}
+    )
+
+
+@pytest.mark.parametrize("section_size", [1, MIN_SECTION_SIZE - 1, -1])
+def test_small_section_size_is_rejected(client, section_size):
+    response = post_file(client, "Satu kalimat. Dua kalimat.", section_size=section_size)
+    assert response.status_code == 422
+
+
+def test_sections_at_the_minimum_size(client, texts):
+    text = texts[-1]
+    response = post_file(client, text, section_size=MIN_SECTION_SIZE)
+    assert response.status_code == 200
+    body = response.json()
+    sections = body["sections"]
+    assert len(sections) <= len(text) // MIN_SECTION_SIZE + 1
+    assert sections[-1]["end"] == len(text)
+    assert sum(section["word_count"] for section in sections) == body["word_count"]
+
+
+def test_section_size_zero_disables_sections(client):
+    response = post_file(client, "Satu kalimat. Dua kalimat.", section_size=0)
+    assert response.status_code == 200
+    assert response.json()["sections"] == []
@@ -0,0 +1,76 @@
+import asyncio
+import struct
+
+import pytest
+
+from app.services import evaluation_service
+from app.services.evaluation_service import FAMILIAR_WORDS_MIN_SIZE, EvaluationService
+from app.utils import familiar_words
+from app.utils.familiar_words import (
+    FamiliarWordList,
+    compile_word_list,
+    get_familiar_words,
+    load_familiar_words,
+    read_word_list
+)
+
+VOCABULARY_TIP = "Gunakan lebih banyak kata-kata yang familiar"
+
+
+def test_compiled_list_is_little_endian(tmp_path):
+    target = tmp_path / "words.bin"
+    assert compile_word_list(["rumah", "air", "Buku", "air"], target) == 3
+
+    data = target.read_bytes()
+    assert struct.unpack_from("<4sI", data) == (b"BTFW", 3)
+    # Offset kata kedua ("buku") setelah "air"
+    assert struct.unpack_from("<I", data, 8 + 4) == (3,)
+
+    words = FamiliarWordList(target)
+    assert len(words) == 3
+    assert "buku" in words and "air" in words and "rumah" in words
+    assert "mobil" not in words and "" not in words
+    words.close()
+
+
+def test_binary_goes_to_the_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(familiar_words, "FAMILIAR_WORDS_CACHE_DIR", str(cache_dir))
+    source = tmp_path / "data" / "words.txt"
+    source.parent.mkdir()
+    source.write_text("# komentar\nrumah air\nbuku\n", encoding="utf-8")
+
+    words = load_familiar_words(str(source))
+    assert len(words) == 3
+    assert list(source.parent.iterdir()) == [source]
+    assert [path.suffix for path in cache_dir.iterdir()] == [".bin"]
+    words.close()
+
+
+def test_shipped_list_is_large_enough():
+    words = get_familiar_words()
+    assert words is not None
+    assert len(words) >= FAMILIAR_WORDS_MIN_SIZE
+    for word in ("halo", "dunia", "ini", "kalimat", "pemerintah", "bantuan", "membutuhkan"):
+        assert word in words
+
+
+def test_everyday_text_is_not_flagged():
+    result = asyncio.run(EvaluationService().evaluate_text("Halo dunia. Ini kalimat.", ["dale_chall"]))
+    assert result["metrics"]["dale_chall"] < 1
+    assert VOCABULARY_TIP not in result["recommendations"]
+
+
+@pytest.mark.parametrize("min_size, expected", [(0, True), (10 ** 9, False)])
+def test_vocabulary_tip_needs_a_large_enough_list(monkeypatch, min_size, expected):
+    monkeypatch.setattr(evaluation_service, "FAMILIAR_WORDS_MIN_SIZE", min_size)
+    # Teks berbeda per kasus: skor dan rekomendasi di-cache per teks
+    text = f"Xylofon kuarsa zirkonium. Fotosintesis heterotrof {min_size}."
+    result = asyncio.run(EvaluationService().evaluate_text(text, ["dale_chall", "flesch_kincaid"]))
+    assert (VOCABULARY_TIP in result["recommendations"]) is expected
+
+
+def test_word_list_reader_skips_comments(tmp_path):
+    source = tmp_path / "words.txt"
+    source.write_text("# Rumah\nRumah  air\n\nbuku air\n", encoding="utf-8")
+    assert read_word_list(source) == ["air", "buku", "rumah"]
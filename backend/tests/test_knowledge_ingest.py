@@ -0,0 +1,117 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from app.services.tutor_service import SEED_KNOWLEDGE, TutorService
+from app.utils.knowledge_ingest import (
+    PHASE_DONE,
+    PHASE_FAILED,
+    IngestionBusyError,
+    IngestionJob,
+    iter_jsonl,
+    load_snapshot
+)
+from app.utils.knowledge_store import KnowledgeStore
+
+# Batas waktu satu ingestion di thread latar belakang
+INGEST_TIMEOUT = 30
+
+LINES = [
+    json.dumps({"concept": "Inflasi", "definition": "Inflasi adalah kenaikan harga barang secara umum"}),
+    "",
+    "{bukan json",
+    json.dumps(["bukan", "objek"]),
+    json.dumps({"definition": "Tanpa nama konsep"}),
+    json.dumps({"concept": "pajak", "definition": "Iuran wajib", "examples": "bukan list"}),
+    json.dumps({"concept": "Subsidi", "definition": "Subsidi versi baru dari glosarium"})
+]
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "glosarium.jsonl"
+    path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def tutor(tmp_path):
+    return TutorService(str(tmp_path / "knowledge.db"))
+
+
+def wait_for(service, job):
+    deadline = time.monotonic() + INGEST_TIMEOUT
+    while service.get_ingestion_job(job.job_id).running:
+        assert time.monotonic() < deadline, "ingestion did not finish"
+        time.sleep(0.01)
+    return service.get_ingestion_job(job.job_id)
+
+
+def test_invalid_lines_are_skipped_and_reported(source):
+    job = IngestionJob(source, source.stat().st_size)
+    rows = list(iter_jsonl(source, job))
+
+    assert [row[0] for row in rows] == ["inflasi", "subsidi"]
+    assert job.accepted == 2 and job.rejected == 4
+    assert job.lines_read == len(LINES)
+    assert job.bytes_read == source.stat().st_size
+    assert [error.split(":")[0] for error in job.errors] == ["line 3", "line 4", "line 5", "line 6"]
+    assert "must be a list of strings" in job.errors[-1]
+
+
+def test_load_snapshot_leaves_the_target_untouched(tmp_path, source, tutor):
+    target = tutor.knowledge_base.path
+    job = IngestionJob(source)
+    temp_path = load_snapshot(source, target, job)
+
+    assert temp_path != target and job.concepts == 2
+    assert set(KnowledgeStore(temp_path).keys()) == {"inflasi", "subsidi"}
+    assert set(KnowledgeStore(target).keys()) == set(SEED_KNOWLEDGE)
+
+
+def test_merge_keeps_existing_concepts(source, tutor):
+    job = IngestionJob(source, merge=True)
+    staged = KnowledgeStore(load_snapshot(source, tutor.knowledge_base.path, job, tutor.knowledge_base))
+
+    assert job.concepts == len(SEED_KNOWLEDGE) + 1
+    assert set(staged.keys()) == set(SEED_KNOWLEDGE) | {"inflasi"}
+    assert staged["subsidi"]["definition"] == "Subsidi versi baru dari glosarium"
+    assert staged["asuransi"] == SEED_KNOWLEDGE["asuransi"]
+
+
+def test_ingestion_swaps_snapshot_and_indexes(source, tutor):
+    asyncio.run(tutor.answer_question("Apa itu subsidi?"))
+    job = tutor.start_ingestion(str(source), source.stat().st_size, name="glosarium.jsonl", remove_source=True)
+    job = wait_for(tutor, job)
+
+    stats = job.to_dict()
+    assert stats["phase"] == PHASE_DONE and stats["error"] is None
+    assert stats["source"] == "glosarium.jsonl"
+    assert stats["concepts"] == 2 and stats["rejected"] == 4
+    assert stats["progress"] == 1.0
+    assert not source.exists()
+
+    assert set(tutor.get_available_concepts()) == {"inflasi", "subsidi"}
+    assert tutor._index_snapshot == tutor.knowledge_base.snapshot_version
+    assert tutor.search_concepts("kenaikan harga barang")[0]["concept"] == "inflasi"
+    # Jawaban yang di-cache dari snapshot lama tidak dipakai lagi
+    response = asyncio.run(tutor.answer_question("Apa itu subsidi?"))
+    assert "Subsidi versi baru dari glosarium" in response["answer"]
+
+
+def test_only_one_ingestion_runs_at_a_time(source, tutor):
+    running = IngestionJob(source)
+    running.start()
+    tutor.ingestion_jobs[running.job_id] = running
+    with pytest.raises(IngestionBusyError):
+        tutor.start_ingestion(str(source))
+
+
+def test_failed_ingestion_keeps_the_old_snapshot(tmp_path, tutor):
+    job = wait_for(tutor, tutor.start_ingestion(str(tmp_path / "tidak-ada.jsonl")))
+
+    assert job.phase == PHASE_FAILED and job.error
+    assert set(tutor.get_available_concepts()) == set(SEED_KNOWLEDGE)
+    assert not list(tmp_path.glob("*.tmp"))
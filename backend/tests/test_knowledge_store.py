@@ -0,0 +1,75 @@
+import sqlite3
+
+import pytest
+
+from app.utils.knowledge_store import KnowledgeStore, build_snapshot, normalize_knowledge
+
+SUBSIDI = {
+    "definition": "Subsidi adalah bantuan uang dari pemerintah",
+    "simple_explanation": "Seperti diskon dari pemerintah",
+    "examples": ["Subsidi listrik"],
+    "related_concepts": ["bantuan"]
+}
+PAJAK = {"definition": "Pajak adalah iuran wajib kepada negara"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "knowledge.db"
+    build_snapshot([("Subsidi", SUBSIDI)], path)
+    return KnowledgeStore(path, reload_interval=0)
+
+
+def test_lookup_like_a_dict(store):
+    assert "subsidi" in store and "pajak" not in store
+    assert len(store) == 1
+    assert list(store.keys()) == ["subsidi"]
+    assert store["subsidi"] == SUBSIDI
+    assert store.get("pajak") is None
+    with pytest.raises(KeyError):
+        store["pajak"]
+
+
+def test_reader_is_read_only(store):
+    with pytest.raises(sqlite3.OperationalError):
+        store._connection().execute("DELETE FROM concepts")
+
+
+def test_put_is_seen_through_the_reader(store):
+    version = store.data_version()
+    store.put("Pajak", PAJAK)
+    assert store.data_version() != version
+    assert store.get("pajak")["definition"] == PAJAK["definition"]
+    changes = store.changes_since(0)
+    assert [(revision, concept) for revision, concept, _ in changes] == [(1, "pajak")]
+
+
+def test_snapshot_swap_keeps_old_connection_usable(store):
+    old_connection = store._connection()
+    build_snapshot([("pajak", PAJAK)], store.path)
+    store.reload()
+
+    assert store.snapshot_version == 2
+    assert list(store.keys()) == ["pajak"]
+    # Request yang masih memegang koneksi lama tetap membaca snapshot lama
+    assert old_connection.execute("SELECT concept FROM concepts").fetchall() == [("subsidi",)]
+
+
+def test_full_text_search(store):
+    store.put("pajak", PAJAK)
+    assert [concept for concept, _ in store.search("iuran negara")] == ["pajak"]
+    results = store.search("bantuan pemerintah diskon")
+    assert results[0][0] == "subsidi" and results[0][1] > 0
+    assert store.search("!!!") == []
+
+
+@pytest.mark.parametrize("concept, knowledge", [
+    ("", SUBSIDI),
+    ("x", "bukan objek"),
+    ("x", {"definition": 1}),
+    ("x", {"definition": "d", "examples": "bukan list"}),
+    ("x", {"examples": []}),
+])
+def test_invalid_entries_are_rejected(concept, knowledge):
+    with pytest.raises(ValueError):
+        normalize_knowledge(concept, knowledge)
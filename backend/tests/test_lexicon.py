@@ -0,0 +1,35 @@
+import pytest
+
+from app.services.text_simplification_service import TextSimplificationService
+from app.utils.lexicon import LEXICON_DIR, LexiconSubstitutor
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    return LexiconSubstitutor.from_file(LEXICON_DIR / "simplification_id.tsv")
+
+
+@pytest.mark.parametrize("source", [
+    LexiconSubstitutor.from_file(LEXICON_DIR / "simplification_id.tsv"),
+    LexiconSubstitutor(TextSimplificationService.DEFAULT_WORD_REPLACEMENTS)
+])
+def test_adjacent_entries_do_not_chain(source):
+    assert source.substitute("Peraturan ini berlaku mulai triwulan kedua.") == (
+        "Aturan ini mulai digunakan sejak 3 bulan kedua."
+    )
+
+
+def test_replaced_text_is_not_rescanned():
+    lexicon = LexiconSubstitutor({"a": "b", "b": "c"})
+    assert lexicon.substitute("a b") == "b c"
+
+
+def test_whole_words_only(lexicon):
+    assert lexicon.substitute("memulai pengaturan") == "memulai pengaturan"
+    assert lexicon.substitute("Subsidi, subsidi-subsidi") == "Bantuan biaya, subsidi-subsidi"
+
+
+def test_longest_phrase_and_case(lexicon):
+    text, count = lexicon.substitute_with_count("DALAM RANGKA itu, dalam rangka ini")
+    assert text == "UNTUK itu, untuk ini"
+    assert count == 2
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.inference_backend import InferenceBackend, MicroBatcher
+from app.utils.executors import get_cpu_pool_stats
+
+
+class StubBackend(InferenceBackend):
+    """Backend palsu: mencatat ukuran setiap batch dan mengembalikan teks dalam huruf besar"""
+
+    name = "stub"
+    batched = True
+
+    def __init__(self, delay: float = 0.0, error: Exception = None, drop_output: bool = False):
+        self.delay = delay
+        self.error = error
+        self.drop_output = drop_output
+        self.batch_sizes = []
+        self._lock = threading.Lock()
+
+    def generate_batch(self, prompts, texts):
+        with self._lock:
+            self.batch_sizes.append(len(prompts))
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        outputs = [text.upper() for text in texts]
+        return outputs[:-1] if self.drop_output else outputs
+
+
+async def submit_all(batcher, texts):
+    return await asyncio.gather(*(batcher.submit(f"prompt {text}", text) for text in texts))
+
+
+def test_batches_are_bounded_by_max_batch_size():
+    backend = StubBackend()
+    batcher = MicroBatcher(backend, max_batch_size=8, max_wait_ms=1_000)
+    texts = [f"kalimat {i}" for i in range(20)]
+
+    start = time.perf_counter()
+    outputs = asyncio.run(submit_all(batcher, texts))
+    elapsed = time.perf_counter() - start
+
+    # Hasil kembali ke pemanggil yang benar
+    assert outputs == [text.upper() for text in texts]
+    assert max(backend.batch_sizes) <= 8
+    assert sum(backend.batch_sizes) == 20
+    assert backend.batch_sizes[:2] == [8, 8]
+    stats = batcher.get_stats()
+    assert stats["total_items"] == 20
+    assert stats["total_batches"] == len(backend.batch_sizes)
+    # Batch penuh dikirim tanpa menunggu max_wait; hanya sisa terakhir yang menunggu
+    assert elapsed < 2.0
+
+
+def test_full_batch_does_not_wait():
+    backend = StubBackend()
+    batcher = MicroBatcher(backend, max_batch_size=4, max_wait_ms=5_000)
+
+    start = time.perf_counter()
+    asyncio.run(submit_all(batcher, ["a", "b", "c", "d"]))
+    assert time.perf_counter() - start < 1.0
+    assert backend.batch_sizes == [4]
+
+
+def test_partial_batch_waits_at_most_max_wait():
+    backend = StubBackend()
+    batcher = MicroBatcher(backend, max_batch_size=8, max_wait_ms=100)
+
+    start = time.perf_counter()
+    assert asyncio.run(submit_all(batcher, ["a"])) == ["A"]
+    elapsed = time.perf_counter() - start
+
+    assert backend.batch_sizes == [1]
+    assert 0.09 <= elapsed < 1.0
+
+
+def test_requests_arriving_after_the_window_form_a_new_batch():
+    backend = StubBackend()
+    batcher = MicroBatcher(backend, max_batch_size=8, max_wait_ms=20)
+
+    async def staggered():
+        first = asyncio.ensure_future(submit_all(batcher, ["a", "b"]))
+        await asyncio.sleep(0.2)
+        second = await submit_all(batcher, ["c"])
+        return await first, second
+
+    assert asyncio.run(staggered()) == (["A", "B"], ["C"])
+    assert backend.batch_sizes == [2, 1]
+
+
+def test_backend_error_reaches_every_caller_in_the_batch():
+    error = RuntimeError("model gagal")
+    backend = StubBackend(error=error)
+    batcher = MicroBatcher(backend, max_batch_size=4, max_wait_ms=50)
+
+    async def run():
+        failed = await asyncio.gather(
+            *(batcher.submit("p", text) for text in ["a", "b", "c"]),
+            return_exceptions=True
+        )
+        # Worker yang sama tetap melayani batch berikutnya setelah batch gagal
+        backend.error = None
+        return failed, await batcher.submit("p", "d")
+
+    failed, recovered = asyncio.run(run())
+    assert all(result is error for result in failed)
+    assert recovered == "D"
+    assert backend.batch_sizes == [3, 1]
+
+
+def test_wrong_output_count_is_an_error():
+    batcher = MicroBatcher(StubBackend(drop_output=True), max_batch_size=2, max_wait_ms=50)
+    with pytest.raises(RuntimeError, match="outputs"):
+        asyncio.run(submit_all(batcher, ["a", "b"]))
+
+
+def test_batches_run_on_the_shared_cpu_pool():
+    backend = StubBackend()
+    batcher = MicroBatcher(backend, max_batch_size=4, max_wait_ms=10)
+    before = get_cpu_pool_stats()["completed"]
+
+    asyncio.run(submit_all(batcher, ["a", "b", "c", "d", "e"]))
+
+    # Dua batch (4 + 1) lewat run_cpu_bound, bukan default executor event loop
+    stats = get_cpu_pool_stats()
+    assert stats["completed"] - before == len(backend.batch_sizes) == 2
+    assert stats["in_flight"] == 0
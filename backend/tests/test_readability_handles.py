@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.evaluation_service import EvaluationService
+from app.services.text_simplification_service import TextSimplificationService
+from app.utils.readability_cache import text_handle
+from app.utils.text_stats import COUNT_FIELDS, compute_text_stats
+from main import app
+
+TEXT = "Peraturan ini berlaku mulai tahun depan. Warga wajib mendaftarkan usaha. Pajak dibayar setiap bulan."
+
+
+def counts(stats):
+    return [getattr(stats, name) for name in COUNT_FIELDS]
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def test_handle_stats_match_the_simplified_text():
+    service = TextSimplificationService()
+    result = asyncio.run(service.simplify_text(TEXT, max_length=5000))
+    handle = result["readability_handle"]
+
+    # Statistik dari jumlah per kalimat sama dengan menghitung ulang teks hasilnya
+    assert handle == text_handle(result["simplified_text"])
+    stats = service.readability_cache.get_text_stats(handle)
+    assert counts(stats) == counts(compute_text_stats(result["simplified_text"]))
+
+
+def test_handle_evaluates_like_the_text(client):
+    simplified = client.post("/api/simplify/text", json={"text": TEXT, "max_length": 5000}).json()
+    by_handle = client.post("/api/evaluate/readability", json={"handle": simplified["readability_handle"]})
+    by_text = client.post("/api/evaluate/readability", json={"text": simplified["simplified_text"]})
+    assert by_handle.status_code == by_text.status_code == 200
+    assert by_handle.json()["metrics"] == by_text.json()["metrics"]
+    assert by_handle.json()["text"] == simplified["simplified_text"]
+
+
+def test_result_cache_hit_re_registers_an_evicted_handle():
+    service = TextSimplificationService()
+    first = asyncio.run(service.simplify_text(TEXT))
+    handle = first["readability_handle"]
+
+    # Cache readability dikosongkan, hasil simplify tetap di result cache
+    service.readability_cache.cache.clear()
+    assert EvaluationService().evaluate_handle(handle) is None
+
+    second = asyncio.run(service.simplify_text(TEXT))
+    assert second["sentences_recomputed"] == 0
+    assert second["readability_handle"] == handle
+    assert service.readability_cache.get_text(handle) == first["simplified_text"]
+    assert EvaluationService().evaluate_handle(handle) is not None
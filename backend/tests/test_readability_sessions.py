@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from app.services.evaluation_service import DEFAULT_METRICS, EvaluationService
+from app.services.readability_session_service import (
+    ReadabilitySession,
+    ReadabilitySessionService,
+    segment_text
+)
+from app.utils.text_stats import COUNT_FIELDS, compute_text_stats
+
+INSERTIONS = ["", "a", " ", ". ", "kata baru", "Kalimat baru! ", "?", "\n", "selambat-lambatnya."]
+
+
+def counts(stats):
+    return [getattr(stats, name) for name in COUNT_FIELDS]
+
+
+def random_edit(rng, length):
+    offset = rng.randint(0, length)
+    delete_count = rng.randint(0, min(length - offset, 30))
+    return offset, delete_count, rng.choice(INSERTIONS)
+
+
+def test_segments_cover_text(texts):
+    for text in texts:
+        assert "".join(segment for segment, _ in segment_text(text)) == text
+
+
+def test_edit_deltas_match_full_recompute(texts, rng):
+    for text in texts[:-1]:
+        session = ReadabilitySession("s", DEFAULT_METRICS, segment_text(text))
+        expected_text = text
+        for _ in range(60):
+            offset, delete_count, insert_text = random_edit(rng, len(expected_text))
+            session.apply_edit(offset, delete_count, insert_text)
+            expected_text = expected_text[:offset] + insert_text + expected_text[offset + delete_count:]
+
+            assert session.text == expected_text
+            assert session.length == len(expected_text)
+            assert counts(session.stats()) == counts(compute_text_stats(expected_text))
+
+
+def test_delete_everything_and_retype(texts):
+    text = texts[-2]
+    session = ReadabilitySession("s", DEFAULT_METRICS, segment_text(text))
+    session.apply_edit(0, len(text), "")
+    assert counts(session.stats()) == counts(compute_text_stats(""))
+    session.apply_edit(0, 0, "Mulai lagi. Dari awal")
+    assert counts(session.stats()) == counts(compute_text_stats("Mulai lagi. Dari awal"))
+
+
+def test_invalid_batch_is_not_applied():
+    service = ReadabilitySessionService(EvaluationService(), ttl_seconds=60, max_bytes=1 << 20)
+    created = asyncio.run(service.create_session("Satu dua. Tiga empat."))
+    session_id = created["session_id"]
+    memory = service.get_stats()["memory_bytes"]
+
+    with pytest.raises(ValueError):
+        service.apply_edits(session_id, [
+            {"offset": 0, "delete_count": 0, "insert_text": "Nol. "},
+            {"offset": 500, "delete_count": 1, "insert_text": ""}
+        ])
+
+    result = service.get_session(session_id, include_text=True)
+    assert result["version"] == 0
+    assert result["text"] == "Satu dua. Tiga empat."
+    assert service.get_stats()["memory_bytes"] == memory
+
+    service.close_session(session_id)
+    assert service.get_stats()["memory_bytes"] == 0
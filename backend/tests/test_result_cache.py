@@ -0,0 +1,68 @@
+import asyncio
+import sqlite3
+
+from app.services.text_simplification_service import TextSimplificationService
+from app.utils import result_cache
+from app.utils.result_cache import ResultCache
+
+
+def disk_rows(path, table="result_cache"):
+    with sqlite3.connect(path) as db:
+        return db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_memory_tier_is_lru_bounded():
+    cache = ResultCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_disk_tier_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_cache, "DISK_PURGE_EVERY", 10)
+    path = str(tmp_path / "cache.db")
+    cache = ResultCache(max_entries=4, db_path=path, max_disk_entries=20)
+
+    for i in range(200):
+        cache.set(f"k{i}", {"value": i})
+
+    # Baris di atas batas hanya menunggu sampai purge berikutnya
+    assert disk_rows(path) <= 20 + 10
+    # Entri terbaru tetap ada di disk setelah restart
+    reopened = ResultCache(max_entries=4, db_path=path, max_disk_entries=20)
+    assert disk_rows(path) <= 20
+    assert reopened.get("k199") == {"value": 199}
+    assert reopened.get("k0") is None
+
+
+def test_expired_rows_are_purged_without_lookup(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_cache, "DISK_PURGE_EVERY", 5)
+    path = str(tmp_path / "cache.db")
+    expired = ResultCache(ttl_seconds=-1, db_path=path)
+    for i in range(4):
+        expired.set(f"old{i}", i)
+    assert disk_rows(path) == 4
+
+    # Penulisan berikutnya memicu purge; baris lama tidak pernah dibaca lagi
+    cache = ResultCache(ttl_seconds=3600, db_path=path)
+    assert disk_rows(path) == 0
+    for i in range(5):
+        cache.set(f"new{i}", i)
+    assert disk_rows(path) == 5
+    assert cache.get_stats()["expirations"] == 4
+
+
+def test_simplify_result_cache_hit():
+    service = TextSimplificationService()
+    text = "Peraturan ini berlaku mulai tahun depan. Semua warga wajib mematuhinya."
+
+    first = asyncio.run(service.simplify_text(text))
+    second = asyncio.run(service.simplify_text(text))
+
+    assert second["simplified_text"] == first["simplified_text"]
+    assert second["sentences_recomputed"] == 0
+    assert service.get_cache_stats()["hits"] == 1
@@ -0,0 +1,37 @@
+import asyncio
+
+from app.services.text_simplification_service import TextSimplificationService
+
+
+def make_document(count):
+    return " ".join(f"Kalimat nomor {i} menjelaskan peraturan yang berlaku mulai tahun ini." for i in range(count))
+
+
+def test_one_sentence_edit_recomputes_one_sentence():
+    service = TextSimplificationService()
+    text = make_document(200)
+
+    first = asyncio.run(service.simplify_text(text, max_length=100_000))
+    assert first["sentence_count"] == 200
+    assert first["sentences_recomputed"] == 200
+    assert first["sentences_reused"] == 0
+
+    edited = text.replace("Kalimat nomor 57 ", "Kalimat nomor lima puluh tujuh ", 1)
+    second = asyncio.run(service.simplify_text(edited, max_length=100_000))
+    assert second["sentences_recomputed"] == 1
+    assert second["sentences_reused"] == 199
+
+    # Hasil inkremental sama dengan memproses dokumen yang diedit dari awal
+    fresh = asyncio.run(TextSimplificationService().simplify_text(edited, max_length=100_000))
+    for field in ("simplified_text", "readability_score", "word_count_reduction", "sentence_count"):
+        assert second[field] == fresh[field], field
+
+
+def test_repeated_document_reuses_every_sentence():
+    service = TextSimplificationService()
+    text = make_document(5)
+    asyncio.run(service.simplify_text(text))
+    # Variasi spasi memakai cache hasil; semua kalimat dilaporkan dipakai ulang
+    again = asyncio.run(service.simplify_text(text.replace(" ", "  ")))
+    assert again["sentences_reused"] == 5
+    assert again["sentences_recomputed"] == 0
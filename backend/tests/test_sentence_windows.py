@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.evaluation_service import EvaluationService
+from main import app
+
+TEXT = "Satu dua tiga. Empat lima. Enam tujuh delapan sembilan. Sepuluh."
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def evaluate(client, **body):
+    return client.post("/api/evaluate/readability", json={"text": TEXT, **body})
+
+
+def test_windows_are_scored(client):
+    response = evaluate(client, windows=[[0, 1], [1, 3], [0, 4]])
+    assert response.status_code == 200
+    body = response.json()
+    assert [(w["first"], w["last"]) for w in body["windows"]] == [(0, 1), (1, 3), (0, 4)]
+    assert [w["word_count"] for w in body["windows"]] == [3, 6, 10]
+    assert body["windows"][2]["start"] == 0 and body["windows"][2]["end"] == len(TEXT)
+
+
+@pytest.mark.parametrize("windows", [
+    [[0, 1, 2, 3]],     # Dua jendela dalam satu entri
+    [[0]],
+    [[]],
+    [[0, 1], [2]],
+    [[2, 1]],
+    [[1, 1]],
+    [[-1, 2]],
+    [[0, "a"]],
+    [[0.5, 2]],
+])
+def test_malformed_windows_are_rejected(client, windows):
+    assert evaluate(client, windows=windows).status_code == 422
+
+
+def test_window_past_the_last_sentence(client):
+    response = evaluate(client, windows=[[0, 5]])
+    assert response.status_code == 400
+    assert "last <= 4" in response.json()["detail"]
+
+
+def test_service_rejects_flat_windows():
+    with pytest.raises(ValueError):
+        asyncio.run(EvaluationService().evaluate_sentences(TEXT, windows=[[0, 1, 2, 3]]))
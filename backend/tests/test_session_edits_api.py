@@ -0,0 +1,68 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.evaluation_service import EvaluationService
+from app.services.readability_session_service import ReadabilitySessionService
+from main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def test_edits_run_in_the_session_lane(client):
+    # Satu kalimat panjang tanpa tanda akhir: setiap edit menganalisis ulang seluruhnya
+    text = "kata " * 20_000
+    created = client.post("/api/evaluate/sessions", json={"text": text}).json()
+    session_id = created["session_id"]
+    before = client.get("/executors/stats").json()
+
+    for version in range(3):
+        response = client.post(f"/api/evaluate/sessions/{session_id}/edits", json={
+            "edits": [{"offset": len(text), "delete_count": 0, "insert_text": "baru "}],
+            "base_version": version
+        })
+        assert response.status_code == 200
+        text += "baru "
+        assert response.json()["word_count"] == 20_001 + version
+
+    after = client.get("/executors/stats").json()
+    assert after["evaluate_sessions"]["completed"] - before.get("evaluate_sessions", {}).get("completed", 0) == 3
+    assert after["cpu_pool"]["completed"] > before["cpu_pool"]["completed"]
+
+    session = client.get(f"/api/evaluate/sessions/{session_id}", params={"include_text": True}).json()
+    assert session["text"] == text
+    assert client.delete(f"/api/evaluate/sessions/{session_id}").status_code == 200
+
+
+def test_edit_in_progress_does_not_block_other_sessions():
+    service = ReadabilitySessionService(EvaluationService(), ttl_seconds=60, max_bytes=1 << 20)
+    busy = asyncio.run(service.create_session("Satu dua. Tiga empat."))["session_id"]
+    other = asyncio.run(service.create_session("Lima enam."))["session_id"]
+
+    # Lock sesi `busy` dipegang seperti saat edit besar sedang berjalan
+    with service._sessions[busy].lock:
+        done = threading.Event()
+
+        def edit_other():
+            service.apply_edits(other, [{"offset": 0, "delete_count": 0, "insert_text": "Nol. "}])
+            done.set()
+
+        threading.Thread(target=edit_other, daemon=True).start()
+        assert done.wait(5)
+        assert service.get_stats()["sessions"] == 2
+
+    assert service.get_session(other, include_text=True)["text"] == "Nol. Lima enam."
+
+
+def test_memory_accounting_after_edit_and_close():
+    service = ReadabilitySessionService(EvaluationService(), ttl_seconds=60, max_bytes=1 << 20)
+    first = asyncio.run(service.create_session("Satu dua. Tiga empat."))["session_id"]
+    service.apply_edits(first, [{"offset": 0, "delete_count": 0, "insert_text": "Kalimat baru. " * 10}])
+    service.close_session(first)
+    assert service.get_stats()["memory_bytes"] == 0
@@ -0,0 +1,65 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.text_simplification_service import TextSimplificationService
+from benchmarks.corpus import generate_corpus
+from main import app
+
+
+def parse_events(body):
+    """Pasangan (nama event, data) dari respons Server-Sent Events"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def collect(service, text, max_length):
+    return [event async for event in service.simplify_text_stream(text, max_length=max_length)]
+
+
+@pytest.fixture(scope="module")
+def service():
+    return TextSimplificationService()
+
+
+def test_stream_endpoint_sends_sentences_then_done():
+    text = "Pemerintah mengeluarkan peraturan mengenai subsidi. Masyarakat wajib melaksanakan ketentuan tersebut!"
+    with TestClient(app) as client:
+        response = client.post("/api/simplify/text/stream", json={"text": text})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = parse_events(response.text)
+    names = [name for name, _ in events]
+    assert names == ["sentence", "sentence", "done"]
+    assert [data["index"] for _, data in events[:-1]] == [0, 1]
+    assert events[0][1]["time_to_first_sentence"] == events[-1][1]["time_to_first_sentence"]
+    assert events[-1][1]["sentence_count"] == 2
+
+
+def test_running_word_count_reduction(service):
+    text = "Peraturan mengenai subsidi berlaku mulai triwulan kedua. Subsidi diberikan kepada warga."
+    events = asyncio.run(collect(service, text, 500))
+    sentences = [event for event in events if event["event"] == "sentence"]
+
+    original = sum(len(event["original_sentence"].split()) for event in sentences)
+    simplified = sum(len(event["simplified_sentence"].split()) for event in sentences)
+    assert sentences[-1]["word_count_reduction"] == original - simplified
+
+
+@pytest.mark.parametrize("max_length", [60, 300, 5_000])
+def test_done_event_matches_simplify_text(service, max_length):
+    text = generate_corpus(2_000, seed=max_length)
+    events = asyncio.run(collect(service, text, max_length))
+    done = events[-1]
+    expected = asyncio.run(service.simplify_text(text, max_length=max_length))
+
+    assert done["event"] == "done"
+    assert done["simplified_text"] == expected["simplified_text"]
+    assert done["readability_score"] == expected["readability_score"]
+    assert done["word_count_reduction"] == expected["word_count_reduction"]
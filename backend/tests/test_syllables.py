@@ -0,0 +1,31 @@
+import pytest
+
+from app.utils.syllables import count_syllables
+from benchmarks.bench_syllables import GOLD
+
+CASES = [
+    # Diftong di akhir kata atau sebelum onset suku kata berikutnya
+    ("pantai", 2), ("kerbau", 2), ("saudara", 3), ("boikot", 2), ("aula", 2),
+    # Diftong langsung diikuti sufiks -an
+    ("pakaian", 3), ("santaian", 3),
+    # au sebelum konsonan + -an tetap diftong
+    ("bauran", 2), ("lautan", 2),
+    # ai dipisah sebelum akhir kata dasar + -an atau konsonan akhir
+    ("main", 2), ("mainan", 3), ("permainan", 4), ("mainkan", 3), ("baik", 2),
+    # Vokal berurutan yang bukan diftong
+    ("laut", 2), ("daun", 2), ("kaum", 2),
+    # Digraf dan gugus konsonan
+    ("nyanyi", 2), ("masyarakat", 4), ("strategi", 3), ("khusus", 2),
+    # Huruf besar dan kata tanpa vokal
+    ("PAKAIAN", 3), ("hmm", 1),
+]
+
+
+@pytest.mark.parametrize("word, expected", CASES)
+def test_count_syllables(word, expected):
+    assert count_syllables(word) == expected
+
+
+@pytest.mark.parametrize("word, expected", sorted(GOLD.items()))
+def test_benchmark_gold_list(word, expected):
+    assert count_syllables(word) == expected
@@ -0,0 +1,75 @@
+from app.utils.text_stats import (
+    COUNT_FIELDS,
+    MAX_CARRY_LENGTH,
+    TextStatsAccumulator,
+    analyze_text,
+    compute_text_stats,
+    merge_text_stats
+)
+
+
+def counts(stats):
+    return [getattr(stats, name) for name in COUNT_FIELDS]
+
+
+def feed_in_chunks(accumulator, text, rng, max_chunk):
+    position = 0
+    while position < len(text):
+        size = rng.randint(1, max_chunk)
+        accumulator.feed(text[position:position + size])
+        position += size
+    return accumulator.finish()
+
+
+def test_analyze_text_shares_the_stats_pass(texts):
+    for text in texts:
+        document = analyze_text(text)
+        assert counts(document) == counts(compute_text_stats(text))
+        assert document.tokens == text.split()
+        assert sum(document.sentence_word_counts()) == document.word_count
+        assert len(document.sentences) == document.sentence_count
+
+
+def test_accumulator_chunk_boundaries(texts, rng):
+    # Potongan kecil memotong token, spasi, dan tanda akhir di sembarang posisi
+    for text in texts:
+        expected = counts(compute_text_stats(text))
+        for max_chunk in (1, 3, 17, 1000):
+            stats = feed_in_chunks(TextStatsAccumulator(), text, rng, max_chunk)
+            assert counts(stats) == expected, (text[:40], max_chunk)
+
+
+def test_accumulator_sections_do_not_depend_on_chunking(texts, rng):
+    text = texts[-1]
+    reference = TextStatsAccumulator(section_size=1_000)
+    reference.feed(text)
+    total = reference.finish()
+    expected = [(start, end, counts(stats)) for start, end, stats in reference.sections]
+
+    assert len(expected) > 1
+    assert expected[-1][1] == len(text)
+    assert counts(merge_text_stats([stats for _, _, stats in reference.sections])) == counts(total)
+
+    for max_chunk in (7, 500, 5_000):
+        accumulator = TextStatsAccumulator(section_size=1_000)
+        feed_in_chunks(accumulator, text, rng, max_chunk)
+        assert [(start, end, counts(stats)) for start, end, stats in accumulator.sections] == expected
+
+
+def test_token_longer_than_carry_limit_is_split():
+    # Perilaku yang didokumentasikan: token raksasa tidak ditahan utuh antar chunk
+    text = "Awal kalimat. " + "a" * (MAX_CARRY_LENGTH + 10_000) + " akhir."
+    accumulator = TextStatsAccumulator()
+    for start in range(0, len(text), 4096):
+        accumulator.feed(text[start:start + 4096])
+    stats = accumulator.finish()
+
+    serial = compute_text_stats(text)
+    assert stats.char_count == serial.char_count
+    assert stats.sentence_count == serial.sentence_count
+    assert stats.word_count == serial.word_count + 1
+
+    # Satu chunk yang memuat token utuh tetap sama dengan compute_text_stats
+    whole = TextStatsAccumulator()
+    whole.feed(text)
+    assert counts(whole.finish()) == counts(serial)
@@ -0,0 +1,25 @@
+from app.utils.text_stats import COUNT_FIELDS, compute_text_stats, merge_text_stats, split_at_sentences
+
+
+def counts(stats):
+    return [getattr(stats, name) for name in COUNT_FIELDS]
+
+
+def test_merge_matches_serial(texts):
+    for text in texts:
+        serial = counts(compute_text_stats(text))
+        for parts in (1, 2, 3, 7, 50):
+            bounds = split_at_sentences(text, parts)
+            assert "".join(text[start:end] for start, end in bounds) == text
+            merged = merge_text_stats([compute_text_stats(text[start:end]) for start, end in bounds])
+            assert counts(merged) == serial, (text[:40], parts)
+
+
+def test_merge_is_order_independent(texts):
+    text = texts[-1]
+    parts = [compute_text_stats(text[start:end]) for start, end in split_at_sentences(text, 8)]
+    assert counts(merge_text_stats(parts)) == counts(merge_text_stats(parts[::-1]))
+
+
+def test_merge_empty():
+    assert counts(merge_text_stats([])) == counts(compute_text_stats(""))
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.services.tutor_service import TutorService
+
+
+@pytest.fixture
+def tutor(tmp_path):
+    return TutorService(str(tmp_path / "knowledge.db"))
+
+
+def ask(service, question, user_level="beginner"):
+    return asyncio.run(service.answer_question(question, user_level=user_level))
+
+
+def test_reworded_questions_share_one_cache_entry(tutor):
+    first = ask(tutor, "Apa itu asuransi?")
+    for question in ("apa itu  ASURANSI", "Jelaskan asuransi ?", "pengertian asuransi!"):
+        assert ask(tutor, question) == first
+
+    stats = tutor.get_cache_stats()
+    assert stats["questions"]["misses"] == 1 and stats["questions"]["hits"] == 3
+    assert stats["answers"]["hits"] == 3
+    assert stats["questions"]["hit_rate"] == pytest.approx(0.75)
+
+
+def test_answer_cache_is_per_user_level(tutor):
+    beginner = ask(tutor, "Apa itu subsidi?")
+    advanced = ask(tutor, "Apa itu subsidi?", user_level="advanced")
+    assert beginner["answer"] != advanced["answer"]
+    assert beginner["confidence_score"] == advanced["confidence_score"]
+    assert tutor.get_cache_stats()["answers"]["size"] == 2
+
+
+def test_knowledge_is_read_off_the_event_loop(tutor, monkeypatch):
+    ask(tutor, "Apa itu investasi?")
+    # Pertanyaan sudah di-cache, jawaban untuk user_level ini belum
+    get = tutor.knowledge_base.get
+    threads = []
+
+    def tracked_get(concept, default=None):
+        threads.append(threading.current_thread())
+        return get(concept, default)
+
+    monkeypatch.setattr(tutor.knowledge_base, "get", tracked_get)
+    response = ask(tutor, "Apa itu investasi?", user_level="advanced")
+
+    assert response["answer"].startswith("Investasi adalah")
+    assert threads and threading.main_thread() not in threads
+
+
+def test_add_knowledge_invalidates_cached_answers(tutor):
+    ask(tutor, "Apa itu subsidi?")
+    tutor.add_knowledge("subsidi", {"definition": "Subsidi adalah definisi yang diperbarui"})
+
+    response = ask(tutor, "Apa itu subsidi?")
+    assert response["answer"].startswith("Subsidi adalah definisi yang diperbarui")
+    assert tutor.get_cache_stats()["questions"]["hits"] == 0
+
+
+def test_new_concept_replaces_cached_fallback(tutor):
+    assert ask(tutor, "Apa itu obligasi?")["confidence_score"] < 0.5
+    tutor.add_knowledge("obligasi", {"definition": "Obligasi adalah surat utang"})
+    assert ask(tutor, "Apa itu obligasi?")["answer"].startswith("Obligasi adalah surat utang")
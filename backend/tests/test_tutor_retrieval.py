@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from app.services.tutor_service import FULL_TEXT_CONFIDENCE, MATCH_CONFIDENCE, SEED_KNOWLEDGE, TutorService
+from app.utils.concept_index import MATCH_EXACT
+from app.utils.concept_ranker import ConceptRanker
+from app.utils.knowledge_store import build_snapshot
+
+INFLASI = {
+    "definition": "Inflasi adalah kenaikan harga barang secara umum dan terus menerus",
+    "simple_explanation": "Harga barang di pasar naik, uang yang sama bisa membeli lebih sedikit",
+    "examples": ["Harga beras naik setiap tahun"],
+    "related_concepts": ["harga", "daya beli"]
+}
+
+
+@pytest.fixture
+def tutor(tmp_path):
+    return TutorService(str(tmp_path / "knowledge.db"))
+
+
+def test_ranker_orders_concepts_by_bm25():
+    ranker = ConceptRanker(SEED_KNOWLEDGE.items())
+    results = ranker.search("bantuan dari pemerintah untuk harga listrik", top_k=3)
+
+    assert results[0][0] == "subsidi"
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+    assert 0 < scores[0] <= ranker.max_score("bantuan dari pemerintah untuk harga listrik")
+    assert ranker.search("qwerty zxcvb") == []
+
+
+def test_incremental_add_matches_full_build():
+    ranker = ConceptRanker(SEED_KNOWLEDGE.items())
+    ranker.add("inflasi", INFLASI)
+    assert ranker.get_stats()["delta_rows"] == 1
+
+    full = ConceptRanker(list(SEED_KNOWLEDGE.items()) + [("inflasi", INFLASI)])
+    query = "kenaikan harga barang di pasar"
+    assert ranker.search(query)[0][0] == "inflasi"
+    assert [concept for concept, _ in ranker.search(query)] == [concept for concept, _ in full.search(query)]
+
+    ranker.compact()
+    stats = ranker.get_stats()
+    assert stats["delta_rows"] == 0 and stats["documents"] == 4
+    for (concept, score), (expected, expected_score) in zip(ranker.search(query), full.search(query)):
+        assert concept == expected
+        assert score == pytest.approx(expected_score, rel=1e-5)
+
+
+def test_replaced_concept_is_ranked_by_its_new_text():
+    ranker = ConceptRanker(SEED_KNOWLEDGE.items())
+    ranker.add("subsidi", {"definition": "Subsidi adalah potongan ongkos kereta"})
+    assert all(concept != "subsidi" for concept, _ in ranker.search("bantuan listrik"))
+    assert ranker.search("ongkos kereta")[0][0] == "subsidi"
+
+    ranker.compact()
+    assert ranker.get_stats()["documents"] == 3
+    assert ranker.search("ongkos kereta")[0][0] == "subsidi"
+
+
+def test_search_concepts_reports_scores(tutor):
+    results = tutor.search_concepts("premi dan klaim polis", top_k=2)
+    assert results[0]["concept"] == "asuransi"
+    assert results[0]["definition"] == SEED_KNOWLEDGE["asuransi"]["definition"]
+    assert 0 < results[0]["confidence"] <= 1
+
+
+def test_new_snapshot_is_searched_with_fts_while_indexes_rebuild(tutor, monkeypatch):
+    # Pembangunan ulang indeks ditahan: indeks di memori masih milik snapshot lama
+    monkeypatch.setattr(tutor, "_start_rebuild", lambda: None)
+    build_snapshot(list(SEED_KNOWLEDGE.items()) + [("inflasi", INFLASI)], tutor.knowledge_base.path)
+    tutor.knowledge_base.reload()
+    tutor._sync_indexes()
+    assert "inflasi" not in tutor.concept_ranker.rows
+
+    concept, knowledge, confidence = tutor._find_relevant_knowledge(["kenaikan", "harga"], "kenaikan harga")
+    assert concept == "inflasi"
+    assert knowledge["definition"] == INFLASI["definition"]
+    assert confidence == FULL_TEXT_CONFIDENCE
+
+    concept, _, confidence = tutor._find_relevant_knowledge(["inflasi"], "apa itu inflasi")
+    assert concept == "inflasi"
+    assert confidence == MATCH_CONFIDENCE[MATCH_EXACT]
+
+    response = asyncio.run(tutor.answer_question("Apa itu inflasi?"))
+    assert INFLASI["definition"] in response["answer"]
+
+
+def test_fts_tier_is_skipped_once_indexes_are_current(tutor, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("FTS5 searched with current indexes")
+
+    monkeypatch.setattr(tutor.knowledge_base, "search", fail)
+    concept, _, _ = tutor._find_relevant_knowledge(["asuransi"], "apa itu asuransi")
+    assert concept == "asuransi"
@@ -0,0 +1,85 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.services.tutor_service import SEMANTIC_CONFIDENCE, TutorService
+from app.utils.embeddings import HashedNgramEmbedder
+from app.utils.vector_index import IVFIndex, brute_force_search
+from benchmarks.corpus import generate_corpus
+
+# Recall@10 minimal IVF terhadap pencarian eksak
+MIN_RECALL = 0.9
+
+
+@pytest.fixture(scope="module")
+def sentences():
+    corpus = generate_corpus(600_000, seed=7)
+    sentences = dict.fromkeys(sentence.strip() for sentence in corpus.split("."))
+    return [sentence for sentence in sentences if sentence][:5000]
+
+
+def test_embedding_is_deterministic_and_normalized():
+    embedder = HashedNgramEmbedder(dim=128)
+    vectors = embedder.embed_batch(["Subsidi listrik dari pemerintah", "", "subsidi LISTRIK dari pemerintah!"])
+
+    assert vectors.shape == (3, 128) and vectors.dtype == np.float32
+    assert np.linalg.norm(vectors[0]) == pytest.approx(1.0, abs=1e-6)
+    assert not vectors[1].any()
+    assert np.array_equal(vectors[0], vectors[2])
+    assert np.array_equal(vectors[0], HashedNgramEmbedder(dim=128).embed("Subsidi listrik dari pemerintah"))
+
+
+def test_affixed_words_stay_close():
+    embedder = HashedNgramEmbedder()
+    base = embedder.embed("pemerintah")
+    assert base @ embedder.embed("pemerintahan") > base @ embedder.embed("asuransi")
+
+
+def test_ivf_recall_matches_brute_force(sentences):
+    embedder = HashedNgramEmbedder()
+    vectors = embedder.embed_batch(sentences)
+    index = IVFIndex(embedder.dim, nprobe=8)
+    index.build(vectors, np.arange(len(vectors)), nlist=32)
+    assert index.nlist == 32 and len(index) == len(vectors)
+
+    queries = vectors[::250] + 0.01
+    hits = 0
+    for query in queries:
+        expected, _ = brute_force_search(vectors, query, 10)
+        found = [vector_id for vector_id, _ in index.search(query, k=10)]
+        hits += len(set(found) & set(expected.tolist()))
+    assert hits / (10 * len(queries)) >= MIN_RECALL
+
+    # Semua daftar diperiksa: hasil sama dengan pencarian eksak
+    rows, scores = brute_force_search(vectors, queries[0], 5)
+    results = index.search(queries[0], k=5, nprobe=index.nlist)
+    assert {vector_id for vector_id, _ in results} == set(rows.tolist())
+    assert [score for _, score in results] == pytest.approx(scores.tolist(), rel=1e-5)
+
+
+def test_added_and_removed_vectors(sentences):
+    embedder = HashedNgramEmbedder()
+    vectors = embedder.embed_batch(sentences[:100])
+    index = IVFIndex(embedder.dim)
+    index.build(vectors, np.arange(100))
+
+    added = embedder.embed("bantuan uang dari negara untuk tagihan listrik")
+    index.add(added, 100)
+    assert index.search(added, k=1)[0][0] == 100
+    assert index.get_stats()["pending"] == 1
+
+    index.remove(100)
+    index.remove(0)
+    assert len(index) == 99
+    assert all(vector_id not in (0, 100) for vector_id, _ in index.search(vectors[0], k=10))
+
+
+def test_paraphrased_question_is_answered_semantically(tmp_path):
+    service = TutorService(str(tmp_path / "knowledge.db"))
+    concept, knowledge, confidence = service._find_relevant_knowledge([], "uang bantuan dari negara")
+
+    assert concept == "subsidi"
+    assert 0 < confidence <= SEMANTIC_CONFIDENCE
+    response = asyncio.run(service.answer_question("uang bantuan dari negara"))
+    assert knowledge["definition"] in response["answer"]
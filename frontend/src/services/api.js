@@ -48,6 +48,50 @@ export const simplificationService = {
     }
   },
 
+  // Streaming per kalimat (Server-Sent Events); onSentence dipanggil untuk setiap kalimat
+  async simplifyTextStream(data, onSentence) {
+    try {
+      const response = await fetch(`${API_BASE_URL}/api/simplify/text/stream`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(data),
+      });
+      if (!response.ok) {
+        throw new Error(`Request failed with status ${response.status}`);
+      }
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      let summary = null;
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        const events = buffer.split('\n\n');
+        buffer = events.pop();
+        for (const rawEvent of events) {
+          const eventName = rawEvent.match(/^event: (.*)$/m)?.[1];
+          const payload = JSON.parse(rawEvent.match(/^data: (.*)$/m)?.[1] || '{}');
+          if (eventName === 'sentence') {
+            onSentence?.(payload);
+          } else if (eventName === 'done') {
+            summary = payload;
+          } else if (eventName === 'error') {
+            throw new Error(payload.detail);
+          }
+        }
+      }
+
+      return summary;
+    } catch (error) {
+      console.error('Error streaming simplified text:', error);
+      throw error;
+    }
+  },
+
   async createStepByStepGuide(data) {
     try {
       const response = await api.post('/api/simplify/steps', data);
@@ -92,6 +136,54 @@ export const evaluationService = {
       console.error('Error evaluating readability:', error);
       throw error;
     }
+  },
+
+  async evaluateReadabilityFile(file, metrics = [], sectionSize) {
+    try {
+      const formData = new FormData();
+      formData.append('file', file);
+      if (metrics.length) formData.append('metrics', metrics.join(','));
+      if (sectionSize !== undefined) formData.append('section_size', sectionSize);
+      const response = await api.post('/api/evaluate/readability/file', formData, {
+        headers: { 'Content-Type': 'multipart/form-data' },
+      });
+      return response.data;
+    } catch (error) {
+      console.error('Error evaluating readability file:', error);
+      throw error;
+    }
+  },
+
+  async createEvaluationSession(data) {
+    try {
+      const response = await api.post('/api/evaluate/sessions', data);
+      return response.data;
+    } catch (error) {
+      console.error('Error creating evaluation session:', error);
+      throw error;
+    }
+  },
+
+  // edits: [{ offset, delete_count, insert_text }] relatif terhadap dokumen versi baseVersion
+  async editEvaluationSession(sessionId, edits, baseVersion) {
+    try {
+      const response = await api.post(`/api/evaluate/sessions/${sessionId}/edits`, {
+        edits,
+        base_version: baseVersion,
+      });
+      return response.data;
+    } catch (error) {
+      console.error('Error updating evaluation session:', error);
+      throw error;
+    }
+  },
+
+  async closeEvaluationSession(sessionId) {
+    try {
+      await api.delete(`/api/evaluate/sessions/${sessionId}`);
+    } catch (error) {
+      console.error('Error closing evaluation session:', error);
+    }
   }
 };
 